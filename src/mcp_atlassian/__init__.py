@@ -1,39 +1,64 @@
-import asyncio
+import functools
 import logging
 import os
 import sys
-from importlib.metadata import PackageNotFoundError, version
 
 import click
-from dotenv import load_dotenv
 
-from mcp_atlassian.utils.env import is_env_truthy
-from mcp_atlassian.utils.lifecycle import (
-    ensure_clean_exit,
-    setup_signal_handlers,
-)
-from mcp_atlassian.utils.logging import setup_logging
 
-try:
-    __version__ = version("mcp-atlassian")
-except PackageNotFoundError:
-    # package is not installed
-    __version__ = "0.0.0"
+@functools.cache
+def _get_version() -> str:
+    """Resolve the installed package version (only touched by --version)."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("mcp-atlassian")
+    except PackageNotFoundError:
+        # package is not installed
+        return "0.0.0"
+
+
+def __getattr__(name: str) -> str:
+    if name == "__version__":
+        return _get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Initialize logging with appropriate level
-logging_level = logging.WARNING
-if is_env_truthy("MCP_VERBOSE"):
-    logging_level = logging.DEBUG
 
-# Set up logging to STDOUT if MCP_LOGGING_STDOUT is set to true
-logging_stream = sys.stdout if is_env_truthy("MCP_LOGGING_STDOUT") else sys.stderr
+def _print_version(ctx: click.Context, param: click.Parameter, value: bool) -> None:
+    if not value or ctx.resilient_parsing:
+        return
+    click.echo(f"mcp-atlassian, version {_get_version()}")
+    ctx.exit()
 
-# Set up logging using the utility function
-logger = setup_logging(logging_level, logging_stream)
+
+# CLI option name -> environment variable consumed by downstream config
+_OPTION_ENV_VARS = {
+    "enabled_tools": "ENABLED_TOOLS",
+    "confluence_url": "CONFLUENCE_URL",
+    "confluence_username": "CONFLUENCE_USERNAME",
+    "confluence_token": "CONFLUENCE_API_TOKEN",
+    "confluence_personal_token": "CONFLUENCE_PERSONAL_TOKEN",
+    "read_only": "READ_ONLY_MODE",
+    "confluence_ssl_verify": "CONFLUENCE_SSL_VERIFY",
+    "confluence_spaces_filter": "CONFLUENCE_SPACES_FILTER",
+}
+
+# Env-var spelling of boolean CLI flags
+_BOOL_STR = {True: "true", False: "false"}
+
+# Logging is configured in main() once the environment (including .env) is loaded
+logger = logging.getLogger("mcp-atlassian")
 
 
-@click.version_option(__version__, prog_name="mcp-atlassian")
 @click.command()
+@click.option(
+    "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=_print_version,
+    help="Show the version and exit.",
+)
 @click.option(
     "-v",
     "--verbose",
@@ -90,6 +115,31 @@ def main(
     - Username and API token (Cloud)
     - Personal Access Token (Server/Data Center)
     """
+    # Heavy imports are deferred until after CLI parsing so --help/--version stay fast
+    import asyncio
+
+    from dotenv import load_dotenv
+
+    from mcp_atlassian.utils.env import is_env_truthy
+    from mcp_atlassian.utils.lifecycle import (
+        ensure_clean_exit,
+        setup_signal_handlers,
+    )
+    from mcp_atlassian.utils.logging import setup_logging
+
+    # Install shutdown handlers first so a signal during bootstrap exits cleanly
+    setup_signal_handlers()
+
+    if env_file:
+        load_dotenv(env_file, override=True)
+    else:
+        load_dotenv(override=True)
+
+    # Resolve logging-related env flags once; they are stable after load_dotenv
+    very_verbose_env = is_env_truthy("MCP_VERY_VERBOSE", "false")
+    verbose_env = is_env_truthy("MCP_VERBOSE", "false")
+    stdout_env = is_env_truthy("MCP_LOGGING_STDOUT")
+
     # Logging level logic
     if verbose == 1:
         current_logging_level = logging.INFO
@@ -97,65 +147,57 @@ def main(
         current_logging_level = logging.DEBUG
     else:
         # Default to DEBUG if MCP_VERY_VERBOSE is set, else INFO if MCP_VERBOSE is set, else WARNING
-        if is_env_truthy("MCP_VERY_VERBOSE", "false"):
+        if very_verbose_env:
             current_logging_level = logging.DEBUG
-        elif is_env_truthy("MCP_VERBOSE", "false"):
+        elif verbose_env:
             current_logging_level = logging.INFO
         else:
             current_logging_level = logging.WARNING
 
     # Set up logging to STDOUT if MCP_LOGGING_STDOUT is set to true
-    logging_stream = sys.stdout if is_env_truthy("MCP_LOGGING_STDOUT") else sys.stderr
+    logging_stream = sys.stdout if stdout_env else sys.stderr
 
-    global logger
-    logger = setup_logging(current_logging_level, logging_stream)
+    setup_logging(current_logging_level, logging_stream)
     logger.debug(f"Logging level set to: {logging.getLevelName(current_logging_level)}")
     logger.debug(
         f"Logging stream set to: {'stdout' if logging_stream is sys.stdout else 'stderr'}"
     )
-
-    def was_option_provided(ctx: click.Context, param_name: str) -> bool:
-        return (
-            ctx.get_parameter_source(param_name)
-            != click.core.ParameterSource.DEFAULT_MAP
-            and ctx.get_parameter_source(param_name)
-            != click.core.ParameterSource.DEFAULT
-        )
-
     if env_file:
-        logger.debug(f"Loading environment from file: {env_file}")
-        load_dotenv(env_file, override=True)
+        logger.debug(f"Loaded environment from file: {env_file}")
     else:
-        logger.debug(
-            "Attempting to load environment from default .env file if it exists"
+        logger.debug("Loaded environment from default .env file if it exists")
+
+    def was_option_provided(ctx: click.Context, param_name: str) -> bool:
+        source = ctx.get_parameter_source(param_name)
+        return source not in (
+            click.core.ParameterSource.DEFAULT_MAP,
+            click.core.ParameterSource.DEFAULT,
         )
-        load_dotenv(override=True)
 
     click_ctx = click.get_current_context(silent=True)
 
     # Set env vars for downstream config
-    if click_ctx and was_option_provided(click_ctx, "enabled_tools"):
-        os.environ["ENABLED_TOOLS"] = enabled_tools
-    if click_ctx and was_option_provided(click_ctx, "confluence_url"):
-        os.environ["CONFLUENCE_URL"] = confluence_url
-    if click_ctx and was_option_provided(click_ctx, "confluence_username"):
-        os.environ["CONFLUENCE_USERNAME"] = confluence_username
-    if click_ctx and was_option_provided(click_ctx, "confluence_token"):
-        os.environ["CONFLUENCE_API_TOKEN"] = confluence_token
-    if click_ctx and was_option_provided(click_ctx, "confluence_personal_token"):
-        os.environ["CONFLUENCE_PERSONAL_TOKEN"] = confluence_personal_token
-    if click_ctx and was_option_provided(click_ctx, "read_only"):
-        os.environ["READ_ONLY_MODE"] = str(read_only).lower()
-    if click_ctx and was_option_provided(click_ctx, "confluence_ssl_verify"):
-        os.environ["CONFLUENCE_SSL_VERIFY"] = str(confluence_ssl_verify).lower()
-    if click_ctx and was_option_provided(click_ctx, "confluence_spaces_filter"):
-        os.environ["CONFLUENCE_SPACES_FILTER"] = confluence_spaces_filter
+    if click_ctx:
+        option_values = {
+            "enabled_tools": enabled_tools,
+            "confluence_url": confluence_url,
+            "confluence_username": confluence_username,
+            "confluence_token": confluence_token,
+            "confluence_personal_token": confluence_personal_token,
+            "read_only": _BOOL_STR[read_only],
+            "confluence_ssl_verify": _BOOL_STR[confluence_ssl_verify],
+            "confluence_spaces_filter": confluence_spaces_filter,
+        }
+        os.environ.update(
+            {
+                env_name: option_values[param_name]
+                for param_name, env_name in _OPTION_ENV_VARS.items()
+                if was_option_provided(click_ctx, param_name)
+            }
+        )
 
     from mcp_atlassian.servers import main_mcp
 
-    # Set up signal handlers for graceful shutdown
-    setup_signal_handlers()
-
     logger.info("Starting server with STDIO transport.")
 
     try:
@@ -1,11 +1,17 @@
 """Base client module for Confluence API interactions."""
 
+import hashlib
 import logging
 import os
+import threading
 
 from atlassian import Confluence
+from cachetools import LRUCache, TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..exceptions import MCPAtlassianAuthenticationError
+from ..utils.fast_json import install_fast_json_decoding
 from ..utils.logging import get_masked_session_headers, log_config_param, mask_sensitive
 from ..utils.request_logging import install_request_logging
 from ..utils.ssl import configure_ssl_verification
@@ -15,9 +21,39 @@ from .config import ConfluenceConfig
 logger = logging.getLogger("mcp-atlassian")
 
 
+# Keep-alive connections per host; covers the concurrent fetches and
+# preprocessing thread pools without "connection pool is full" churn
+CONNECTION_POOL_SIZE = 32
+
+# Short-lived cache of search results, keyed on the final CQL query
+SEARCH_CACHE_MAXSIZE = 512
+SEARCH_CACHE_TTL_SECONDS = 60
+
+# Shared by every client in the process, as the server builds a new fetcher
+# per tool call. Entries are scoped by site and credentials (see __init__).
+_shared_search_cache: TTLCache = TTLCache(
+    maxsize=SEARCH_CACHE_MAXSIZE, ttl=SEARCH_CACHE_TTL_SECONDS
+)
+# TTLCache is not thread-safe; searches also run from worker threads
+search_cache_lock = threading.Lock()
+
+# Most page space keys remembered per client; the server keeps one client for
+# the whole process, so the mapping must not grow without bound
+SPACE_KEY_CACHE_MAXSIZE = 256
+# LRUCache reorders entries even on reads, so lookups take this lock too
+space_key_cache_lock = threading.Lock()
+
+
 class ConfluenceClient:
     """Base client for Confluence API interactions."""
 
+    # Set per instance in __init__; None disables search result caching
+    _search_cache: TTLCache | None = None
+    # Prefix of this client's cache keys: results depend on site and user
+    _search_cache_scope: tuple[str, ...] = ()
+    # Set per instance in __init__; None disables space key caching
+    _space_key_cache: LRUCache | None = None
+
     def __init__(self, config: ConfluenceConfig | None = None) -> None:
         """Initialize the Confluence client with given or environment config.
 
@@ -64,6 +100,19 @@ class ConfluenceClient:
                 f"{get_masked_session_headers(dict(self.confluence._session.headers))}"
             )
 
+        # Larger keep-alive pool, and retries for connection errors only (raised
+        # before a request is sent, so safe for writes too). Mounted first so the
+        # host-specific SSL adapter below still takes precedence when used.
+        pooled_adapter = HTTPAdapter(
+            pool_connections=CONNECTION_POOL_SIZE,
+            pool_maxsize=CONNECTION_POOL_SIZE,
+            max_retries=Retry(
+                total=3, connect=3, read=0, status=0, other=0, backoff_factor=0.3
+            ),
+        )
+        self.confluence._session.mount("https://", pooled_adapter)
+        self.confluence._session.mount("http://", pooled_adapter)
+
         # Configure SSL verification using the shared utility
         configure_ssl_verification(
             service_name="Confluence",
@@ -97,11 +146,28 @@ class ConfluenceClient:
         # Install request logging to track API calls
         install_request_logging(self.confluence._session)
 
+        # Decode API responses with orjson when the optional extra is installed
+        install_fast_json_decoding(self.confluence._session)
+
         # Import here to avoid circular imports
         from ..preprocessing.confluence import ConfluencePreprocessor
 
         self.preprocessor = ConfluencePreprocessor(base_url=self.config.url)
 
+        # page_id -> space_key, filled lazily by lookups such as move_page and
+        # dropped when a page is moved or deleted
+        self._space_key_cache = LRUCache(maxsize=SPACE_KEY_CACHE_MAXSIZE)
+
+        # (scope, operation, cql, limit) -> list of ConfluencePage, busted on
+        # writes. The credential is hashed so it is never kept as a key.
+        self._search_cache = _shared_search_cache
+        credential = self.config.personal_token or self.config.api_token or ""
+        self._search_cache_scope = (
+            self.config.url,
+            self.config.username or "",
+            hashlib.blake2b(str(credential).encode(), digest_size=8).hexdigest(),
+        )
+
         # Test authentication during initialization (in debug mode only)
         if logger.isEnabledFor(logging.DEBUG):
             try:
@@ -139,6 +205,12 @@ class ConfluenceClient:
             )
             raise MCPAtlassianAuthenticationError(error_msg) from e
 
+    def _clear_search_cache(self) -> None:
+        """Drop cached search results after a write that may change them."""
+        if self._search_cache is not None:
+            with search_cache_lock:
+                self._search_cache.clear()
+
     def _apply_custom_headers(self) -> None:
         """Apply custom headers to the Confluence session."""
         if not self.config.custom_headers:
@@ -1,20 +1,86 @@
 """Module for Confluence page operations."""
 
+import functools
 import logging
+from collections.abc import Callable, Iterator
+from typing import Any, TypeVar
 
 import requests
 from requests.exceptions import HTTPError
 
-from ..exceptions import MCPAtlassianAuthenticationError
+from ..exceptions import ConfluenceVersionConflictError, MCPAtlassianAuthenticationError
 from ..models.confluence import ConfluencePage
-from .client import ConfluenceClient
+from .client import ConfluenceClient, space_key_cache_lock
+from .utils import MAX_CONCURRENT_WORKERS, map_concurrently
 
 logger = logging.getLogger("mcp-atlassian")
 
+_R = TypeVar("_R")
+
+def _raise_if_auth_error(http_err: HTTPError) -> None:
+    """Raise MCPAtlassianAuthenticationError if the HTTP error is a 401/403.
+
+    Args:
+        http_err: The HTTPError raised by the Confluence API
+
+    Raises:
+        MCPAtlassianAuthenticationError: If the response status is 401 or 403
+    """
+    response = http_err.response
+    status = response.status_code if response is not None else None
+    if status == 401 or status == 403:
+        error_msg = (
+            f"Authentication failed for Confluence API ({status}). "
+            "Token may be expired or invalid. Please verify credentials."
+        )
+        logger.error(error_msg)
+        raise MCPAtlassianAuthenticationError(error_msg) from http_err
+
+
+def _space_key(page: dict) -> str:
+    """Return the space key of a raw page dict, or "" if it is missing."""
+    return (page.get("space") or {}).get("key", "")
+
+
+def _translate_auth_errors(func: Callable[..., _R]) -> Callable[..., _R]:
+    """Decorator translating 401/403 HTTP errors into MCPAtlassianAuthenticationError.
+
+    Other HTTP errors are logged and re-raised unchanged. Decorated methods must
+    let HTTPError propagate past their own generic exception handlers.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> _R:
+        try:
+            return func(self, *args, **kwargs)
+        except HTTPError as http_err:
+            _raise_if_auth_error(http_err)
+            logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+            raise
+
+    return wrapper
+
+
+def _extract_storage_value(page: dict) -> str:
+    """Return a page's body.storage.value, or "" if any level is missing.
+
+    Args:
+        page: Raw page dict from the Confluence API
+
+    Returns:
+        The storage-format HTML, or an empty string
+    """
+    value = ((page.get("body") or {}).get("storage") or {}).get("value")
+    if value is None:
+        logger.warning(f"Page {page.get('id', 'unknown')} missing body.storage.value")
+        return ""
+    return value
+
 
 class PagesMixin(ConfluenceClient):
     """Mixin for Confluence page operations."""
 
+    @_translate_auth_errors
     def get_page_content(
         self, page_id: str, *, convert_to_markdown: bool = True
     ) -> ConfluencePage:
@@ -40,21 +106,16 @@ class PagesMixin(ConfluenceClient):
                 expand="body.storage,version,space,children.attachment",
             )
 
-            space_key = page.get("space", {}).get("key", "")
-            try:
-                content = page["body"]["storage"]["value"]
-            except (KeyError, TypeError) as e:
-                logger.warning(
-                    f"Page {page.get('id', 'unknown')} missing body.storage.value: {e}"
-                )
-                content = ""
-            processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key, confluence_client=self.confluence
+            space_key = _space_key(page)
+            content = _extract_storage_value(page)
+            # Only produce the representation the caller asked for
+            page_content = self.preprocessor.process_html_content_single(
+                content,
+                space_key=space_key,
+                confluence_client=self.confluence,
+                to_markdown=convert_to_markdown,
             )
 
-            # Use the appropriate content format based on the convert_to_markdown flag
-            page_content = processed_markdown if convert_to_markdown else processed_html
-
             # Create and return the ConfluencePage model
             return ConfluencePage.from_api_response(
                 page,
@@ -65,26 +126,16 @@ class PagesMixin(ConfluenceClient):
                 content_format="storage" if not convert_to_markdown else "markdown",
                 is_cloud=self.config.is_cloud,
             )
-        except HTTPError as http_err:
-            if http_err.response is not None and http_err.response.status_code in [
-                401,
-                403,
-            ]:
-                error_msg = (
-                    f"Authentication failed for Confluence API ({http_err.response.status_code}). "
-                    "Token may be expired or invalid. Please verify credentials."
-                )
-                logger.error(error_msg)
-                raise MCPAtlassianAuthenticationError(error_msg) from http_err
-            else:
-                logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
-                raise http_err
+        except HTTPError:
+            # Translated by @_translate_auth_errors
+            raise
         except Exception as e:
             logger.error(
                 f"Error retrieving page content for page ID {page_id}: {str(e)}"
             )
             raise Exception(f"Error retrieving page content: {str(e)}") from e
 
+    @_translate_auth_errors
     def get_page_ancestors(self, page_id: str) -> list[ConfluencePage]:
         """
         Get ancestors (parent pages) of a specific page.
@@ -103,32 +154,16 @@ class PagesMixin(ConfluenceClient):
             # Use the Atlassian Python API to get ancestors
             ancestors = self.confluence.get_page_ancestors(page_id)
 
-            # Process each ancestor
-            ancestor_models = []
-            for ancestor in ancestors:
-                # Create the page model without fetching content
-                page_model = ConfluencePage.from_api_response(
-                    ancestor,
-                    base_url=self.config.url,
-                    include_body=False,
-                )
-                ancestor_models.append(page_model)
-
-            return ancestor_models
-        except HTTPError as http_err:
-            if http_err.response is not None and http_err.response.status_code in [
-                401,
-                403,
-            ]:
-                error_msg = (
-                    f"Authentication failed for Confluence API ({http_err.response.status_code}). "
-                    "Token may be expired or invalid. Please verify credentials."
-                )
-                logger.error(error_msg)
-                raise MCPAtlassianAuthenticationError(error_msg) from http_err
-            else:
-                logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
-                raise http_err
+            # Create the page models without fetching content
+            base_url = self.config.url
+            from_api = ConfluencePage.from_api_response
+            return [
+                from_api(ancestor, base_url=base_url, include_body=False)
+                for ancestor in ancestors
+            ]
+        except HTTPError:
+            # Translated by @_translate_auth_errors
+            raise
         except Exception as e:
             logger.error(f"Error fetching ancestors for page {page_id}: {str(e)}")
             logger.debug("Full exception details:", exc_info=True)
@@ -162,20 +197,15 @@ class PagesMixin(ConfluenceClient):
                 )
                 return None
 
-            try:
-                content = page["body"]["storage"]["value"]
-            except (KeyError, TypeError) as e:
-                logger.warning(
-                    f"Page {page.get('id', 'unknown')} missing body.storage.value: {e}"
-                )
-                content = ""
-            processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key, confluence_client=self.confluence
+            content = _extract_storage_value(page)
+            # Only produce the representation the caller asked for
+            page_content = self.preprocessor.process_html_content_single(
+                content,
+                space_key=space_key,
+                confluence_client=self.confluence,
+                to_markdown=convert_to_markdown,
             )
 
-            # Use the appropriate content format based on the convert_to_markdown flag
-            page_content = processed_markdown if convert_to_markdown else processed_html
-
             # Create and return the ConfluencePage model
             return ConfluencePage.from_api_response(
                 page,
@@ -223,47 +253,87 @@ class PagesMixin(ConfluenceClient):
         Returns:
             List of ConfluencePage models containing page content and metadata
         """
-        pages = self.confluence.get_all_pages_from_space(
-            space=space_key, start=start, limit=limit, expand="body.storage"
+        return list(
+            self.iter_space_pages(
+                space_key,
+                start=start,
+                limit=limit,
+                convert_to_markdown=convert_to_markdown,
+            )
         )
 
-        page_models = []
-        for page in pages:
-            try:
-                content = page["body"]["storage"]["value"]
-            except (KeyError, TypeError) as e:
-                logger.warning(
-                    f"Page {page.get('id', 'unknown')} missing body.storage.value: {e}"
-                )
-                content = ""
-            processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key, confluence_client=self.confluence
-            )
+    def iter_space_pages(
+        self,
+        space_key: str,
+        start: int = 0,
+        limit: int = 10,
+        *,
+        convert_to_markdown: bool = True,
+    ) -> Iterator[ConfluencePage]:
+        """
+        Iterate over pages from a specific space, building models lazily.
 
-            # Use the appropriate content format based on the convert_to_markdown flag
-            page_content = processed_markdown if convert_to_markdown else processed_html
+        The pages are fetched in one request. Their bodies are then processed
+        a window of MAX_CONCURRENT_WORKERS pages at a time, so the first pages
+        are yielded before the rest are processed.
 
-            # Ensure space information is included
-            if "space" not in page:
-                page["space"] = {
-                    "key": space_key,
-                    "name": space_key,  # Use space_key as name if not available
-                }
+        Args:
+            space_key: The key of the space to get pages from
+            start: The starting index for pagination
+            limit: Maximum number of pages to return
+            convert_to_markdown: When True, yields content in markdown format,
+                               otherwise raw HTML (keyword-only)
 
-            # Create the ConfluencePage model
-            page_model = ConfluencePage.from_api_response(
-                page,
-                base_url=self.config.url,
-                include_body=True,
-                # Override content with our processed version
-                content_override=page_content,
-                content_format="storage" if not convert_to_markdown else "markdown",
-                is_cloud=self.config.is_cloud,
+        Yields:
+            ConfluencePage models containing page content and metadata
+        """
+        pages = self.confluence.get_all_pages_from_space(
+            space=space_key, start=start, limit=limit, expand="body.storage"
+        )
+
+        # Resolve loop invariants once
+        base_url = self.config.url
+        is_cloud = self.config.is_cloud
+        content_format = "markdown" if convert_to_markdown else "storage"
+        process_html_content = self.preprocessor.process_html_content_single
+        confluence = self.confluence
+
+        def process(content: str) -> str:
+            return process_html_content(
+                content,
+                space_key=space_key,
+                confluence_client=confluence,
+                to_markdown=convert_to_markdown,
             )
 
-            page_models.append(page_model)
+        # Fallback space info, shared by pages without it (only read downstream)
+        default_space = {
+            "key": space_key,
+            "name": space_key,  # Use space_key as name if not available
+        }
+
+        # Preprocess page bodies concurrently (user lookups inside are
+        # I/O-bound), one window of pages at a time, so only that window's
+        # processed content is held before it is yielded
+        window = MAX_CONCURRENT_WORKERS
+        for i in range(0, len(pages), window):
+            batch = pages[i : i + window]
+            processed_contents = map_concurrently(
+                process, [_extract_storage_value(page) for page in batch]
+            )
+            for page, page_content in zip(batch, processed_contents, strict=True):
+                # Ensure space information is included
+                page.setdefault("space", default_space)
 
-        return page_models
+                yield ConfluencePage.from_api_response(
+                    page,
+                    base_url=base_url,
+                    include_body=True,
+                    # Override content with our processed version
+                    content_override=page_content,
+                    content_format=content_format,
+                    is_cloud=is_cloud,
+                )
 
     def create_page(
         self,
@@ -275,6 +345,7 @@ class PagesMixin(ConfluenceClient):
         is_markdown: bool = True,
         enable_heading_anchors: bool = False,
         content_representation: str | None = None,
+        return_full_content: bool = True,
     ) -> ConfluencePage:
         """
         Create a new page in a Confluence space.
@@ -287,6 +358,9 @@ class PagesMixin(ConfluenceClient):
             is_markdown: Whether the body content is in markdown format (default: True, keyword-only)
             enable_heading_anchors: Whether to enable automatic heading anchor generation (default: False, keyword-only)
             content_representation: Content format when is_markdown=False ('wiki' or 'storage', keyword-only)
+            return_full_content: When True, re-fetch the page with processed content.
+                When False, build the model from the create response without a
+                second request (keyword-only)
 
         Returns:
             ConfluencePage model containing the new page's data
@@ -315,12 +389,21 @@ class PagesMixin(ConfluenceClient):
                 parent_id=parent_id,
                 representation=representation,
             )
+            self._clear_search_cache()
 
             # Get the new page content
             page_id = result.get("id")
             if not page_id:
                 raise ValueError("Create page response did not contain an ID")
 
+            if not return_full_content:
+                return ConfluencePage.from_api_response(
+                    result,
+                    base_url=self.config.url,
+                    include_body=False,
+                    is_cloud=self.config.is_cloud,
+                )
+
             return self.get_page_content(page_id)
         except Exception as e:
             logger.error(
@@ -342,6 +425,8 @@ class PagesMixin(ConfluenceClient):
         parent_id: str | None = None,
         enable_heading_anchors: bool = False,
         content_representation: str | None = None,
+        return_full_content: bool = True,
+        base_version: int | None = None,
     ) -> ConfluencePage:
         """
         Update an existing page in Confluence.
@@ -356,11 +441,20 @@ class PagesMixin(ConfluenceClient):
             parent_id: Optional new parent page ID (keyword-only)
             enable_heading_anchors: Whether to enable automatic heading anchor generation (default: False, keyword-only)
             content_representation: Content format when is_markdown=False ('wiki' or 'storage', keyword-only)
+            return_full_content: When True, re-fetch the page with processed content.
+                When False, build the model from the update response without a
+                second request (keyword-only)
+            base_version: The page version the new content is based on. When
+                given, the update is sent as the next version without first
+                looking the current one up, and Confluence rejects it if the
+                page has changed since (keyword-only)
 
         Returns:
             ConfluencePage model containing the updated page's data
 
         Raises:
+            ConfluenceVersionConflictError: If base_version is not the current
+                version of the page
             Exception: If there is an error updating the page
         """
         try:
@@ -391,14 +485,82 @@ class PagesMixin(ConfluenceClient):
             if parent_id:
                 update_kwargs["parent_id"] = parent_id
 
-            self.confluence.update_page(**update_kwargs)
+            if base_version is None:
+                result = self.confluence.update_page(**update_kwargs)
+            else:
+                result = self._update_page_from_version(update_kwargs, base_version)
+            self._clear_search_cache()
+
+            if not return_full_content and isinstance(result, dict) and result.get("id"):
+                return ConfluencePage.from_api_response(
+                    result,
+                    base_url=self.config.url,
+                    include_body=False,
+                    is_cloud=self.config.is_cloud,
+                )
 
             # After update, refresh the page data
             return self.get_page_content(page_id)
+        except ConfluenceVersionConflictError:
+            raise
         except Exception as e:
             logger.error(f"Error updating page {page_id}: {str(e)}")
             raise Exception(f"Failed to update page {page_id}: {str(e)}") from e
 
+    def _update_page_from_version(
+        self, update_kwargs: dict[str, Any], base_version: int
+    ) -> dict[str, Any]:
+        """Send a page update as the version after base_version.
+
+        Builds the request the client's update_page sends, without the history
+        request it makes to find the current version and without resetting the
+        page width. Confluence answers 409 if base_version is outdated.
+
+        Args:
+            update_kwargs: The arguments that would be passed to update_page
+            base_version: The version the update is based on
+
+        Returns:
+            The update response
+
+        Raises:
+            ConfluenceVersionConflictError: If the page has a newer version
+        """
+        page_id = update_kwargs["page_id"]
+        representation = update_kwargs["representation"]
+        version: dict[str, Any] = {
+            "number": base_version + 1,
+            "minorEdit": update_kwargs["minor_edit"],
+        }
+        if update_kwargs["version_comment"]:
+            version["message"] = update_kwargs["version_comment"]
+        data: dict[str, Any] = {
+            "id": page_id,
+            "type": update_kwargs["type"],
+            "title": update_kwargs["title"],
+            "version": version,
+            "body": {
+                representation: {
+                    "value": update_kwargs["body"],
+                    "representation": representation,
+                }
+            },
+        }
+        if update_kwargs.get("parent_id"):
+            data["ancestors"] = [{"type": "page", "id": update_kwargs["parent_id"]}]
+        try:
+            return self.confluence.put(
+                f"rest/api/content/{page_id}",
+                data=data,
+                params={"status": "current"},
+            )
+        except HTTPError as http_err:
+            if http_err.response is not None and http_err.response.status_code == 409:
+                raise ConfluenceVersionConflictError(
+                    f"Page {page_id} has changed since version {base_version}"
+                ) from http_err
+            raise
+
     def get_page_children(
         self,
         page_id: str,
@@ -441,29 +603,47 @@ class PagesMixin(ConfluenceClient):
 
             # Get space key from the first result if available
             if child_pages and "space" in child_pages[0]:
-                space_key = child_pages[0].get("space", {}).get("key", "")
+                space_key = _space_key(child_pages[0])
+
+            # Resolve loop invariants once
+            base_url = self.config.url
+            content_format = "markdown" if convert_to_markdown else "storage"
+            process_html_content = self.preprocessor.process_html_content_single
+            confluence = self.confluence
+
+            # Only process content if markdown is wanted and "body" was expanded;
+            # the default listing (expand="version") skips body handling entirely
+            content_overrides: list[str | None]
+            if convert_to_markdown and "body" in expand:
+                contents = [
+                    _extract_storage_value(page) if "body" in page else ""
+                    for page in child_pages
+                ]
+                content_overrides = map_concurrently(
+                    lambda content: process_html_content(
+                        content,
+                        space_key=space_key,
+                        confluence_client=confluence,
+                        to_markdown=True,
+                    )
+                    if content
+                    else None,
+                    contents,
+                )
+            else:
+                content_overrides = [None] * len(child_pages)
 
             # Process each child page
-            for page in child_pages:
-                # Only process content if we have "body" expanded
-                content_override = None
-                if "body" in page and convert_to_markdown:
-                    content = page.get("body", {}).get("storage", {}).get("value", "")
-                    if content:
-                        _, processed_markdown = self.preprocessor.process_html_content(
-                            content,
-                            space_key=space_key,
-                            confluence_client=self.confluence,
-                        )
-                        content_override = processed_markdown
-
+            for page, content_override in zip(
+                child_pages, content_overrides, strict=True
+            ):
                 # Create the page model
                 page_model = ConfluencePage.from_api_response(
                     page,
-                    base_url=self.config.url,
+                    base_url=base_url,
                     include_body=True,
                     content_override=content_override,
-                    content_format="markdown" if convert_to_markdown else "storage",
+                    content_format=content_format,
                 )
 
                 page_models.append(page_model)
@@ -491,6 +671,8 @@ class PagesMixin(ConfluenceClient):
         try:
             logger.debug(f"Deleting page {page_id}")
             response = self.confluence.remove_page(page_id=page_id)
+            self._clear_search_cache()
+            self._forget_space_key(page_id)
 
             # The Atlassian library's remove_page returns the raw response from
             # the REST API call. For a successful deletion, we should get a
@@ -516,6 +698,35 @@ class PagesMixin(ConfluenceClient):
             logger.error(f"Error deleting page {page_id}: {str(e)}")
             raise Exception(f"Failed to delete page {page_id}: {str(e)}") from e
 
+    def _get_space_key_for_page(self, page_id: str) -> str | None:
+        """
+        Get the space key of a page, caching the result per client instance.
+
+        Args:
+            page_id: The ID of the page
+
+        Returns:
+            The space key, or None if it could not be determined
+        """
+        if self._space_key_cache is not None:
+            with space_key_cache_lock:
+                space_key = self._space_key_cache.get(page_id)
+            if space_key:
+                return space_key
+
+        page = self.confluence.get_page_by_id(page_id, expand="space")
+        space_key = _space_key(page)
+        if space_key and self._space_key_cache is not None:
+            with space_key_cache_lock:
+                self._space_key_cache[page_id] = space_key
+        return space_key or None
+
+    def _forget_space_key(self, page_id: str) -> None:
+        """Drop a page's cached space key after it was moved or deleted."""
+        if self._space_key_cache is not None:
+            with space_key_cache_lock:
+                self._space_key_cache.pop(page_id, None)
+
     def move_page(
         self,
         page_id: str,
@@ -541,8 +752,7 @@ class PagesMixin(ConfluenceClient):
         """
         try:
             # Get target page to find its space key
-            target_page = self.confluence.get_page_by_id(target_id, expand="space")
-            space_key = target_page.get("space", {}).get("key")
+            space_key = self._get_space_key_for_page(target_id)
             if not space_key:
                 raise Exception(f"Could not determine space key for target page {target_id}")
 
@@ -553,6 +763,9 @@ class PagesMixin(ConfluenceClient):
                 target_id=target_id,
                 position=position,
             )
+            self._clear_search_cache()
+            # The page may now be in another space
+            self._forget_space_key(page_id)
             logger.info(f"Moved page {page_id} {position} {target_id}")
             return True
 
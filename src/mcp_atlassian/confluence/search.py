@@ -1,20 +1,97 @@
 """Module for Confluence search operations."""
 
+import functools
 import logging
+import re
+from collections.abc import Iterator
+from urllib.parse import parse_qsl, urlsplit
 
 from ..models.confluence import (
     ConfluencePage,
-    ConfluenceSearchResult,
     ConfluenceUserSearchResult,
     ConfluenceUserSearchResults,
 )
 from ..utils.decorators import handle_atlassian_api_errors
-from .client import ConfluenceClient
-from .utils import quote_cql_identifier_if_needed
+from .client import ConfluenceClient, search_cache_lock
+from .utils import (
+    MAX_CONCURRENT_WORKERS,
+    map_concurrently,
+    quote_cql_identifier_if_needed,
+)
 
 logger = logging.getLogger("mcp-atlassian")
 
 
+def _normalize_cql(cql: str) -> str:
+    """Normalize CQL for use as a cache key.
+
+    Only surrounding whitespace is stripped; inner whitespace may sit inside
+    quoted values, where it is significant.
+    """
+    return cql.strip()
+
+
+# A "space =" clause outside of string literals, in any case/spacing
+_SPACE_CLAUSE_RE = re.compile(r"(?<![\w.\"'])space\s*=", re.IGNORECASE)
+_CQL_STRING_LITERAL_RE = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'')
+
+
+def _has_space_clause(cql: str) -> bool:
+    """Check whether a CQL query already restricts results by space.
+
+    Args:
+        cql: Confluence Query Language string
+
+    Returns:
+        True if a ``space =`` clause appears outside of quoted values
+    """
+    unquoted = _CQL_STRING_LITERAL_RE.sub('""', cql)
+    return _SPACE_CLAUSE_RE.search(unquoted) is not None
+
+
+@functools.lru_cache(maxsize=64)
+def _build_space_query(spaces_filter: str) -> str:
+    """Build the CQL space clause for a comma-separated spaces filter.
+
+    Args:
+        spaces_filter: Comma-separated list of space keys
+
+    Returns:
+        The space clauses joined with OR
+    """
+    spaces = [s.strip() for s in spaces_filter.split(",")]
+    return " OR ".join(
+        [f"space = {quote_cql_identifier_if_needed(space)}" for space in spaces]
+    )
+
+
+# Top-level fields of bulk content results that sync consumers read
+_BULK_PAGE_FIELDS = ("id", "title", "type", "status", "space", "body", "version")
+
+
+def _project_bulk_page(page: dict) -> dict:
+    """Drop unused keys from a bulk content result to cut retained memory.
+
+    Keeps the fields read by sync, the web UI link, and the id/title of each
+    ancestor; _expandable, extensions and the other _links are discarded.
+
+    Args:
+        page: Raw page dict from rest/api/content
+
+    Returns:
+        A smaller page dict with the same shape for the kept fields
+    """
+    projected = {key: page[key] for key in _BULK_PAGE_FIELDS if key in page}
+    if "ancestors" in page:
+        projected["ancestors"] = [
+            {"id": ancestor.get("id"), "title": ancestor.get("title")}
+            for ancestor in page["ancestors"]
+        ]
+    if webui := (page.get("_links") or {}).get("webui"):
+        projected["_links"] = {"webui": webui}
+    return projected
+
+
 class SearchMixin(ConfluenceClient):
     """Mixin for Confluence search operations."""
 
@@ -38,60 +115,191 @@ class SearchMixin(ConfluenceClient):
         Returns:
             List of all ConfluencePage models matching the query
         """
-        all_pages: list[ConfluencePage] = []
-        start = 0
-
         # Apply spaces filter if present
         cql = self._apply_spaces_filter(cql, spaces_filter)
 
-        while True:
-            logger.debug(f"Fetching pages: start={start}, limit={self.MAX_CQL_LIMIT}")
-            results = self.confluence.cql(cql=cql, start=start, limit=self.MAX_CQL_LIMIT)
-
-            search_result = ConfluenceSearchResult.from_api_response(
-                results,
-                base_url=self.config.url,
-                cql_query=cql,
-                is_cloud=self.config.is_cloud,
-            )
+        cache_key = ("search_all", _normalize_cql(cql), None)
+        if (cached := self._get_cached_search(cache_key)) is not None:
+            return cached
 
-            all_pages.extend(search_result.results)
+        all_pages = list(self._iter_cql_pages(cql))
 
-            # Check if there are more results
-            total_size = results.get("totalSize", 0)
-            fetched = start + len(search_result.results)
+        logger.info(f"Total pages fetched: {len(all_pages)}")
+        self._store_cached_search(cache_key, all_pages)
+        return all_pages
 
-            logger.debug(f"Fetched {fetched}/{total_size} pages")
+    def iter_search_all(
+        self, cql: str, spaces_filter: str | None = None
+    ) -> Iterator[ConfluencePage]:
+        """
+        Iterate over all content matching a CQL query, batch by batch.
 
-            if fetched >= total_size or len(search_result.results) == 0:
-                break
+        Streaming counterpart of search_all: only a bounded number of result
+        batches is held in memory at a time. Results are not cached.
 
-            start = fetched
+        Args:
+            cql: Confluence Query Language string
+            spaces_filter: Optional comma-separated list of space keys to filter by
 
-        logger.info(f"Total pages fetched: {len(all_pages)}")
-        return all_pages
+        Yields:
+            ConfluencePage models matching the query
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the
+                Confluence API (401/403)
+        """
+        yield from self._iter_cql_pages(self._apply_spaces_filter(cql, spaces_filter))
+
+    def _iter_cql_pages(self, cql: str) -> Iterator[ConfluencePage]:
+        """Yield all results of a final CQL query, fetching batches concurrently."""
+        base_url = self.config.url
+        is_cloud = self.config.is_cloud
+        limit = self.MAX_CQL_LIMIT
+
+        def fetch(start: int) -> dict:
+            logger.debug("Fetching pages: start=%d, limit=%d", start, limit)
+            return self.confluence.cql(cql=cql, start=start, limit=limit)
+
+        from_api = ConfluencePage.from_api_response
+
+        def to_pages(results: dict) -> list[ConfluencePage]:
+            # Build page models directly; the per-batch ConfluenceSearchResult
+            # wrapper was only ever unpacked again
+            return [
+                from_api(content, base_url=base_url, is_cloud=is_cloud)
+                for item in results.get("results", [])
+                if (content := item.get("content"))
+            ]
+
+        # Probe the first page to learn totalSize and the server's page size
+        last_start, last_results = 0, fetch(0)
+        yield from to_pages(last_results)
+        total_size = last_results.get("totalSize", 0)
+        page_size = len(last_results.get("results", []))
+
+        # Remaining offsets are independent; fetch them concurrently, a window
+        # at a time so memory stays bounded for very large result sets
+        if page_size and page_size < total_size:
+            starts = list(range(page_size, total_size, page_size))
+            logger.debug(
+                f"Fetched {page_size}/{total_size} pages, "
+                f"fetching {len(starts)} more batches concurrently"
+            )
+            for i in range(0, len(starts), MAX_CONCURRENT_WORKERS):
+                window = starts[i : i + MAX_CONCURRENT_WORKERS]
+                for last_results in map_concurrently(fetch, window):
+                    yield from to_pages(last_results)
+                last_start = window[-1]
+
+        # totalSize is only a hint (Cloud may report 0 or a lower bound), so
+        # keep following the next link for as long as batches come back
+        while (batch_len := len(last_results.get("results", []))) and (
+            last_results.get("_links", {}).get("next")
+        ):
+            last_start += batch_len
+            last_results = fetch(last_start)
+            yield from to_pages(last_results)
+
+    # Page ids per "id in (...)" CQL query in search_by_ids
+    ID_BATCH_SIZE = 100
+
+    @handle_atlassian_api_errors("Confluence API")
+    def search_by_ids(
+        self, page_ids: list[str], spaces_filter: str | None = None
+    ) -> list[ConfluencePage]:
+        """
+        Fetch content for many ids with batched ``id in (...)`` CQL queries.
+
+        Replaces one request per id with one query per ID_BATCH_SIZE ids; the
+        batches are issued concurrently. Results are ordered by batch, not by
+        the order of page_ids, and ids that do not match are simply absent.
+
+        Args:
+            page_ids: Numeric content ids
+            spaces_filter: Optional comma-separated list of space keys to filter by
+
+        Returns:
+            List of ConfluencePage models for the ids that were found
+
+        Raises:
+            ValueError: If an id is not numeric
+        """
+        ids = list(dict.fromkeys(str(page_id) for page_id in page_ids))
+        if invalid := [page_id for page_id in ids if not page_id.isdigit()]:
+            raise ValueError(f"Page ids must be numeric: {invalid}")
+
+        batch_size = self.ID_BATCH_SIZE
+        queries = [
+            self._apply_spaces_filter(
+                f"id in ({','.join(ids[i : i + batch_size])})", spaces_filter
+            )
+            for i in range(0, len(ids), batch_size)
+        ]
+
+        pages: list[ConfluencePage] = []
+        for batch in map_concurrently(
+            lambda cql: list(self._iter_cql_pages(cql)), queries
+        ):
+            pages.extend(batch)
+        return pages
+
+    def _get_cached_search(
+        self, cache_key: tuple[str, str, int | None]
+    ) -> list[ConfluencePage] | None:
+        """Return copies of cached search results, or None on a miss."""
+        if self._search_cache is None:
+            return None
+        with search_cache_lock:
+            cached = self._search_cache.get((*self._search_cache_scope, *cache_key))
+        if cached is None:
+            return None
+        logger.debug(f"Search cache hit for {cache_key[0]}: {cache_key[1]}")
+        # Callers mutate the returned models, so never hand out the cached ones
+        return [page.model_copy(deep=True) for page in cached]
+
+    def _store_cached_search(
+        self, cache_key: tuple[str, str, int | None], pages: list[ConfluencePage]
+    ) -> None:
+        """Cache copies of search results under the given key."""
+        if self._search_cache is not None:
+            copies = [page.model_copy(deep=True) for page in pages]
+            with search_cache_lock:
+                self._search_cache[(*self._search_cache_scope, *cache_key)] = copies
 
     def _apply_spaces_filter(
         self, cql: str, spaces_filter: str | None = None
     ) -> str:
         """Apply spaces filter to CQL query."""
         filter_to_use = spaces_filter or self.config.spaces_filter
+        if not filter_to_use:
+            return cql
 
-        if filter_to_use:
-            spaces = [s.strip() for s in filter_to_use.split(",")]
-            space_query = " OR ".join(
-                [f"space = {quote_cql_identifier_if_needed(space)}" for space in spaces]
-            )
+        filtered_cql = self._build_cql_with_spaces(cql, filter_to_use)
+        if filtered_cql != cql:
+            logger.info("Applied spaces filter to query: %s", filtered_cql)
+        return filtered_cql
 
-            if cql and space_query:
-                if "space = " not in cql:
-                    cql = f"({cql}) AND ({space_query})"
-            else:
-                cql = space_query
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _build_cql_with_spaces(cql: str, spaces_filter: str) -> str:
+        """Combine a CQL query with a spaces filter (pure, so memoized).
 
-            logger.info(f"Applied spaces filter to query: {cql}")
+        Args:
+            cql: Confluence Query Language string, possibly empty
+            spaces_filter: Comma-separated list of space keys
 
-        return cql
+        Returns:
+            The query restricted to the given spaces, the space clause alone if
+            the query is empty, or the query unchanged if it already targets a
+            space
+        """
+        space_query = _build_space_query(spaces_filter)
+        if not cql or not space_query:
+            return space_query
+        if _has_space_clause(cql):
+            # The query already targets a space; leave it untouched
+            return cql
+        return f"({cql}) AND ({space_query})"
 
     @handle_atlassian_api_errors("Confluence API")
     def search(
@@ -118,42 +326,81 @@ class SearchMixin(ConfluenceClient):
 
         # Execute the CQL search query (API max is 250)
         effective_limit = min(limit, self.MAX_CQL_LIMIT)
-        results = self.confluence.cql(cql=cql, limit=effective_limit)
-
-        # Convert the response to a search result model
-        search_result = ConfluenceSearchResult.from_api_response(
-            results,
-            base_url=self.config.url,
-            cql_query=cql,
-            is_cloud=self.config.is_cloud,
-        )
+        cache_key = ("search", _normalize_cql(cql), effective_limit)
+        if (cached := self._get_cached_search(cache_key)) is not None:
+            return cached
 
-        # Process result excerpts as content
-        processed_pages = []
-        for page in search_result.results:
-            # Get the excerpt from the original search results
-            for result_item in results.get("results", []):
-                if result_item.get("content", {}).get("id") == page.id:
-                    excerpt = result_item.get("excerpt", "")
-                    if excerpt:
-                        # Process the excerpt as HTML content
-                        space_key = page.space.key if page.space else ""
-                        _, processed_markdown = self.preprocessor.process_html_content(
-                            excerpt,
-                            space_key=space_key,
-                            confluence_client=self.confluence,
-                        )
-                        # Create a new page with processed content
-                        page.content = processed_markdown
-                    break
+        results = self.confluence.cql(cql=cql, limit=effective_limit)
 
-            processed_pages.append(page)
+        # Build page models and the id -> excerpt index in one pass over the
+        # raw results; the first result for an id supplies its excerpt
+        base_url = self.config.url
+        is_cloud = self.config.is_cloud
+        from_api = ConfluencePage.from_api_response
+        processed_pages: list[ConfluencePage] = []
+        excerpts: dict[str, str] = {}
+        for result_item in results.get("results", []):
+            if content := result_item.get("content"):
+                processed_pages.append(
+                    from_api(content, base_url=base_url, is_cloud=is_cloud)
+                )
+                if (content_id := content.get("id")) is not None:
+                    excerpts.setdefault(content_id, result_item.get("excerpt", ""))
+
+        # Metadata-only searches (e.g. id lookups) come back without excerpts
+        if any(excerpts.values()):
+            self._attach_processed_excerpts(processed_pages, excerpts)
 
         # Return the list of result pages with processed content
+        self._store_cached_search(cache_key, processed_pages)
         return processed_pages
 
-    # Smaller batch size for bulk content fetch (full HTML is large)
-    BULK_CONTENT_LIMIT = 50
+    def _attach_processed_excerpts(
+        self, pages: list[ConfluencePage], excerpts: dict[str, str]
+    ) -> None:
+        """Set each page's content to its search excerpt converted to markdown.
+
+        Args:
+            pages: Page models built from the search results
+            excerpts: Raw excerpt HTML keyed by content id
+        """
+        # User lookups inside the preprocessor are I/O-bound, so excerpts are
+        # handled concurrently
+        jobs = [
+            (page, (excerpt, page.space.key if page.space else ""))
+            for page in pages
+            if (excerpt := excerpts.get(page.id))
+        ]
+        # Identical (excerpt, space) pairs are converted only once per call
+        unique_keys = list(dict.fromkeys(key for _, key in jobs))
+        process_html_content = self.preprocessor.process_html_content
+        confluence = self.confluence
+
+        def process_excerpt(key: tuple[str, str]) -> str:
+            excerpt, space_key = key
+            _, processed_markdown = process_html_content(
+                excerpt,
+                space_key=space_key,
+                confluence_client=confluence,
+            )
+            return processed_markdown
+
+        processed = dict(
+            zip(
+                unique_keys,
+                map_concurrently(process_excerpt, unique_keys),
+                strict=True,
+            )
+        )
+        for page, key in jobs:
+            page.content = processed[key]
+
+    # Page size requested for bulk content fetches. Servers cap it lower when
+    # bodies are expanded; the limit a response reports is used for paging.
+    BULK_CONTENT_LIMIT = 250
+
+    # Concurrent bulk content requests (kept low, each response can be MBs)
+    BULK_CONTENT_CONCURRENCY = 4
 
     @handle_atlassian_api_errors("Confluence API")
     def get_all_space_pages_with_content(
@@ -171,34 +418,134 @@ class SearchMixin(ConfluenceClient):
         Returns:
             List of page dicts with id, title, body.storage, ancestors, version
         """
-        all_pages: list[dict] = []
-        start = 0
+        all_pages = list(self.iter_all_space_pages_with_content(space_key))
+        logger.info(f"Fetched {len(all_pages)} pages with content from space {space_key}")
+        return all_pages
 
-        while True:
-            logger.debug(f"Fetching space pages: start={start}, limit={self.BULK_CONTENT_LIMIT}")
-            result = self.confluence.get(
+    def iter_all_space_pages_with_content(self, space_key: str) -> Iterator[dict]:
+        """
+        Iterate over all pages of a space with content, ancestors and version.
+
+        Streaming counterpart of get_all_space_pages_with_content: at most one
+        window of BULK_CONTENT_CONCURRENCY batches is held in memory at a time.
+
+        Args:
+            space_key: The space key to fetch pages from
+
+        Yields:
+            Page dicts with id, title, body.storage, ancestors, version
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the
+                Confluence API (401/403)
+        """
+        limit = self.BULK_CONTENT_LIMIT
+        window = self.BULK_CONTENT_CONCURRENCY
+
+        def fetch_batch(start: int) -> dict:
+            logger.debug("Fetching space pages: start=%d, limit=%d", start, limit)
+            return self.confluence.get(
                 "rest/api/content",
                 params={
                     "spaceKey": space_key,
                     "type": "page",
                     "expand": "body.storage,ancestors,version",
-                    "limit": self.BULK_CONTENT_LIMIT,
+                    "limit": limit,
                     "start": start,
                 },
             )
 
-            pages = result.get("results", [])
-            all_pages.extend(pages)
-            logger.info(f"Fetched {len(all_pages)} pages so far...")
+        def fetch(start: int) -> list[dict]:
+            result = fetch_batch(start)
+            return [_project_bulk_page(page) for page in result.get("results", [])]
+
+        # The content endpoint does not report a total, so probe the first batch
+        # and then fetch the following offsets a window at a time until one
+        # comes back short. A batch is only short relative to the page size the
+        # server actually applied, which may be below the one requested.
+        result = fetch_batch(0)
+        limit = min(limit, result.get("limit") or limit)
+        pages = [_project_bulk_page(page) for page in result.get("results", [])]
+        del result
+        yield from pages
+        fetched = len(pages)
+        done = fetched < limit
+        start = fetched
+
+        while not done:
+            starts = [start + i * limit for i in range(window)]
+            for pages in map_concurrently(fetch, starts, max_workers=window):
+                yield from pages
+                fetched += len(pages)
+                if len(pages) < limit:
+                    done = True
+                    break
+            start += window * limit
+            logger.info("Fetched %d pages so far...", fetched)
 
-            # Check pagination
-            if len(pages) == 0 or len(pages) < self.BULK_CONTENT_LIMIT:
-                break
+    @handle_atlassian_api_errors("Confluence API")
+    def search_all_with_content(
+        self, cql: str, spaces_filter: str | None = None
+    ) -> list[dict]:
+        """
+        Search all content using CQL, with content, ancestors and version.
 
-            start += len(pages)
+        Uses /rest/api/content/search with expand, so a single paginated request
+        returns what would otherwise take a content and an ancestors request per
+        page.
 
-        logger.info(f"Fetched {len(all_pages)} pages with content from space {space_key}")
-        return all_pages
+        Args:
+            cql: Confluence Query Language string
+            spaces_filter: Optional comma-separated list of space keys to filter by
+
+        Returns:
+            List of page dicts with id, title, space, body.storage, ancestors,
+            version, in the same shape as get_all_space_pages_with_content
+        """
+        pages = list(self.iter_search_all_with_content(cql, spaces_filter))
+        logger.info(f"Fetched {len(pages)} pages with content for CQL search")
+        return pages
+
+    def iter_search_all_with_content(
+        self, cql: str, spaces_filter: str | None = None
+    ) -> Iterator[dict]:
+        """
+        Iterate over all content matching a CQL query, with content expanded.
+
+        Streaming counterpart of search_all_with_content. Batches are fetched
+        one after another, following the next link of each response.
+
+        Args:
+            cql: Confluence Query Language string
+            spaces_filter: Optional comma-separated list of space keys to filter by
+
+        Yields:
+            Page dicts with id, title, space, body.storage, ancestors, version
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the
+                Confluence API (401/403)
+        """
+        params = {
+            "cql": self._apply_spaces_filter(cql, spaces_filter),
+            "expand": "body.storage,ancestors,version,space",
+            "limit": self.BULK_CONTENT_LIMIT,
+        }
+        while True:
+            result = self.confluence.get("rest/api/content/search", params=params) or {}
+            pages = result.get("results", [])
+            for page in pages:
+                yield _project_bulk_page(page)
+
+            next_link = result.get("_links", {}).get("next")
+            if not pages or not next_link:
+                return
+            # Cloud pages with an opaque cursor and Server/DC with start; both
+            # come in the next link's query string
+            params = {**params, **dict(parse_qsl(urlsplit(next_link).query))}
+
+    # Largest page the user search endpoint serves per request
+    MAX_USER_SEARCH_LIMIT = 200
 
     @handle_atlassian_api_errors("Confluence API")
     def search_user(
@@ -218,13 +565,42 @@ class SearchMixin(ConfluenceClient):
             MCPAtlassianAuthenticationError: If authentication fails with the
                 Confluence API (401/403)
         """
-        # Execute the user search query using the direct API endpoint
-        results = self.confluence.get(
-            "rest/api/search/user", params={"cql": cql, "limit": limit}
-        )
+        page_limit = self.MAX_USER_SEARCH_LIMIT
+        if limit <= page_limit:
+            # Execute the user search query using the direct API endpoint
+            results = self.confluence.get(
+                "rest/api/search/user", params={"cql": cql, "limit": limit}
+            )
+        else:
+            results = self._search_user_batched(cql, limit, page_limit)
 
         # Convert the response to a user search result model
         search_result = ConfluenceUserSearchResults.from_api_response(results or {})
 
         # Return the list of user search results
         return search_result.results
+
+    def _search_user_batched(self, cql: str, limit: int, page_limit: int) -> dict:
+        """Fetch more users than one request allows, merging the raw results.
+
+        The first batch is fetched alone; the remaining offsets are only
+        requested (concurrently) if it came back full.
+        """
+
+        def fetch(start: int) -> list[dict]:
+            result = self.confluence.get(
+                "rest/api/search/user",
+                params={
+                    "cql": cql,
+                    "limit": min(page_limit, limit - start),
+                    "start": start,
+                },
+            )
+            return (result or {}).get("results", [])
+
+        merged = fetch(0)
+        if len(merged) >= page_limit:
+            starts = list(range(page_limit, limit, page_limit))
+            for batch in map_concurrently(fetch, starts):
+                merged.extend(batch)
+        return {"results": merged[:limit]}
@@ -1,11 +1,41 @@
 """Utility functions specific to Confluence operations."""
 
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
 
 from .constants import RESERVED_CQL_WORDS
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Default upper bound on threads used for concurrent API calls / preprocessing
+MAX_CONCURRENT_WORKERS = 8
+
+
+def map_concurrently(
+    func: Callable[[_T], _R],
+    items: list[_T],
+    max_workers: int = MAX_CONCURRENT_WORKERS,
+) -> list[_R]:
+    """Apply func to each item, using a small thread pool for multiple items.
+
+    Args:
+        func: Function to apply; must be safe to call from several threads
+        items: Items to process
+        max_workers: Upper bound on the number of threads
+
+    Returns:
+        Results in the same order as items
+    """
+    if len(items) <= 1 or max_workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
 
 def quote_cql_identifier_if_needed(identifier: str) -> str:
     """
@@ -2,3 +2,9 @@ class MCPAtlassianAuthenticationError(Exception):
     """Raised when Atlassian API authentication fails (401/403)."""
 
     pass
+
+
+class ConfluenceVersionConflictError(Exception):
+    """Raised when a page update is based on an outdated version (409)."""
+
+    pass
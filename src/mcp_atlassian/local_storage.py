@@ -1,38 +1,31 @@
 """Local storage module for caching Confluence spaces on the filesystem as a tree."""
 
-import json
+import functools
+import hashlib
 import logging
 import os
 import re
+import threading
 import unicodedata
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from bs4 import BeautifulSoup
+import anyio
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
 
-logger = logging.getLogger(__name__)
-
-
-def sanitize_filename(title: str, max_length: int = 100) -> str:
-    """Sanitize a page title for use as a filename.
+from . import metadata_cache
+from .utils import fast_json
+from .utils.io import file_signature
 
-    Args:
-        title: The page title to sanitize
-        max_length: Maximum length of the resulting filename (default 100)
+logger = logging.getLogger(__name__)
 
-    Returns:
-        A safe filename string
-    """
-    # Normalize unicode characters (e.g., é -> e)
-    normalized = unicodedata.normalize("NFKD", title)
-    # Keep only ASCII characters (remove accents etc.)
-    ascii_only = normalized.encode("ascii", "ignore").decode("ascii")
 
-    # Replace problematic characters with safe alternatives
-    # These characters are not allowed in filenames on various systems
-    replacements = {
+# Characters not allowed in filenames on various systems, and their replacements
+_FILENAME_TRANSLATION = str.maketrans(
+    {
         "/": "-",
         "\\": "-",
         ":": "-",
@@ -46,8 +39,32 @@ def sanitize_filename(title: str, max_length: int = 100) -> str:
         "\r": " ",
         "\t": " ",
     }
-    for char, replacement in replacements.items():
-        ascii_only = ascii_only.replace(char, replacement)
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def sanitize_filename(title: str, max_length: int = 100) -> str:
+    """Sanitize a page title for use as a filename.
+
+    Results are cached, since the same titles recur across ancestor paths
+    and re-syncs.
+
+    Args:
+        title: The page title to sanitize
+        max_length: Maximum length of the resulting filename (default 100)
+
+    Returns:
+        A safe filename string
+    """
+    ascii_only = title
+    if not title.isascii():
+        # Normalize unicode characters (e.g., é -> e)
+        normalized = unicodedata.normalize("NFKD", title)
+        # Keep only ASCII characters (remove accents etc.)
+        ascii_only = normalized.encode("ascii", "ignore").decode("ascii")
+
+    # Replace problematic characters with safe alternatives
+    ascii_only = ascii_only.translate(_FILENAME_TRANSLATION)
 
     # Replace multiple spaces/dashes with single ones
     sanitized = re.sub(r"[\s]+", " ", ascii_only)
@@ -69,6 +86,13 @@ def sanitize_filename(title: str, max_length: int = 100) -> str:
 # Base directory for local storage (relative to current working directory)
 LOCAL_STORAGE_DIR = ".better-confluence-mcp"
 
+# Serializes read-modify-write updates of the cross-space page index
+_page_index_lock = threading.Lock()
+
+# Last page index read: index path -> (file signature, index). The index is
+# replaced atomically on every save, so a changed signature means new data.
+_page_index_cache: dict[Path, tuple[tuple, dict[str, Any]]] = {}
+
 
 @dataclass
 class PageNode:
@@ -83,29 +107,84 @@ class PageNode:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
+        result = self._fields_dict()
+        _dump_tree(self.children, result["children"])
+        return result
+
+    def _fields_dict(self) -> dict:
+        """Serialize this node's own fields, with an empty children dict."""
         return {
             "page_id": self.page_id,
             "title": self.title,
             "version": self.version,
             "url": self.url,
             "last_synced": self.last_synced,
-            "children": {k: v.to_dict() for k, v in self.children.items()},
+            "children": {},
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "PageNode":
         """Create from dictionary."""
-        children = {k: cls.from_dict(v) for k, v in data.get("children", {}).items()}
+        node = cls._from_fields(data)
+        node.children = _load_tree(data.get("children", {}))
+        return node
+
+    @classmethod
+    def _from_fields(cls, data: dict) -> "PageNode":
+        """Create a node from its own fields, without children."""
         return cls(
             page_id=data["page_id"],
             title=data["title"],
             version=data.get("version"),
             url=data["url"],
             last_synced=data["last_synced"],
-            children=children,
         )
 
 
+# Page trees are walked with an explicit stack rather than recursion, so deep
+# spaces cannot hit the interpreter's recursion limit.
+
+
+def _dump_tree(nodes: dict[str, PageNode], out: dict[str, dict]) -> dict[str, dict]:
+    """Serialize a level of the page tree, and everything below it, into out."""
+    stack = [(nodes, out)]
+    while stack:
+        level, level_out = stack.pop()
+        for key, node in level.items():
+            node_out = level_out[key] = node._fields_dict()
+            if node.children:
+                stack.append((node.children, node_out["children"]))
+    return out
+
+
+def _load_tree(data: dict[str, dict]) -> dict[str, PageNode]:
+    """Create a level of the page tree, and everything below it, from dicts."""
+    nodes: dict[str, PageNode] = {}
+    stack = [(data, nodes)]
+    while stack:
+        level_data, level = stack.pop()
+        for key, node_data in level_data.items():
+            node = level[key] = PageNode._from_fields(node_data)
+            children_data = node_data.get("children")
+            if children_data:
+                stack.append((children_data, node.children))
+    return nodes
+
+
+# Column order for page_index rows in the JSON form of SpaceMetadata. Storing
+# one list per page instead of a dict avoids repeating every key name.
+_PAGE_INDEX_SCHEMA = (
+    "title",
+    "version",
+    "url",
+    "path",
+    "ancestors",
+    "last_synced",
+    "content_hash",
+    "file_state",
+)
+
+
 @dataclass
 class SpaceMetadata:
     """Metadata for a locally stored space with tree structure."""
@@ -118,6 +197,27 @@ class SpaceMetadata:
     page_tree: dict[str, PageNode] = field(default_factory=dict)
     # Flat index for quick lookup by page_id -> {title, version, url, path, ancestors}
     page_index: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # Every node in page_tree by page_id, for in-place tree updates (not serialized)
+    page_nodes: dict[str, PageNode] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # IDs of pages changed since the metadata was loaded from or saved to the
+    # space database. None means the database must be rewritten in full.
+    changed_pages: set[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        stack = list(self.page_tree.values())
+        while stack:
+            node = stack.pop()
+            self.page_nodes[node.page_id] = node
+            stack.extend(node.children.values())
+
+    def mark_changed(self, *page_ids: str) -> None:
+        """Record page_index entries added, updated or removed in place."""
+        if self.changed_pages is not None:
+            self.changed_pages.update(page_ids)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -126,24 +226,67 @@ class SpaceMetadata:
             "space_name": self.space_name,
             "last_synced": self.last_synced,
             "total_pages": self.total_pages,
-            "page_tree": {k: v.to_dict() for k, v in self.page_tree.items()},
-            "page_index": self.page_index,
+            "page_tree": _dump_tree(self.page_tree, {}),
+            "page_index_schema": list(_PAGE_INDEX_SCHEMA),
+            "page_index_rows": {
+                page_id: [info.get(column) for column in _PAGE_INDEX_SCHEMA]
+                for page_id, info in self.page_index.items()
+            },
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "SpaceMetadata":
         """Create from dictionary."""
-        page_tree = {k: PageNode.from_dict(v) for k, v in data.get("page_tree", {}).items()}
+        page_tree = _load_tree(data.get("page_tree", {}))
+        if "page_index_rows" in data:
+            schema = data["page_index_schema"]
+            page_index = {
+                page_id: dict(zip(schema, row, strict=True))
+                for page_id, row in data["page_index_rows"].items()
+            }
+        else:
+            # Metadata written before the row format
+            page_index = data.get("page_index", {})
         return cls(
             space_key=data["space_key"],
             space_name=data["space_name"],
             last_synced=data["last_synced"],
             total_pages=data["total_pages"],
             page_tree=page_tree,
-            page_index=data.get("page_index", {}),
+            page_index=page_index,
         )
 
 
+# Inline formatting tags that typically need space around them
+_INLINE_TAGS = r"(?:strong|em|b|i|u|code|span|a)"
+
+# All spacing rules fused into one scan. Each alternative matches the character
+# or closing tag that needs a trailing space and only *looks ahead* at what
+# follows, so adjacent fixes (e.g. "</a>-<b>") cannot consume each other:
+#   word/dash directly before an inline opening tag:  "on<strong>" -> "on <strong>"
+#   inline closing tag directly before word/dash:     "</a>- x"    -> "</a> - x"
+_FIX_SPACING_RE = re.compile(
+    rf"[\w-](?=<{_INLINE_TAGS}[\s>])|</{_INLINE_TAGS}>(?=[\w-])",
+    re.IGNORECASE,
+)
+
+# Runs of whitespace in text nodes, collapsed to a single space
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Block-level elements that should be on their own line
+BLOCK_ELEMENTS = frozenset({
+    'html', 'head', 'body', 'div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'ul', 'ol', 'li', 'table', 'tr', 'td', 'th', 'thead', 'tbody', 'tfoot',
+    'form', 'fieldset', 'section', 'article', 'header', 'footer', 'nav',
+    'aside', 'main', 'figure', 'figcaption', 'blockquote', 'pre', 'hr', 'br',
+    'ac:layout', 'ac:layout-section', 'ac:layout-cell', 'ac:structured-macro',
+    'ac:rich-text-body', 'ac:parameter', 'ac:plain-text-body'
+})
+
+# Elements that should preserve their raw content (including CDATA)
+PRESERVE_CONTENT_ELEMENTS = frozenset({'ac:plain-text-body'})
+
+
 def fix_html_spacing(html_content: str) -> str:
     """Fix spacing issues in HTML content.
 
@@ -151,44 +294,7 @@ def fix_html_spacing(html_content: str) -> str:
     Example: 'Click on<strong>Button</strong>' -> 'Click on <strong>Button</strong>'
     Example: '</a>- text' -> '</a> - text'
     """
-    # Inline formatting tags that typically need space before them
-    inline_tags = r"(?:strong|em|b|i|u|code|span|a)"
-
-    # Add space before opening tag if preceded by word character (not already spaced)
-    # Match: word char + < + tag (no space between)
-    html_content = re.sub(
-        rf"(\w)(<{inline_tags}[\s>])",
-        r"\1 \2",
-        html_content,
-        flags=re.IGNORECASE,
-    )
-
-    # Add space after closing tag if followed by word character (not already spaced)
-    # Match: </tag> + word char (no space between)
-    html_content = re.sub(
-        rf"(</{inline_tags}>)(\w)",
-        r"\1 \2",
-        html_content,
-        flags=re.IGNORECASE,
-    )
-
-    # Add space after closing tag if followed by dash (e.g., "</a>- text" -> "</a> - text")
-    html_content = re.sub(
-        rf"(</{inline_tags}>)(-)",
-        r"\1 \2",
-        html_content,
-        flags=re.IGNORECASE,
-    )
-
-    # Add space before opening tag if preceded by dash (e.g., "-<strong>" -> "- <strong>")
-    html_content = re.sub(
-        rf"(-)(<{inline_tags}[\s>])",
-        r"\1 \2",
-        html_content,
-        flags=re.IGNORECASE,
-    )
-
-    return html_content
+    return _FIX_SPACING_RE.sub(r"\g<0> ", html_content)
 
 
 def prettify_html(html_content: str) -> str:
@@ -197,6 +303,9 @@ def prettify_html(html_content: str) -> str:
     Indents block elements but keeps text inline with its parent tag.
     For example: <p>Text here</p> instead of <p>\n Text here\n</p>
     """
+    if not html_content or html_content.isspace():
+        # Nothing to format (e.g. newly created pages); skip the parse
+        return ""
     try:
         # Fix spacing issues first
         html_content = fix_html_spacing(html_content)
@@ -214,24 +323,9 @@ def _prettify_element(element, indent_level: int = 0) -> str:
     Inline text stays on the same line as its parent tag.
     CDATA sections in ac:plain-text-body are preserved for Confluence code blocks.
     """
-    from bs4 import CData, NavigableString, Tag
-
     indent = "  " * indent_level
     result = []
 
-    # Block-level elements that should be on their own line
-    block_elements = {
-        'html', 'head', 'body', 'div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-        'ul', 'ol', 'li', 'table', 'tr', 'td', 'th', 'thead', 'tbody', 'tfoot',
-        'form', 'fieldset', 'section', 'article', 'header', 'footer', 'nav',
-        'aside', 'main', 'figure', 'figcaption', 'blockquote', 'pre', 'hr', 'br',
-        'ac:layout', 'ac:layout-section', 'ac:layout-cell', 'ac:structured-macro',
-        'ac:rich-text-body', 'ac:parameter', 'ac:plain-text-body'
-    }
-
-    # Elements that should preserve their raw content (including CDATA)
-    preserve_content_elements = {'ac:plain-text-body'}
-
     for child in element.children:
         if isinstance(child, NavigableString):
             # Check if it's CDATA - preserve with wrapper
@@ -244,23 +338,22 @@ def _prettify_element(element, indent_level: int = 0) -> str:
                 if not text.strip():
                     continue
                 # Normalize internal whitespace: collapse runs of whitespace to single space
-                import re
-                text = re.sub(r'\s+', ' ', text)
+                text = _WHITESPACE_RE.sub(" ", text)
                 result.append(text)
         elif isinstance(child, Tag):
             tag_name = child.name.lower() if child.name else ''
-            is_block = tag_name in block_elements
+            is_block = tag_name in BLOCK_ELEMENTS
 
-            # Build opening tag with attributes
-            attrs = []
-            for key, value in child.attrs.items():
-                if isinstance(value, list):
-                    value = ' '.join(value)
-                attrs.append(f'{key}="{value}"')
-            attrs_str = ' ' + ' '.join(attrs) if attrs else ''
+            # Build opening tag with attributes (most tags have none)
+            attrs_str = ''
+            if child.attrs:
+                attrs_str = ''.join(
+                    f' {key}="{" ".join(value) if isinstance(value, list) else value}"'
+                    for key, value in child.attrs.items()
+                )
 
             # Special handling for elements that need raw content preserved (code blocks)
-            if tag_name in preserve_content_elements:
+            if tag_name in PRESERVE_CONTENT_ELEMENTS:
                 # Preserve CDATA content exactly as-is for code blocks
                 inner_content = ""
                 for c in child.children:
@@ -276,27 +369,34 @@ def _prettify_element(element, indent_level: int = 0) -> str:
                 result.append(f"<{child.name}{attrs_str}>{inner_content}</{child.name}>")
                 continue
 
-            # Check if element has only text content (no nested tags)
-            has_only_text = all(
-                isinstance(c, NavigableString) for c in child.children
-            )
-            text_content = child.get_text().strip() if has_only_text else None
-
-            # Check if element contains only inline content (text + inline tags, no block elements)
-            def has_nested_blocks(el):
-                for c in el.children:
-                    if isinstance(c, Tag):
-                        if c.name.lower() in block_elements:
-                            return True
-                return False
-
-            has_block_children = has_nested_blocks(child)
+            # Classify the children in a single pass: is there any child at all,
+            # any nested tag (not only text), any nested block element?
+            child_count = 0
+            has_only_text = True
+            has_block_children = False
+            for c in child.children:
+                child_count += 1
+                if isinstance(c, Tag):
+                    has_only_text = False
+                    if c.name.lower() in BLOCK_ELEMENTS:
+                        has_block_children = True
+                        break
+            has_children = child_count > 0
+
+            text_content = None
+            if has_only_text:
+                if child_count == 1 and type(child.contents[0]) is NavigableString:
+                    # A single plain string: read it directly instead of walking
+                    text_content = str(child.contents[0]).strip()
+                else:
+                    # Several strings, comments or CDATA: let bs4 pick the text
+                    text_content = child.get_text().strip()
 
             if is_block:
                 if has_only_text and text_content:
                     # Block element with only text: <p>text</p>
                     result.append(f"\n{indent}<{child.name}{attrs_str}>{text_content}</{child.name}>")
-                elif not list(child.children):
+                elif not has_children:
                     # Self-closing or empty block element
                     result.append(f"\n{indent}<{child.name}{attrs_str}></{child.name}>")
                 elif not has_block_children:
@@ -318,11 +418,23 @@ def _prettify_element(element, indent_level: int = 0) -> str:
     return ''.join(result)
 
 
+@functools.cache
 def get_storage_path() -> Path:
-    """Get the base storage path."""
+    """Get the base storage path.
+
+    Resolved once per process, as the server never changes its working
+    directory. Use reset_path_caches() after changing it (e.g. in tests).
+    """
     return Path.cwd() / LOCAL_STORAGE_DIR
 
 
+def reset_path_caches() -> None:
+    """Forget cached storage paths, e.g. after changing the working directory."""
+    get_storage_path.cache_clear()
+    get_space_path.cache_clear()
+    _ancestors_path.cache_clear()
+
+
 def ensure_gitignore_entry(auto_add: bool = True) -> None:
     """Ensure the storage directory is in .gitignore.
 
@@ -357,36 +469,58 @@ def ensure_gitignore_entry(auto_add: bool = True) -> None:
 def get_all_synced_spaces() -> list[str]:
     """Get a list of all space keys that have been synced locally.
 
-    Scans the storage directory for _metadata.json files and returns
-    the space keys of all synced spaces.
+    Scans the storage directory for metadata databases (or the
+    _metadata.json files older versions wrote) and returns the space keys of
+    all synced spaces.
 
     Returns:
         List of space keys that have local metadata files.
     """
-    storage_path = get_storage_path()
-    if not storage_path.exists():
-        return []
+    return sorted(
+        entry.name
+        for entry in _scan_space_dirs()
+        if os.path.exists(os.path.join(entry.path, "_metadata.db"))
+        or os.path.exists(os.path.join(entry.path, "_metadata.json"))
+    )
+
+
+def _scan_space_dirs() -> list[os.DirEntry]:
+    """List the directories directly under the storage path.
 
-    synced_spaces = []
-    for space_dir in storage_path.iterdir():
-        if space_dir.is_dir():
-            metadata_file = space_dir / "_metadata.json"
-            if metadata_file.exists():
-                synced_spaces.append(space_dir.name)
+    Uses os.scandir, whose entries already know their file type, so no extra
+    stat call is needed per entry.
 
-    return sorted(synced_spaces)
+    Returns:
+        Directory entries, or an empty list if nothing has been synced yet
+    """
+    try:
+        with os.scandir(get_storage_path()) as entries:
+            return [entry for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
+        return []
 
 
+@functools.lru_cache(maxsize=256)
 def get_space_path(space_key: str) -> Path:
     """Get the path for a specific space."""
     return get_storage_path() / space_key
 
 
 def get_metadata_path(space_key: str) -> Path:
-    """Get the metadata file path for a space."""
+    """Get the path of the metadata database for a space."""
+    return get_space_path(space_key) / "_metadata.db"
+
+
+def get_legacy_metadata_path(space_key: str) -> Path:
+    """Get the path of the JSON metadata file written by older versions."""
     return get_space_path(space_key) / "_metadata.json"
 
 
+def get_page_index_path() -> Path:
+    """Get the path of the cross-space page_id -> space_key index."""
+    return get_storage_path() / "_index.json"
+
+
 def get_page_folder_path(space_key: str, ancestors: list[str], page_id: str) -> Path:
     """Get the folder path for a page based on its ancestors.
 
@@ -398,23 +532,57 @@ def get_page_folder_path(space_key: str, ancestors: list[str], page_id: str) ->
     Returns:
         Path to the page folder
     """
-    space_path = get_space_path(space_key)
     # Build path: space/ancestor1/ancestor2/.../page_id/
-    path = space_path
-    for ancestor_id in ancestors:
-        path = path / ancestor_id
-    path = path / page_id
-    return path
+    return _ancestors_path(space_key, tuple(ancestors)) / page_id
+
+
+@functools.lru_cache(maxsize=4096)
+def _ancestors_path(space_key: str, ancestors: tuple[str, ...]) -> Path:
+    """Get the folder an ancestor chain leads to (shared by sibling pages)."""
+    return get_space_path(space_key).joinpath(*ancestors)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so readers see either the old or the new content in full.
+
+    The data is written and fsynced to a temporary file next to the target,
+    which then replaces it, so a crash mid-write cannot leave a truncated file.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def load_space_metadata(space_key: str) -> SpaceMetadata | None:
-    """Load metadata for a space if it exists."""
-    metadata_path = get_metadata_path(space_key)
-    if not metadata_path.exists():
-        return None
+    """Load metadata for a space if it exists.
+
+    Reads the space database, falling back to the _metadata.json file of
+    spaces not saved since the database was introduced.
+    """
     try:
-        with open(metadata_path, encoding="utf-8") as f:
-            data = json.load(f)
+        stored = metadata_cache.load_space(get_metadata_path(space_key))
+        if stored is not None:
+            space, page_index = stored
+            metadata = SpaceMetadata(
+                **space,
+                page_tree=build_page_tree(page_index.items()),
+                page_index=page_index,
+            )
+            metadata.changed_pages = set()
+            return metadata
+
+        legacy_path = get_legacy_metadata_path(space_key)
+        if not legacy_path.exists():
+            return None
+        with open(legacy_path, "rb") as f:
+            data = fast_json.loads(f.read())
         return SpaceMetadata.from_dict(data)
     except Exception as e:
         logger.error(f"Failed to load metadata for space {space_key}: {e}")
@@ -422,11 +590,101 @@ def load_space_metadata(space_key: str) -> SpaceMetadata | None:
 
 
 def save_space_metadata(metadata: SpaceMetadata) -> None:
-    """Save metadata for a space."""
-    metadata_path = get_metadata_path(metadata.space_key)
+    """Save metadata for a space.
+
+    Only the pages recorded in changed_pages are written, unless the metadata
+    was not loaded from the space database, in which case all pages are.
+    """
+    space_key = metadata.space_key
+    metadata_path = get_metadata_path(space_key)
     metadata_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(metadata_path, "w", encoding="utf-8") as f:
-        json.dump(metadata.to_dict(), f, indent=2, ensure_ascii=False)
+    metadata_cache.save_space(
+        metadata_path,
+        {
+            "space_key": space_key,
+            "space_name": metadata.space_name,
+            "last_synced": metadata.last_synced,
+            "total_pages": metadata.total_pages,
+        },
+        metadata.page_index,
+        metadata.changed_pages,
+    )
+    metadata.changed_pages = set()
+    # The database now holds everything the old JSON file did
+    get_legacy_metadata_path(space_key).unlink(missing_ok=True)
+    _save_page_index(metadata)
+
+
+def _load_page_index() -> dict[str, Any]:
+    """Load the cross-space page index.
+
+    The parsed index is reused until the file changes, and must not be
+    modified by callers.
+
+    Returns:
+        Dict with "spaces" (space keys covered by the index) and "pages"
+        (page_id -> space_key). Both are empty if there is no usable index.
+    """
+    index_path = get_page_index_path()
+    signature = file_signature(index_path)
+    cached = _page_index_cache.get(index_path.absolute())
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    if index_path.exists():
+        try:
+            with open(index_path, "rb") as f:
+                data = fast_json.loads(f.read())
+            index = {"spaces": data["spaces"], "pages": data["pages"]}
+            _page_index_cache[index_path.absolute()] = (signature, index)
+            return index
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable page index {index_path}: {e}")
+    return {"spaces": [], "pages": {}}
+
+
+def _save_page_index(metadata: SpaceMetadata) -> None:
+    """Record the pages of a just-saved space in the cross-space page index."""
+    space_key = metadata.space_key
+    # Spaces can be saved from several threads; don't lose each other's updates
+    with _page_index_lock:
+        index = _load_page_index()
+        # Drop this space's old entries so removed and moved pages don't linger
+        pages = {pid: key for pid, key in index["pages"].items() if key != space_key}
+        pages.update(dict.fromkeys(metadata.page_index, space_key))
+        spaces = sorted({*index["spaces"], space_key})
+        _write_atomic(
+            get_page_index_path(),
+            fast_json.dumps_indented({"spaces": spaces, "pages": pages}),
+        )
+
+
+def page_content_hash(
+    title: str, version: int | None, url: str, html_content: str
+) -> str:
+    """Fingerprint what save_page_html writes for a page, except the sync time.
+
+    Returns:
+        Hex digest stored as "content_hash" in the page index
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (title, str(version), url, html_content):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def page_file_state(file_path: Path | str) -> str | None:
+    """Describe a saved page file by its size and modification time.
+
+    Returns:
+        "size:mtime_ns", stored as "file_state" in the page index, or None
+        if the file does not exist
+    """
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
 
 
 def save_page_html(
@@ -437,6 +695,8 @@ def save_page_html(
     version: int | None,
     url: str,
     ancestors: list[str],
+    prev_hash: str | None = None,
+    prev_file_state: str | None = None,
 ) -> str:
     """Save a page as formatted HTML in tree structure.
 
@@ -448,22 +708,44 @@ def save_page_html(
         version: Page version
         url: Page URL
         ancestors: List of ancestor page IDs (from root to immediate parent)
+        prev_hash: page_content_hash of the page when it was last saved
+        prev_file_state: page_file_state of the file right after that save. If
+            both still match, the file is left untouched; a file edited
+            locally since then no longer matches and is rewritten.
 
     Returns:
         Relative file path
     """
     page_folder = get_page_folder_path(space_key, ancestors, page_id)
-    page_folder.mkdir(parents=True, exist_ok=True)
 
     # Use sanitized title as filename
     safe_title = sanitize_filename(title)
     file_path = page_folder / f"{safe_title}.html"
+    relative_path = str(file_path.relative_to(get_storage_path().parent))
+
+    if (
+        prev_hash
+        and prev_file_state
+        and prev_hash == page_content_hash(title, version, url, html_content)
+        and prev_file_state == page_file_state(file_path)
+    ):
+        logger.debug(f"Page {page_id} unchanged, keeping {file_path.name}")
+        return relative_path
 
-    # Clean up any existing HTML files in the folder (handles title changes)
-    for old_file in page_folder.glob("*.html"):
-        if old_file != file_path:
-            old_file.unlink()
-            logger.debug(f"Removed old HTML file: {old_file.name}")
+    try:
+        page_folder.mkdir(parents=True)
+    except FileExistsError:
+        # Clean up any existing HTML files in the folder (handles title changes).
+        # A folder that was just created has none, so it is not scanned.
+        with os.scandir(page_folder) as entries:
+            old_files = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".html") and entry.name != file_path.name
+            ]
+        for old_file in old_files:
+            os.unlink(old_file)
+            logger.debug(f"Removed old HTML file: {os.path.basename(old_file)}")
 
     # Prettify HTML (block elements indented, text inline)
     pretty_html = prettify_html(html_content)
@@ -483,7 +765,44 @@ def save_page_html(
     with open(file_path, "w", encoding="utf-8") as f:
         f.write(full_content)
 
-    return str(file_path.relative_to(Path.cwd()))
+    return relative_path
+
+
+async def save_page_html_async(
+    space_key: str,
+    page_id: str,
+    title: str,
+    html_content: str,
+    version: int | None,
+    url: str,
+    ancestors: list[str],
+    prev_hash: str | None = None,
+    prev_file_state: str | None = None,
+    limiter: anyio.CapacityLimiter | None = None,
+) -> str:
+    """Save a page like save_page_html, without blocking the event loop.
+
+    The prettifying and file writes run in a worker thread, optionally
+    bounded by a shared capacity limiter.
+
+    Returns:
+        Relative file path
+    """
+    return await anyio.to_thread.run_sync(
+        functools.partial(
+            save_page_html,
+            space_key=space_key,
+            page_id=page_id,
+            title=title,
+            html_content=html_content,
+            version=version,
+            url=url,
+            ancestors=ancestors,
+            prev_hash=prev_hash,
+            prev_file_state=prev_file_state,
+        ),
+        limiter=limiter,
+    )
 
 
 def get_page_info(page_id: str) -> dict | None:
@@ -492,74 +811,152 @@ def get_page_info(page_id: str) -> dict | None:
     Returns:
         Page info dict with space_key, or None if not found.
     """
+    return get_pages_info([page_id]).get(page_id)
+
+
+def get_pages_info(page_ids: Iterable[str]) -> dict[str, dict]:
+    """Find several pages by ID across all synced spaces.
+
+    Each space's metadata is loaded at most once, however many of the pages
+    it holds.
+
+    Args:
+        page_ids: IDs of the pages to look up
+
+    Returns:
+        Dict mapping each page ID found to its page info dict with space_key
+    """
     storage_path = get_storage_path()
     if not storage_path.exists():
-        return None
+        return {}
+
+    page_index = _load_page_index()
+    by_space: dict[str, list[str]] = {}
+    missing: set[str] = set()
+    for page_id in page_ids:
+        space_key = page_index["pages"].get(page_id)
+        if space_key:
+            by_space.setdefault(space_key, []).append(page_id)
+        else:
+            missing.add(page_id)
 
-    for space_dir in storage_path.iterdir():
-        if space_dir.is_dir() and not space_dir.name.startswith("_"):
-            metadata = load_space_metadata(space_dir.name)
+    found: dict[str, dict] = {}
+    for space_key, space_page_ids in by_space.items():
+        metadata = load_space_metadata(space_key)
+        for page_id in space_page_ids:
             if metadata and page_id in metadata.page_index:
-                return {
+                found[page_id] = {
+                    "space_key": space_key,
+                    **metadata.page_index[page_id],
+                }
+            else:
+                missing.add(page_id)
+    if not missing:
+        return found
+
+    # Only spaces not saved since the index was introduced need scanning
+    indexed_spaces = set(page_index["spaces"])
+    for space_dir in _scan_space_dirs():
+        if not missing:
+            break
+        if not space_dir.name.startswith("_") and space_dir.name not in indexed_spaces:
+            metadata = load_space_metadata(space_dir.name)
+            if not metadata:
+                continue
+            for page_id in missing & metadata.page_index.keys():
+                found[page_id] = {
                     "space_key": space_dir.name,
                     **metadata.page_index[page_id],
                 }
-    return None
+                missing.discard(page_id)
+    return found
+
+
+def _index_entry(page: dict) -> dict[str, Any]:
+    """Build the page_index entry for a page dict."""
+    return {
+        "title": page["title"],
+        "version": page.get("version"),
+        "url": page["url"],
+        "path": page["path"],
+        "ancestors": page.get("ancestors", []),
+        "last_synced": page["last_synced"],
+        "content_hash": page.get("content_hash"),
+        "file_state": page.get("file_state"),
+    }
 
 
 def build_page_tree(
-    pages: list[dict],
-) -> tuple[dict[str, PageNode], dict[str, dict[str, Any]]]:
-    """Build a tree structure and flat index from a list of pages.
+    items: Iterable[tuple[str, dict[str, Any]]],
+) -> dict[str, PageNode]:
+    """Build the page tree from page_index entries.
 
     Args:
-        pages: List of page dicts with keys: page_id, title, version, url, ancestors, path, last_synced
+        items: (page_id, index entry) pairs, e.g. page_index.items(). Entries
+            are read in place, no per-page dicts are built.
 
     Returns:
-        Tuple of (page_tree, page_index)
+        The root-level nodes of the tree
     """
-    # First, create all nodes and index
     nodes: dict[str, PageNode] = {}
-    page_index: dict[str, dict[str, Any]] = {}
+    root_nodes: dict[str, PageNode] = {}
+    # Pages whose parent comes later in the index, by parent ID. They sit at the
+    # root level (keeping their position there) until the parent shows up.
+    waiting: dict[str, list[str]] = {}
 
-    for page in pages:
-        page_id = page["page_id"]
-        nodes[page_id] = PageNode(
+    for page_id, info in items:
+        node = nodes[page_id] = PageNode(
             page_id=page_id,
-            title=page["title"],
-            version=page.get("version"),
-            url=page["url"],
-            last_synced=page["last_synced"],
+            title=info["title"],
+            version=info.get("version"),
+            url=info["url"],
+            last_synced=info["last_synced"],
         )
-        page_index[page_id] = {
-            "title": page["title"],
-            "version": page.get("version"),
-            "url": page["url"],
-            "path": page["path"],
-            "ancestors": page.get("ancestors", []),
-            "last_synced": page["last_synced"],
-        }
 
-    # Build tree by assigning children to parents
-    root_nodes: dict[str, PageNode] = {}
+        ancestors = info.get("ancestors")
+        parent = nodes.get(ancestors[-1]) if ancestors else None
+        if parent is not None:
+            parent.children[page_id] = node
+        else:
+            # Root page, or its parent is not (yet) in our set
+            root_nodes[page_id] = node
+            if ancestors:
+                waiting.setdefault(ancestors[-1], []).append(page_id)
 
-    for page in pages:
-        page_id = page["page_id"]
-        ancestors = page.get("ancestors", [])
+        for child_id in waiting.pop(page_id, ()):
+            node.children[child_id] = root_nodes.pop(child_id)
+
+    return root_nodes
 
-        if not ancestors:
-            # This is a root page
-            root_nodes[page_id] = nodes[page_id]
-        else:
-            # Find the immediate parent
-            parent_id = ancestors[-1]
-            if parent_id in nodes:
-                nodes[parent_id].children[page_id] = nodes[page_id]
-            else:
-                # Parent not in our set, treat as root
-                root_nodes[page_id] = nodes[page_id]
 
-    return root_nodes, page_index
+def _detach_node(metadata: SpaceMetadata, page_id: str) -> None:
+    """Unlink a page's node from its parent (or the root level) in page_tree."""
+    ancestors = metadata.page_index[page_id].get("ancestors")
+    parent = metadata.page_nodes.get(ancestors[-1]) if ancestors else None
+    if parent is not None and page_id in parent.children:
+        del parent.children[page_id]
+    else:
+        metadata.page_tree.pop(page_id, None)
+
+
+def _attach_node(
+    metadata: SpaceMetadata, node: PageNode, orphans: dict[str, list[str]]
+) -> None:
+    """Link a node under its immediate parent, or at the root level.
+
+    Pages whose parent is not in the space become roots and are recorded in
+    ``orphans`` under the missing parent's ID, so they can be re-parented if
+    that page is added later.
+    """
+    ancestors = metadata.page_index[node.page_id].get("ancestors")
+    parent_id = ancestors[-1] if ancestors else None
+    parent = metadata.page_nodes.get(parent_id) if parent_id else None
+    if parent is not None:
+        parent.children[node.page_id] = node
+    else:
+        metadata.page_tree[node.page_id] = node
+        if parent_id:
+            orphans.setdefault(parent_id, []).append(node.page_id)
 
 
 def merge_into_metadata(
@@ -570,6 +967,9 @@ def merge_into_metadata(
 ) -> SpaceMetadata:
     """Merge new/updated pages into existing metadata.
 
+    The existing tree is updated in place: changed pages are edited, moved
+    pages are re-linked under their new parent and new pages are spliced in.
+
     Args:
         existing: Existing space metadata (or None for new space)
         new_pages: List of new/updated page dicts
@@ -579,44 +979,78 @@ def merge_into_metadata(
     Returns:
         Merged SpaceMetadata
     """
-    if existing:
-        # Update existing index with new pages
-        merged_index = existing.page_index.copy()
+    if existing is None or len(existing.page_nodes) != len(existing.page_index):
+        # Nothing to update in place, or pages were added to the index without
+        # a tree node: build the tree from the merged index instead
+        merged_index = dict(existing.page_index) if existing else {}
         for page in new_pages:
-            page_id = page["page_id"]
-            merged_index[page_id] = {
-                "title": page["title"],
-                "version": page.get("version"),
-                "url": page["url"],
-                "path": page["path"],
-                "ancestors": page.get("ancestors", []),
-                "last_synced": page["last_synced"],
-            }
-    else:
-        merged_index = {}
-        for page in new_pages:
-            page_id = page["page_id"]
-            merged_index[page_id] = {
-                "title": page["title"],
-                "version": page.get("version"),
-                "url": page["url"],
-                "path": page["path"],
-                "ancestors": page.get("ancestors", []),
-                "last_synced": page["last_synced"],
-            }
+            merged_index[page["page_id"]] = _index_entry(page)
+
+        return SpaceMetadata(
+            space_key=space_key,
+            space_name=space_name,
+            last_synced=datetime.now(timezone.utc).isoformat(),
+            total_pages=len(merged_index),
+            page_tree=build_page_tree(merged_index.items()),
+            page_index=merged_index,
+        )
 
-    # Rebuild tree from merged index
-    all_pages = [{"page_id": pid, **info} for pid, info in merged_index.items()]
-    page_tree, page_index = build_page_tree(all_pages)
-
-    return SpaceMetadata(
-        space_key=space_key,
-        space_name=space_name,
-        last_synced=datetime.now(timezone.utc).isoformat(),
-        total_pages=len(page_index),
-        page_tree=page_tree,
-        page_index=page_index,
-    )
+    nodes = existing.page_nodes
+    index = existing.page_index
+
+    # Root pages whose parent is missing from the space, by missing parent ID
+    orphans: dict[str, list[str]] = {}
+    for page_id in existing.page_tree:
+        ancestors = index[page_id].get("ancestors")
+        if ancestors:
+            orphans.setdefault(ancestors[-1], []).append(page_id)
+
+    for page in new_pages:
+        page_id = page["page_id"]
+        entry = _index_entry(page)
+        node = nodes.get(page_id)
+
+        if node is not None:
+            node.title = entry["title"]
+            node.version = entry["version"]
+            node.url = entry["url"]
+            node.last_synced = entry["last_synced"]
+            existing.mark_changed(page_id)
+            if index[page_id].get("ancestors") == entry["ancestors"]:
+                index[page_id] = entry
+                continue
+            _detach_node(existing, page_id)
+            index[page_id] = entry
+            _attach_node(existing, node, orphans)
+            continue
+
+        node = PageNode(
+            page_id=page_id,
+            title=entry["title"],
+            version=entry["version"],
+            url=entry["url"],
+            last_synced=entry["last_synced"],
+        )
+        index[page_id] = entry
+        nodes[page_id] = node
+        existing.mark_changed(page_id)
+        _attach_node(existing, node, orphans)
+
+        # Adopt root pages that were waiting for this parent
+        for child_id in orphans.pop(page_id, ()):
+            child_ancestors = index[child_id].get("ancestors")
+            if (
+                child_ancestors
+                and child_ancestors[-1] == page_id
+                and child_id in existing.page_tree
+            ):
+                node.children[child_id] = existing.page_tree.pop(child_id)
+
+    existing.space_key = space_key
+    existing.space_name = space_name
+    existing.last_synced = datetime.now(timezone.utc).isoformat()
+    existing.total_pages = len(index)
+    return existing
 
 
 def delete_page_folder(space_key: str, page_id: str, ancestors: list[str]) -> bool:
@@ -674,24 +1108,24 @@ def check_and_cleanup_moved_page(
 
 def cleanup_deleted_pages(
     space_key: str,
-    confluence_page_ids: set[str],
+    confluence_page_ids: Iterable[str],
     existing_metadata: SpaceMetadata,
 ) -> list[str]:
     """Remove local pages that no longer exist in Confluence.
 
     Args:
         space_key: The space key
-        confluence_page_ids: Set of page IDs currently in Confluence
+        confluence_page_ids: Page IDs currently in Confluence, in any iterable
         existing_metadata: Existing space metadata
 
     Returns:
         List of deleted page IDs
     """
     deleted_pages = []
-    local_page_ids = set(existing_metadata.page_index.keys())
 
-    # Find pages that exist locally but not in Confluence
-    orphaned_ids = local_page_ids - confluence_page_ids
+    # Find pages that exist locally but not in Confluence (the key view builds
+    # the one set needed straight from the IDs)
+    orphaned_ids = existing_metadata.page_index.keys() - confluence_page_ids
 
     for page_id in orphaned_ids:
         page_info = existing_metadata.page_index.get(page_id)
@@ -708,7 +1142,10 @@ def remove_pages_from_metadata(
     metadata: SpaceMetadata,
     page_ids_to_remove: list[str],
 ) -> SpaceMetadata:
-    """Remove pages from metadata and rebuild tree.
+    """Remove pages from metadata and update the tree in place.
+
+    Children of a removed page move to the root level, as their parent is no
+    longer part of the space.
 
     Args:
         metadata: The space metadata
@@ -717,23 +1154,30 @@ def remove_pages_from_metadata(
     Returns:
         Updated SpaceMetadata
     """
-    # Remove from index
+    if len(metadata.page_nodes) != len(metadata.page_index):
+        # Tree is out of step with the index: rebuild it from the index
+        for page_id in page_ids_to_remove:
+            metadata.page_index.pop(page_id, None)
+        return SpaceMetadata(
+            space_key=metadata.space_key,
+            space_name=metadata.space_name,
+            last_synced=metadata.last_synced,
+            total_pages=len(metadata.page_index),
+            page_tree=build_page_tree(metadata.page_index.items()),
+            page_index=metadata.page_index,
+        )
+
     for page_id in page_ids_to_remove:
-        if page_id in metadata.page_index:
-            del metadata.page_index[page_id]
-
-    # Rebuild tree
-    all_pages = [{"page_id": pid, **info} for pid, info in metadata.page_index.items()]
-    page_tree, page_index = build_page_tree(all_pages)
-
-    return SpaceMetadata(
-        space_key=metadata.space_key,
-        space_name=metadata.space_name,
-        last_synced=metadata.last_synced,
-        total_pages=len(page_index),
-        page_tree=page_tree,
-        page_index=page_index,
-    )
+        if page_id not in metadata.page_index:
+            continue
+        _detach_node(metadata, page_id)
+        node = metadata.page_nodes.pop(page_id)
+        metadata.page_tree.update(node.children)
+        del metadata.page_index[page_id]
+        metadata.mark_changed(page_id)
+
+    metadata.total_pages = len(metadata.page_index)
+    return metadata
 
 
 def get_attachments_folder_path(space_key: str, ancestors: list[str], page_id: str) -> Path:
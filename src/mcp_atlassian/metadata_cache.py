@@ -0,0 +1,217 @@
+"""SQLite storage for the metadata of locally synced spaces.
+
+Each space keeps its page index in a small SQLite database next to its pages,
+so a sync that changed a handful of pages only writes those rows instead of
+rewriting the metadata of the whole space.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from .utils.io import file_signature
+
+logger = logging.getLogger(__name__)
+
+# Bump when the schema changes. Databases written with another version are
+# dropped on open, and the space is synced from scratch.
+CACHE_VERSION = 1
+
+# Page index fields, in column order. Ancestors are stored as a JSON list. Table
+# and column names in the queries below all come from these constants.
+PAGE_COLUMNS = (
+    "title",
+    "version",
+    "url",
+    "path",
+    "ancestors",
+    "last_synced",
+    "content_hash",
+    "file_state",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS space (
+    space_key TEXT PRIMARY KEY,
+    space_name TEXT NOT NULL,
+    last_synced TEXT NOT NULL,
+    total_pages INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    page_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    version INTEGER,
+    url TEXT NOT NULL,
+    path TEXT NOT NULL,
+    ancestors TEXT NOT NULL,
+    last_synced TEXT NOT NULL,
+    content_hash TEXT,
+    file_state TEXT
+);
+"""
+
+_SELECT_PAGES = f"SELECT page_id, {', '.join(PAGE_COLUMNS)} FROM pages ORDER BY rowid"  # noqa: S608
+
+_UPSERT_PAGE = (
+    f"INSERT INTO pages (page_id, {', '.join(PAGE_COLUMNS)}) "  # noqa: S608
+    f"VALUES ({', '.join('?' * (len(PAGE_COLUMNS) + 1))}) "
+    "ON CONFLICT(page_id) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in PAGE_COLUMNS)
+)
+
+
+# Spaces already read: database path -> (file signature, space, page_index).
+# A database is only queried again once its files change or it is saved.
+_loaded: dict[Path, tuple[tuple, dict[str, Any], dict[str, dict]]] = {}
+_loaded_lock = threading.Lock()
+# Counts saves, so a read that overlapped one is not cached
+_saves = 0
+
+
+def _db_signature(db_path: Path) -> tuple:
+    """Describe a database's files; in WAL mode commits go to the -wal file."""
+    return file_signature(db_path, db_path.with_name(f"{db_path.name}-wal"))
+
+
+def _copy_page_index(page_index: dict[str, dict]) -> dict[str, dict]:
+    """Copy a page index deeply enough that callers can modify the copy."""
+    return {
+        page_id: {**info, "ancestors": list(info["ancestors"])}
+        for page_id, info in page_index.items()
+    }
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    """Open a space database, creating or resetting its schema as needed."""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode this syncs at checkpoints instead of on every commit; a
+        # power loss can only drop the latest saves, which the next sync redoes
+        conn.execute("PRAGMA synchronous=NORMAL")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != CACHE_VERSION:
+            if version:
+                logger.info(
+                    f"Dropping metadata cache {db_path} written with version "
+                    f"{version} (current: {CACHE_VERSION})"
+                )
+            conn.executescript(
+                "DROP TABLE IF EXISTS space; DROP TABLE IF EXISTS pages;"
+                f"{_SCHEMA}PRAGMA user_version = {CACHE_VERSION};"
+            )
+    except Exception:
+        conn.close()
+        raise
+    return conn
+
+
+def _page_row(page_id: str, info: dict[str, Any]) -> tuple:
+    """Build the pages table row for a page_index entry."""
+    return (
+        page_id,
+        info["title"],
+        info.get("version"),
+        info["url"],
+        info["path"],
+        json.dumps(info.get("ancestors") or []),
+        info["last_synced"],
+        info.get("content_hash"),
+        info.get("file_state"),
+    )
+
+
+def load_space(db_path: Path) -> tuple[dict[str, Any], dict[str, dict]] | None:
+    """Load a space's fields and page index from its database.
+
+    Args:
+        db_path: Path of the space database
+
+    Returns:
+        (space fields, page_id -> page_index entry), or None if the database
+        does not exist or holds no space yet
+    """
+    if not db_path.exists():
+        return None
+    key = db_path.absolute()
+    signature = _db_signature(db_path)
+    with _loaded_lock:
+        cached = _loaded.get(key)
+        saves_seen = _saves
+    if cached is not None and cached[0] == signature:
+        return dict(cached[1]), _copy_page_index(cached[2])
+
+    with closing(_connect(db_path)) as conn:
+        space_row = conn.execute(
+            "SELECT space_key, space_name, last_synced, total_pages FROM space"
+        ).fetchone()
+        if space_row is None:
+            return None
+        space = dict(
+            zip(
+                ("space_key", "space_name", "last_synced", "total_pages"),
+                space_row,
+                strict=True,
+            )
+        )
+        # Rows come back in insertion order, so parents mostly precede children
+        page_index = {}
+        for page_id, *values in conn.execute(_SELECT_PAGES):
+            entry = dict(zip(PAGE_COLUMNS, values, strict=True))
+            entry["ancestors"] = json.loads(entry["ancestors"])
+            page_index[page_id] = entry
+    with _loaded_lock:
+        if _saves == saves_seen:
+            _loaded[key] = (signature, space, page_index)
+    return dict(space), _copy_page_index(page_index)
+
+
+def save_space(
+    db_path: Path,
+    space: dict[str, Any],
+    page_index: dict[str, dict],
+    changed_pages: Iterable[str] | None = None,
+) -> None:
+    """Write a space's fields and pages to its database in one transaction.
+
+    Args:
+        db_path: Path of the space database
+        space: The space_key, space_name, last_synced and total_pages fields
+        page_index: The full page_id -> page_index entry mapping
+        changed_pages: IDs of pages added, updated or removed since the
+            database was last written. None rewrites every page.
+    """
+    with closing(_connect(db_path)) as conn, conn:
+        conn.execute("DELETE FROM space")
+        conn.execute(
+            "INSERT INTO space (space_key, space_name, last_synced, total_pages) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                space["space_key"],
+                space["space_name"],
+                space["last_synced"],
+                space["total_pages"],
+            ),
+        )
+        if changed_pages is None:
+            conn.execute("DELETE FROM pages")
+            changed_pages = page_index
+        removed = []
+        upserts = []
+        for page_id in changed_pages:
+            info = page_index.get(page_id)
+            if info is None:
+                removed.append((page_id,))
+            else:
+                upserts.append(_page_row(page_id, info))
+        conn.executemany("DELETE FROM pages WHERE page_id = ?", removed)
+        conn.executemany(_UPSERT_PAGE, upserts)
+    global _saves
+    with _loaded_lock:
+        _saves += 1
+        _loaded.pop(db_path.absolute(), None)
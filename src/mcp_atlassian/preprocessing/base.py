@@ -52,15 +52,7 @@ class BasePreprocessor:
             Tuple of (processed_html, processed_markdown)
         """
         try:
-            # Parse the HTML content
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # Process user mentions
-            self._process_user_mentions_in_soup(soup, confluence_client)
-            self._process_user_profile_macros_in_soup(soup, confluence_client)
-
-            # Convert to string and markdown
-            processed_html = str(soup)
+            processed_html = self._process_html(html_content, confluence_client)
             processed_markdown = md(processed_html)
 
             return processed_html, processed_markdown
@@ -69,6 +61,60 @@ class BasePreprocessor:
             logger.error(f"Error in process_html_content: {str(e)}")
             raise
 
+    def process_html_content_single(
+        self,
+        html_content: str,
+        space_key: str = "",
+        confluence_client: ConfluenceClient | None = None,
+        *,
+        to_markdown: bool = True,
+    ) -> str:
+        """
+        Process HTML content and return only the requested representation.
+
+        Unlike process_html_content, the markdown conversion is skipped
+        entirely when only HTML is requested.
+
+        Args:
+            html_content: The HTML content to process
+            space_key: Optional space key for context
+            confluence_client: Optional Confluence client for user lookups
+            to_markdown: Return markdown when True, processed HTML otherwise
+                (keyword-only)
+
+        Returns:
+            The processed markdown or HTML string
+        """
+        try:
+            processed_html = self._process_html(html_content, confluence_client)
+            return md(processed_html) if to_markdown else processed_html
+
+        except Exception as e:
+            logger.error(f"Error in process_html_content_single: {str(e)}")
+            raise
+
+    def _process_html(
+        self, html_content: str, confluence_client: ConfluenceClient | None = None
+    ) -> str:
+        """
+        Parse HTML and replace user mentions and profile macros.
+
+        Args:
+            html_content: The HTML content to process
+            confluence_client: Optional Confluence client for user lookups
+
+        Returns:
+            The processed HTML string
+        """
+        # Parse the HTML content
+        soup = BeautifulSoup(html_content, "html.parser")
+
+        # Process user mentions
+        self._process_user_mentions_in_soup(soup, confluence_client)
+        self._process_user_profile_macros_in_soup(soup, confluence_client)
+
+        return str(soup)
+
     def _process_user_mentions_in_soup(
         self, soup: BeautifulSoup, confluence_client: ConfluenceClient | None = None
     ) -> None:
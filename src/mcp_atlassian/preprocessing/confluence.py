@@ -1,7 +1,6 @@
 """Confluence-specific text preprocessing module."""
 
 import logging
-import shutil
 import tempfile
 from pathlib import Path
 
@@ -29,6 +28,33 @@ class ConfluencePreprocessor(BasePreprocessor):
             base_url: Base URL for Confluence API
         """
         super().__init__(base_url=base_url)
+        # Conversion scaffolding is built lazily once and reused across calls
+        self._converter_options: dict[bool, ConfluenceConverterOptions] = {}
+        self._temp_dir: tempfile.TemporaryDirectory[str] | None = None
+
+    def _get_converter_options(
+        self, *, enable_heading_anchors: bool
+    ) -> ConfluenceConverterOptions:
+        """Return cached converter options for the given heading-anchor setting."""
+        options = self._converter_options.get(enable_heading_anchors)
+        if options is None:
+            options = ConfluenceConverterOptions(
+                ignore_invalid_url=True,
+                heading_anchors=enable_heading_anchors,
+                render_mermaid=False,
+            )
+            self._converter_options[enable_heading_anchors] = options
+        return options
+
+    def _get_temp_dir(self) -> Path:
+        """Return a scratch directory shared by all conversions of this instance.
+
+        The directory is removed when the preprocessor is garbage collected
+        or the interpreter exits.
+        """
+        if self._temp_dir is None:
+            self._temp_dir = tempfile.TemporaryDirectory()
+        return Path(self._temp_dir.name)
 
     def markdown_to_confluence_storage(
         self, markdown_content: str, *, enable_heading_anchors: bool = False
@@ -47,38 +73,27 @@ class ConfluencePreprocessor(BasePreprocessor):
             # First convert markdown to HTML
             html_content = markdown_to_html(markdown_content)
 
-            # Create a temporary directory for any potential attachments
-            temp_dir = tempfile.mkdtemp()
-
-            try:
-                # Parse the HTML into an element tree
-                root = elements_from_string(html_content)
-
-                # Create converter options
-                options = ConfluenceConverterOptions(
-                    ignore_invalid_url=True,
-                    heading_anchors=enable_heading_anchors,
-                    render_mermaid=False,
-                )
-
-                # Create a converter
-                converter = ConfluenceStorageFormatConverter(
-                    options=options,
-                    path=Path(temp_dir) / "temp.md",
-                    root_dir=Path(temp_dir),
-                    page_metadata={},
-                )
-
-                # Transform the HTML to Confluence storage format
-                converter.visit(root)
-
-                # Convert the element tree back to a string
-                storage_format = elements_to_string(root)
-
-                return str(storage_format)
-            finally:
-                # Clean up the temporary directory
-                shutil.rmtree(temp_dir, ignore_errors=True)
+            # Parse the HTML into an element tree
+            root = elements_from_string(html_content)
+
+            # Create a converter (it carries per-document state, so not reused)
+            temp_dir = self._get_temp_dir()
+            converter = ConfluenceStorageFormatConverter(
+                options=self._get_converter_options(
+                    enable_heading_anchors=enable_heading_anchors
+                ),
+                path=temp_dir / "temp.md",
+                root_dir=temp_dir,
+                page_metadata={},
+            )
+
+            # Transform the HTML to Confluence storage format
+            converter.visit(root)
+
+            # Convert the element tree back to a string
+            storage_format = elements_to_string(root)
+
+            return str(storage_format)
 
         except Exception as e:
             logger.error(f"Error converting markdown to Confluence storage format: {e}")
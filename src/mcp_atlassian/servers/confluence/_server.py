@@ -1,8 +1,11 @@
 """Confluence MCP server instance and shared utilities."""
 
-import asyncio
 import logging
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
+import anyio
 from fastmcp import FastMCP
 
 logger = logging.getLogger(__name__)
@@ -16,16 +19,88 @@ confluence_mcp = FastMCP(
 # Auto full sync interval (3 days)
 AUTO_FULL_SYNC_DAYS = 3
 
-# Per-space locks to prevent concurrent sync operations on the same space
-_space_locks: dict[str, asyncio.Lock] = {}
 
+class SpaceLock:
+    """Readers-writer lock guarding one space's local files and metadata.
 
-def get_space_lock(space_key: str) -> asyncio.Lock:
+    Syncs and other writes hold it exclusively. Readers of the synced
+    metadata share it, so they only wait while a write is running or queued
+    (waiting writers go first, so a stream of readers can't starve a sync).
+
+    The lock is not reentrant: taking read() while already holding it can
+    deadlock once a writer is queued, and write() inside either mode always
+    does.
+    """
+
+    def __init__(self) -> None:
+        self._condition = anyio.Condition()
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+        # Number of times write() has been acquired; lets callers tell whether
+        # another write started while they were waiting
+        self.writes_started = 0
+        # writes_started value of the write during which the space was last
+        # synced successfully; other writes don't fetch from Confluence
+        self.last_sync_write = 0
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[None]:
+        """Hold the lock shared with other readers."""
+        async with self._condition:
+            while self._writing or self._writers_waiting:
+                await self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with anyio.CancelScope(shield=True):
+                async with self._condition:
+                    self._readers -= 1
+                    self._condition.notify_all()
+
+    def mark_synced(self) -> None:
+        """Record that the space was synced during the current write."""
+        self.last_sync_write = self.writes_started
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[None]:
+        """Hold the lock exclusively."""
+        async with self._condition:
+            self._writers_waiting += 1
+            try:
+                while self._writing or self._readers:
+                    await self._condition.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writing = True
+            self.writes_started += 1
+        try:
+            yield
+        finally:
+            with anyio.CancelScope(shield=True):
+                async with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+
+# Per-space locks to prevent concurrent sync operations on the same space.
+# Held weakly: a lock nobody is holding or waiting on is dropped, so the
+# mapping doesn't grow with every space ever touched.
+_space_locks: weakref.WeakValueDictionary[str, SpaceLock] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def get_space_lock(space_key: str) -> SpaceLock:
     """Get or create a lock for a specific space.
 
     This prevents race conditions when multiple tools try to sync
     the same space concurrently (e.g., parallel read_page calls).
+    Lookup and creation happen without yielding to the event loop, so
+    every caller for a space gets the same lock.
     """
-    if space_key not in _space_locks:
-        _space_locks[space_key] = asyncio.Lock()
-    return _space_locks[space_key]
+    lock = _space_locks.get(space_key)
+    if lock is None:
+        lock = _space_locks[space_key] = SpaceLock()
+    return lock
@@ -1,6 +1,5 @@
 """Confluence attachment tools - download_attachments, upload_attachment, create_mermaid_diagram."""
 
-import json
 import logging
 import os
 from pathlib import Path
@@ -14,6 +13,7 @@ from mcp_atlassian.local_storage import (
     get_page_info,
 )
 from mcp_atlassian.servers.dependencies import get_confluence_fetcher
+from mcp_atlassian.utils import fast_json
 from mcp_atlassian.utils.decorators import check_write_access
 
 from ._server import confluence_mcp
@@ -55,13 +55,11 @@ async def download_attachments(
     page_info = get_page_info(page_id)
 
     if not page_info:
-        return json.dumps(
+        return fast_json.dumps_text(
             {
                 "error": f"Page '{page_id}' not found in local storage.",
                 "hint": "Use sync_space or read_page to sync the page first.",
             },
-            indent=2,
-            ensure_ascii=False,
         )
 
     space_key = page_info["space_key"]
@@ -75,15 +73,13 @@ async def download_attachments(
         attachments = attachments_response.get("results", [])
 
         if not attachments:
-            return json.dumps(
+            return fast_json.dumps_text(
                 {
                     "success": True,
                     "page_id": page_id,
                     "message": "No attachments found on this page.",
                     "downloaded": [],
                 },
-                indent=2,
-                ensure_ascii=False,
             )
 
         # Ensure attachments folder exists
@@ -118,14 +114,12 @@ async def download_attachments(
             "downloaded": downloaded,
         }
 
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return fast_json.dumps_text(result)
 
     except Exception as e:
         logger.error(f"Failed to download attachments for page {page_id}: {e}")
-        return json.dumps(
+        return fast_json.dumps_text(
             {"error": f"Failed to download attachments: {str(e)}"},
-            indent=2,
-            ensure_ascii=False,
         )
 
 
@@ -181,17 +175,13 @@ async def upload_attachment(
         local_file = Path.cwd() / file_path
 
     if not local_file.exists():
-        return json.dumps(
+        return fast_json.dumps_text(
             {"error": f"File not found: {file_path}"},
-            indent=2,
-            ensure_ascii=False,
         )
 
     if not local_file.is_file():
-        return json.dumps(
+        return fast_json.dumps_text(
             {"error": f"Path is not a file: {file_path}"},
-            indent=2,
-            ensure_ascii=False,
         )
 
     try:
@@ -203,16 +193,14 @@ async def upload_attachment(
         )
 
         if not result:
-            return json.dumps(
+            return fast_json.dumps_text(
                 {"error": "Upload failed - no response from server"},
-                indent=2,
-                ensure_ascii=False,
             )
 
         # Extract attachment info from result
         attachment_info = result.get("results", [result])[0] if isinstance(result, dict) else result
 
-        return json.dumps(
+        return fast_json.dumps_text(
             {
                 "success": True,
                 "page_id": page_id,
@@ -220,16 +208,12 @@ async def upload_attachment(
                 "attachment_id": attachment_info.get("id") if isinstance(attachment_info, dict) else None,
                 "message": f"Successfully uploaded {local_file.name}",
             },
-            indent=2,
-            ensure_ascii=False,
         )
 
     except Exception as e:
         logger.error(f"Failed to upload attachment to page {page_id}: {e}")
-        return json.dumps(
+        return fast_json.dumps_text(
             {"error": f"Failed to upload attachment: {str(e)}"},
-            indent=2,
-            ensure_ascii=False,
         )
 
 
@@ -304,13 +288,11 @@ async def create_mermaid_diagram(
     """
     # Check if mermaid is enabled
     if not _is_mermaid_enabled():
-        return json.dumps(
+        return fast_json.dumps_text(
             {
                 "error": "Mermaid diagram rendering is disabled.",
                 "hint": "Set MERMAID_ENABLED=true and run 'playwright install chromium' to enable.",
             },
-            indent=2,
-            ensure_ascii=False,
         )
 
     confluence_fetcher = await get_confluence_fetcher(ctx)
@@ -319,13 +301,11 @@ async def create_mermaid_diagram(
     page_info = get_page_info(page_id)
 
     if not page_info:
-        return json.dumps(
+        return fast_json.dumps_text(
             {
                 "error": f"Page '{page_id}' not found in local storage.",
                 "hint": "Use sync_space or read_page to sync the page first.",
             },
-            indent=2,
-            ensure_ascii=False,
         )
 
     space_key = page_info["space_key"]
@@ -365,10 +345,8 @@ async def create_mermaid_diagram(
         png_path.write_bytes(png_bytes)
 
         if not png_path.exists():
-            return json.dumps(
+            return fast_json.dumps_text(
                 {"error": "Failed to render mermaid diagram - PNG not created."},
-                indent=2,
-                ensure_ascii=False,
             )
 
         # Upload PNG to Confluence
@@ -391,7 +369,7 @@ async def create_mermaid_diagram(
   </ac:rich-text-body>
 </ac:structured-macro>"""
 
-        return json.dumps(
+        return fast_json.dumps_text(
             {
                 "success": True,
                 "page_id": page_id,
@@ -400,23 +378,17 @@ async def create_mermaid_diagram(
                 "expand_snippet": expand_snippet,
                 "message": f"Successfully created and uploaded diagram '{base_name}.png'. Add html_snippet for the image and expand_snippet for the editable source.",
             },
-            indent=2,
-            ensure_ascii=False,
         )
 
     except ImportError:
-        return json.dumps(
+        return fast_json.dumps_text(
             {
                 "error": "mermaid-cli not available.",
                 "hint": "Run 'playwright install chromium' to enable mermaid rendering.",
             },
-            indent=2,
-            ensure_ascii=False,
         )
     except Exception as e:
         logger.error(f"Failed to create mermaid diagram for page {page_id}: {e}")
-        return json.dumps(
+        return fast_json.dumps_text(
             {"error": f"Failed to create mermaid diagram: {str(e)}"},
-            indent=2,
-            ensure_ascii=False,
         )
@@ -1,6 +1,5 @@
 """Confluence comment and user tools - get_comments, add_comment, search_user."""
 
-import json
 import logging
 from typing import Annotated
 
@@ -8,6 +7,7 @@ from fastmcp import Context
 from pydantic import Field
 
 from mcp_atlassian.servers.dependencies import get_confluence_fetcher
+from mcp_atlassian.utils import fast_json
 from mcp_atlassian.utils.decorators import check_write_access
 
 from ._server import confluence_mcp
@@ -37,27 +37,24 @@ async def get_comments(
     try:
         comments = confluence_fetcher.get_page_comments(page_id, return_markdown=True)
 
-        comment_list = []
-        for comment in comments:
-            comment_list.append({
+        comment_list = [
+            {
                 "id": comment.id,
                 "author": comment.author.display_name if comment.author else None,
                 "created": comment.created.isoformat() if comment.created else None,
                 "content": comment.body,
-            })
+            }
+            for comment in comments
+        ]
 
-        return json.dumps(
+        return fast_json.dumps_text(
             {"success": True, "page_id": page_id, "total": len(comment_list), "comments": comment_list},
-            indent=2,
-            ensure_ascii=False,
         )
 
     except Exception as e:
         logger.error(f"Failed to get comments for page {page_id}: {e}")
-        return json.dumps(
+        return fast_json.dumps_text(
             {"error": f"Failed to get comments: {str(e)}"},
-            indent=2,
-            ensure_ascii=False,
         )
 
 
@@ -90,13 +87,11 @@ async def add_comment(
         comment = confluence_fetcher.add_comment(page_id, content)
 
         if not comment:
-            return json.dumps(
+            return fast_json.dumps_text(
                 {"error": "Failed to add comment"},
-                indent=2,
-                ensure_ascii=False,
             )
 
-        return json.dumps(
+        return fast_json.dumps_text(
             {
                 "success": True,
                 "comment": {
@@ -106,16 +101,12 @@ async def add_comment(
                     "content": comment.body,
                 },
             },
-            indent=2,
-            ensure_ascii=False,
         )
 
     except Exception as e:
         logger.error(f"Failed to add comment to page {page_id}: {e}")
-        return json.dumps(
+        return fast_json.dumps_text(
             {"error": f"Failed to add comment: {str(e)}"},
-            indent=2,
-            ensure_ascii=False,
         )
 
 
@@ -148,24 +139,21 @@ async def search_user(
     try:
         results = confluence_fetcher.search_user(cql=query, limit=limit)
 
-        users = []
-        for user in results:
-            users.append({
+        users = [
+            {
                 "account_id": user.account_id,
                 "display_name": user.display_name,
                 "email": user.email,
-            })
+            }
+            for user in results
+        ]
 
-        return json.dumps(
+        return fast_json.dumps_text(
             {"success": True, "total": len(users), "users": users},
-            indent=2,
-            ensure_ascii=False,
         )
 
     except Exception as e:
         logger.error(f"User search failed: {e}")
-        return json.dumps(
+        return fast_json.dumps_text(
             {"error": f"User search failed: {str(e)}"},
-            indent=2,
-            ensure_ascii=False,
         )
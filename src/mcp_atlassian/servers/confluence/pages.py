@@ -1,33 +1,104 @@
 """Confluence page tools - read_page, create_page, push_page_update."""
 
-import json
+import asyncio
+import functools
 import logging
 import re
+from collections.abc import Callable
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, TypeVar
 
+import anyio
 from fastmcp import Context
 from pydantic import Field
 
+from mcp_atlassian.confluence import ConfluenceFetcher
+from mcp_atlassian.exceptions import ConfluenceVersionConflictError
 from mcp_atlassian.local_storage import (
     SpaceMetadata,
     check_and_cleanup_moved_page,
     fix_html_spacing,
-    get_page_info,
+    get_pages_info,
     load_space_metadata,
     merge_into_metadata,
     save_page_html,
+    save_page_html_async,
     save_space_metadata,
 )
 from mcp_atlassian.servers.dependencies import get_confluence_fetcher
+from mcp_atlassian.utils import fast_json
 from mcp_atlassian.utils.decorators import check_write_access
 
 from ._server import confluence_mcp, get_space_lock
-from .sync import sync_space_impl
+from .sync import sync_space_impl, sync_space_with_metadata
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Maximum number of pages created or updated in Confluence at the same time
+PAGE_WRITE_CONCURRENCY = 8
+
+# "Title:" line in the comment header of a local page file
+_TITLE_RE = re.compile(r"^\s*Title:\s*(.+)$", re.MULTILINE)
+
+# Space syncs running in the background after page moves
+_background_syncs: set[asyncio.Task] = set()
+
+
+async def _run_in_threads(func: Callable[[int, _T], None], items: list[_T]) -> None:
+    """Call a blocking function for every item, each in a worker thread.
+
+    At most PAGE_WRITE_CONCURRENCY calls run at a time, so bulk operations
+    don't flood the Confluence API. The function gets each item's index and
+    must handle its own errors.
+
+    Args:
+        func: Function called as func(index, item)
+        items: Items to process
+    """
+    limiter = anyio.CapacityLimiter(PAGE_WRITE_CONCURRENCY)
+    async with anyio.create_task_group() as task_group:
+        for i, item in enumerate(items):
+            task_group.start_soon(
+                functools.partial(
+                    anyio.to_thread.run_sync, func, i, item, limiter=limiter
+                )
+            )
+
+
+async def _resync_space(confluence_fetcher: ConfluenceFetcher, space_key: str) -> None:
+    """Incrementally sync a space under its lock, logging any failure."""
+    try:
+        async with get_space_lock(space_key).write():
+            await sync_space_impl(confluence_fetcher, space_key, full_sync=False)
+    except Exception as e:
+        logger.warning(f"Failed to re-sync space {space_key} after move: {e}")
+
+
+async def _start_space_resync(
+    confluence_fetcher: ConfluenceFetcher, space_key: str
+) -> None:
+    """Re-sync a space in a background task where the event loop allows it.
+
+    On asyncio the sync runs as a detached task, kept in _background_syncs
+    until it finishes so it isn't garbage collected. Other backends have no
+    detached tasks, so there the sync is awaited.
+
+    Args:
+        confluence_fetcher: Fetcher used for the sync
+        space_key: Key of the space to sync
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        await _resync_space(confluence_fetcher, space_key)
+        return
+    task = loop.create_task(_resync_space(confluence_fetcher, space_key))
+    _background_syncs.add(task)
+    task.add_done_callback(_background_syncs.discard)
+
 
 @confluence_mcp.tool(tags={"confluence", "read"})
 async def read_page(
@@ -85,7 +156,7 @@ async def read_page(
     id_list = [pid.strip() for pid in page_ids.split(",") if pid.strip()]
 
     if not id_list:
-        return json.dumps({"error": "No page IDs provided"}, indent=2, ensure_ascii=False)
+        return fast_json.dumps_text({"error": "No page IDs provided"})
 
     # Use bulk CQL query to get page info for all pages at once
     pages_by_space: dict[str, list[dict]] = {}  # space_key -> [{page_id, space_name}]
@@ -118,8 +189,9 @@ async def read_page(
 
         # Check for pages not found in Confluence - try local storage
         missing_ids = set(id_list) - found_ids
+        local_pages = get_pages_info(missing_ids) if missing_ids else {}
         for page_id in missing_ids:
-            local_info = get_page_info(page_id)
+            local_info = local_pages.get(page_id)
             if local_info:
                 space_key = local_info.get("space_key")
                 if space_key:
@@ -140,8 +212,9 @@ async def read_page(
     except Exception as e:
         logger.error(f"Failed to fetch pages with CQL: {e}")
         # Fallback: check local storage for all pages
+        local_pages = get_pages_info(id_list)
         for page_id in id_list:
-            local_info = get_page_info(page_id)
+            local_info = local_pages.get(page_id)
             if local_info:
                 space_key = local_info.get("space_key")
                 if space_key:
@@ -161,25 +234,43 @@ async def read_page(
     # Sync each space and collect results
     results = list(errors)  # Start with errors
 
-    for space_key, pages in pages_by_space.items():
+    total_pages_by_space: dict[str, int] = {}
+    space_results: dict[str, list[dict]] = {key: [] for key in pages_by_space}
+
+    async def read_space(space_key: str, pages: list[dict]) -> None:
+        """Sync one space and collect the results for its requested pages."""
         space_lock = get_space_lock(space_key)
-        async with space_lock:
-            # Sync the space once using the unified sync function
-            await sync_space_impl(confluence_fetcher, space_key, full_sync=False)
+        writes_seen = space_lock.writes_started
+        existing_metadata = None
+        async with space_lock.write():
+            # A sync that succeeded in a write started after this call already
+            # brought the space up to date, so concurrent reads of one space
+            # share a single sync
+            if space_lock.last_sync_write <= writes_seen:
+                _, existing_metadata = await sync_space_with_metadata(
+                    confluence_fetcher, space_key, full_sync=False
+                )
 
         # Check if any requested pages have moved (ancestors changed)
-        # This catches moves that incremental sync might miss
-        existing_metadata = load_space_metadata(space_key)
-        moved_pages = []
-        for page_info in pages:
-            page_id = page_info["page_id"]
-            if page_info.get("from_local"):
-                continue  # Skip pages only found locally
-
-            try:
-                # Fetch current ancestors from Confluence
-                current_ancestors = confluence_fetcher.get_page_ancestors(page_id)
-                current_ancestor_ids = [a.id for a in current_ancestors] if current_ancestors else []
+        # This catches moves that incremental sync might miss. One expanded
+        # search returns the current ancestors and content of every requested
+        # page; it runs without holding the lock, only moved pages take it.
+        if existing_metadata is None:
+            async with space_lock.read():
+                existing_metadata = load_space_metadata(space_key)
+        remote_ids = [p["page_id"] for p in pages if not p.get("from_local")]
+        moved = []  # (raw page, current_ancestor_ids)
+        try:
+            current_pages = (
+                confluence_fetcher.iter_search_all_with_content(
+                    f'type=page AND id in ({",".join(remote_ids)})'
+                )
+                if remote_ids
+                else []
+            )
+            for page in current_pages:
+                page_id = page.get("id")
+                current_ancestor_ids = [a.get("id") for a in page.get("ancestors", [])]
 
                 # Compare with local metadata
                 local_data = existing_metadata.page_index.get(page_id) if existing_metadata else None
@@ -187,23 +278,33 @@ async def read_page(
 
                 if current_ancestor_ids != local_ancestors:
                     logger.info(f"Page {page_id} has moved: {local_ancestors} -> {current_ancestor_ids}")
+                    moved.append((page, current_ancestor_ids))
 
-                    # Cleanup old location
-                    if check_and_cleanup_moved_page(space_key, page_id, current_ancestor_ids, existing_metadata):
-                        moved_pages.append(page_id)
-
-                    # Fetch full page and save to new location
-                    full_page = confluence_fetcher.get_page_content(page_id)
-                    if full_page:
-                        base_url = confluence_fetcher.config.url.rstrip("/")
-                        url = full_page.url or f"{base_url}/spaces/{space_key}/pages/{page_id}"
-                        version_num = full_page.version.number if full_page.version else None
+        except Exception as e:
+            logger.warning(f"Failed to check pages {remote_ids} for moves: {e}")
 
-                        file_path = save_page_html(
+        if moved:
+            base_url = confluence_fetcher.config.url.rstrip("/")
+            synced_at = datetime.now(timezone.utc).isoformat()
+            async with space_lock.write():
+                existing_metadata = load_space_metadata(space_key)
+                for page, current_ancestor_ids in moved:
+                    page_id = page.get("id")
+                    try:
+                        # Cleanup old location
+                        check_and_cleanup_moved_page(space_key, page_id, current_ancestor_ids, existing_metadata)
+
+                        web_ui = page.get("_links", {}).get("webui", "")
+                        url = f"{base_url}{web_ui}" if web_ui else f"{base_url}/spaces/{space_key}/pages/{page_id}"
+                        version_num = page.get("version", {}).get("number")
+
+                        # Written in a worker thread, so other spaces' reads
+                        # keep going while the page is prettified and saved
+                        file_path = await save_page_html_async(
                             space_key=space_key,
                             page_id=page_id,
-                            title=full_page.title,
-                            html_content=full_page.content or "",
+                            title=page.get("title", ""),
+                            html_content=page.get("body", {}).get("storage", {}).get("value", ""),
                             version=version_num,
                             url=url,
                             ancestors=current_ancestor_ids,
@@ -212,12 +313,12 @@ async def read_page(
                         # Update metadata
                         updated_page = {
                             "page_id": page_id,
-                            "title": full_page.title,
+                            "title": page.get("title", ""),
                             "version": version_num,
                             "url": url,
                             "path": file_path,
                             "ancestors": current_ancestor_ids,
-                            "last_synced": datetime.now(timezone.utc).isoformat(),
+                            "last_synced": synced_at,
                         }
                         existing_metadata = merge_into_metadata(
                             existing_metadata, [updated_page], space_key,
@@ -226,11 +327,21 @@ async def read_page(
                         save_space_metadata(existing_metadata)
                         logger.info(f"Page {page_id} moved and saved to new location: {file_path}")
 
-            except Exception as e:
-                logger.warning(f"Failed to check/move page {page_id}: {e}")
+                    except Exception as e:
+                        logger.warning(f"Failed to check/move page {page_id}: {e}")
 
-        # Get results for each page in this space from metadata
-        new_metadata = load_space_metadata(space_key)
+        # Get results for each page in this space from the metadata already in
+        # hand. Children are grouped by parent once, not rescanned per page.
+        new_metadata = existing_metadata
+        total_pages_by_space[space_key] = (
+            new_metadata.total_pages if new_metadata else 0
+        )
+        children_by_parent: dict[str | None, list[str]] = {}
+        if new_metadata:
+            for other_id, other_data in new_metadata.page_index.items():
+                other_ancestors = other_data.get("ancestors", [])
+                other_parent = other_ancestors[-1] if other_ancestors else None
+                children_by_parent.setdefault(other_parent, []).append(other_id)
         for page_info in pages:
             page_id = page_info["page_id"]
             page_data = new_metadata.page_index.get(page_id) if new_metadata else None
@@ -252,32 +363,28 @@ async def read_page(
                 # Find siblings (pages with same parent), including current page
                 parent_id = ancestors[-1] if ancestors else None
                 siblings = []
-                for other_id, other_data in new_metadata.page_index.items():
-                    other_ancestors = other_data.get("ancestors", [])
-                    other_parent = other_ancestors[-1] if other_ancestors else None
-                    if other_parent == parent_id:
-                        sibling_entry = {
-                            "page_id": other_id,
-                            "title": other_data.get("title"),
-                            "local_path": other_data.get("path"),
-                        }
-                        if other_id == page_id:
-                            sibling_entry["requested"] = True
-                        siblings.append(sibling_entry)
+                for other_id in children_by_parent.get(parent_id, []):
+                    other_data = new_metadata.page_index[other_id]
+                    sibling_entry = {
+                        "page_id": other_id,
+                        "title": other_data.get("title"),
+                        "local_path": other_data.get("path"),
+                    }
+                    if other_id == page_id:
+                        sibling_entry["requested"] = True
+                    siblings.append(sibling_entry)
 
                 # Find children (pages whose parent is the current page)
-                children = []
-                for other_id, other_data in new_metadata.page_index.items():
-                    other_ancestors = other_data.get("ancestors", [])
-                    other_parent = other_ancestors[-1] if other_ancestors else None
-                    if other_parent == page_id:
-                        children.append({
-                            "page_id": other_id,
-                            "title": other_data.get("title"),
-                            "local_path": other_data.get("path"),
-                        })
-
-                results.append({
+                children = [
+                    {
+                        "page_id": other_id,
+                        "title": new_metadata.page_index[other_id].get("title"),
+                        "local_path": new_metadata.page_index[other_id].get("path"),
+                    }
+                    for other_id in children_by_parent.get(page_id, [])
+                ]
+
+                space_results[space_key].append({
                     "success": True,
                     "page_id": page_id,
                     "title": page_data.get("title"),
@@ -293,20 +400,30 @@ async def read_page(
                     "last_synced": page_data.get("last_synced"),
                 })
             else:
-                results.append({
+                space_results[space_key].append({
                     "page_id": page_id,
                     "error": "Page not found after sync",
                 })
 
+    # Spaces use separate locks, so they sync concurrently; the lock still
+    # keeps one space from being synced twice at once
+    async with anyio.create_task_group() as task_group:
+        for space_key, pages in pages_by_space.items():
+            task_group.start_soon(read_space, space_key, pages)
+    for space_key in pages_by_space:
+        results.extend(space_results[space_key])
+
     # Return single result for single page (backward compatibility)
     if len(id_list) == 1 and len(results) == 1:
         result = results[0]
         if result.get("success"):
             result["space_synced"] = True
-            result["total_pages_in_space"] = load_space_metadata(result["space_key"]).total_pages if load_space_metadata(result["space_key"]) else 0
-        return json.dumps(result, indent=2, ensure_ascii=False)
+            result["total_pages_in_space"] = total_pages_by_space.get(
+                result["space_key"], 0
+            )
+        return fast_json.dumps_text(result)
 
-    return json.dumps({"pages": results, "total": len(results)}, indent=2, ensure_ascii=False)
+    return fast_json.dumps_text({"pages": results, "total": len(results)})
 
 
 @confluence_mcp.tool(tags={"confluence", "write"})
@@ -348,76 +465,66 @@ async def create_page(
     # Parse titles (comma-separated)
     title_list = [t.strip() for t in titles.split(",") if t.strip()]
     if not title_list:
-        return json.dumps({"error": "No titles provided"}, indent=2, ensure_ascii=False)
+        return fast_json.dumps_text({"error": "No titles provided"})
 
     # Validate params - need exactly one of parent_id or sibling_id
     if not parent_id and not sibling_id:
-        return json.dumps(
-            {"error": "Must provide either parent_id or sibling_id"},
-            indent=2,
-            ensure_ascii=False,
+        return fast_json.dumps_text(
+            {"error": "Must provide either parent_id or sibling_id"}
         )
     if parent_id and sibling_id:
-        return json.dumps(
-            {"error": "Provide either parent_id OR sibling_id, not both"},
-            indent=2,
-            ensure_ascii=False,
+        return fast_json.dumps_text(
+            {"error": "Provide either parent_id OR sibling_id, not both"}
         )
 
     try:
-        # Determine actual parent and space
+        # Determine actual parent and space, and the ancestors shared by all
+        # new pages (the parent's ancestors followed by the parent)
         actual_parent_id = parent_id
         space_key = None
+        ancestor_ids = []
 
         if sibling_id:
             sibling_page = confluence_fetcher.get_page_content(sibling_id, convert_to_markdown=False)
             if not sibling_page:
-                return json.dumps(
-                    {"error": f"Sibling page '{sibling_id}' not found"},
-                    indent=2,
-                    ensure_ascii=False,
+                return fast_json.dumps_text(
+                    {"error": f"Sibling page '{sibling_id}' not found"}
                 )
             space_key = sibling_page.space.key if sibling_page.space else None
+            # The sibling's ancestors are exactly those of the new pages
             ancestors = confluence_fetcher.get_page_ancestors(sibling_id)
-            if ancestors:
-                actual_parent_id = ancestors[-1].id
-            else:
-                actual_parent_id = None
+            ancestor_ids = [a.id for a in ancestors]
+            actual_parent_id = ancestor_ids[-1] if ancestor_ids else None
         else:
             parent_page = confluence_fetcher.get_page_content(parent_id, convert_to_markdown=False)
             if not parent_page:
-                return json.dumps(
-                    {"error": f"Parent page '{parent_id}' not found"},
-                    indent=2,
-                    ensure_ascii=False,
+                return fast_json.dumps_text(
+                    {"error": f"Parent page '{parent_id}' not found"}
                 )
             space_key = parent_page.space.key if parent_page.space else None
+            parent_ancestors = confluence_fetcher.get_page_ancestors(parent_id)
+            ancestor_ids = [a.id for a in parent_ancestors] + [parent_id]
 
         if not space_key:
-            return json.dumps(
-                {"error": "Could not determine space key from parent/sibling page"},
-                indent=2,
-                ensure_ascii=False,
+            return fast_json.dumps_text(
+                {"error": "Could not determine space key from parent/sibling page"}
             )
 
-        # Get ancestors once (shared by all new pages)
-        ancestor_ids = []
-        if actual_parent_id:
-            parent_ancestors = confluence_fetcher.get_page_ancestors(actual_parent_id)
-            ancestor_ids = [a.id for a in parent_ancestors] + [actual_parent_id]
-
-        # Load/create metadata once
+        # Load/create metadata once; all new pages share one sync time
+        synced_at = datetime.now(timezone.utc).isoformat()
         existing_metadata = load_space_metadata(space_key)
         if not existing_metadata:
             existing_metadata = SpaceMetadata(
                 space_key=space_key,
                 space_name=space_key,
-                last_synced=datetime.now(timezone.utc).isoformat(),
+                last_synced=synced_at,
                 total_pages=0,
             )
 
-        results = []
-        for title in title_list:
+        results: list = [None] * len(title_list)
+        new_entries: dict[str, dict] = {}
+
+        def create_one(i: int, title: str) -> None:
             try:
                 logger.info(f"Creating page '{title}' in space {space_key} under parent {actual_parent_id}")
 
@@ -428,6 +535,7 @@ async def create_page(
                     parent_id=actual_parent_id,
                     is_markdown=False,
                     content_representation="storage",
+                    return_full_content=False,
                 )
 
                 page_id_str = str(new_page.id)
@@ -442,29 +550,38 @@ async def create_page(
                     ancestors=ancestor_ids,
                 )
 
-                existing_metadata.page_index[page_id_str] = {
+                new_entries[page_id_str] = {
                     "title": new_page.title,
                     "version": version_num,
                     "url": new_page.url,
                     "path": file_path,
                     "ancestors": ancestor_ids,
-                    "last_synced": datetime.now(timezone.utc).isoformat(),
+                    "last_synced": synced_at,
                 }
 
-                results.append({
+                results[i] = {
                     "success": True,
                     "page_id": page_id_str,
                     "title": new_page.title,
                     "url": new_page.url,
                     "local_path": file_path,
                     "absolute_path": str(Path.cwd() / file_path),
-                })
+                }
             except Exception as e:
                 logger.error(f"Failed to create page '{title}': {e}")
-                results.append({
+                results[i] = {
                     "title": title,
                     "error": str(e),
-                })
+                }
+
+        await _run_in_threads(create_one, title_list)
+
+        # Record the new pages in title order once they are all created
+        for result in results:
+            if result.get("success"):
+                page_id_str = result["page_id"]
+                existing_metadata.page_index[page_id_str] = new_entries[page_id_str]
+                existing_metadata.mark_changed(page_id_str)
 
         # Save metadata once after all pages created
         existing_metadata.total_pages = len(existing_metadata.page_index)
@@ -477,21 +594,19 @@ async def create_page(
                 result["message"] = f"Page '{result['title']}' created successfully"
                 result["space_key"] = space_key
                 result["parent_id"] = actual_parent_id
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return fast_json.dumps_text(result)
 
-        return json.dumps({
+        return fast_json.dumps_text({
             "pages": results,
             "total": len(results),
             "space_key": space_key,
             "parent_id": actual_parent_id,
-        }, indent=2, ensure_ascii=False)
+        })
 
     except Exception as e:
         logger.error(f"Failed to create pages: {e}")
-        return json.dumps(
-            {"error": f"Failed to create pages: {str(e)}"},
-            indent=2,
-            ensure_ascii=False,
+        return fast_json.dumps_text(
+            {"error": f"Failed to create pages: {str(e)}"}
         )
 
 
@@ -526,7 +641,7 @@ async def push_page_update(
     Each page's content is read from its local HTML file and pushed to Confluence.
 
     The agent should:
-    1. Read/edit local HTML files (find paths in _metadata.json or tree structure)
+    1. Read/edit local HTML files (find paths in the page folder tree)
     2. To RENAME: Edit the "Title:" line in the HTML comment header
     3. Call this tool with the page_ids and revision_message
 
@@ -542,7 +657,8 @@ async def push_page_update(
     rendering and uploading the .png image. Write the mermaid source directly
     into the page content using an expand/code block (see tool docs for format).
 
-    Before updating, it verifies each page's local version matches Confluence.
+    Each page is pushed as the version after its local one, so Confluence
+    rejects the update if the page was changed there since it was synced.
 
     ## Moving and Reordering Pages (single page only)
 
@@ -552,6 +668,8 @@ async def push_page_update(
     - `after_page_id`: Position page right after a sibling
 
     Move parameters are ignored for bulk operations.
+    The space is re-synced in the background after a move, so the local
+    folder tree may briefly lag behind Confluence.
 
     Args:
         ctx: The FastMCP context.
@@ -569,22 +687,18 @@ async def push_page_update(
     # Parse page IDs
     id_list = [pid.strip() for pid in page_ids.split(",") if pid.strip()]
     if not id_list:
-        return json.dumps({"error": "No page IDs provided"}, indent=2, ensure_ascii=False)
+        return fast_json.dumps_text({"error": "No page IDs provided"})
 
     # Validate move params - only one can be provided, and only for single page
     move_params = [move_to_parent_id, before_page_id, after_page_id]
     has_move = any(p is not None for p in move_params)
     if has_move and len(id_list) > 1:
-        return json.dumps(
-            {"error": "Move parameters only work with single page, not bulk operations"},
-            indent=2,
-            ensure_ascii=False,
+        return fast_json.dumps_text(
+            {"error": "Move parameters only work with single page, not bulk operations"}
         )
     if sum(1 for p in move_params if p is not None) > 1:
-        return json.dumps(
-            {"error": "Provide only ONE of: move_to_parent_id, before_page_id, or after_page_id"},
-            indent=2,
-            ensure_ascii=False,
+        return fast_json.dumps_text(
+            {"error": "Provide only ONE of: move_to_parent_id, before_page_id, or after_page_id"}
         )
 
     # Determine move operation type
@@ -600,46 +714,37 @@ async def push_page_update(
         move_target_id = after_page_id
         move_position = "after"
 
-    results = []
+    results: list = [None] * len(id_list)
+    updated_entries: dict[str, tuple[str, dict]] = {}
     spaces_to_sync = set()  # Track spaces that need syncing after moves
 
-    for page_id in id_list:
+    # Local info of all pages, loading each space's metadata once
+    local_pages = get_pages_info(id_list)
+    synced_at = datetime.now(timezone.utc).isoformat()
+
+    def push_one(i: int, page_id: str) -> None:
         try:
             # Find the page in local storage
-            page_info = get_page_info(page_id)
+            page_info = local_pages.get(page_id)
             if not page_info:
-                results.append({
+                results[i] = {
                     "page_id": page_id,
                     "error": "Page not found in local storage",
-                })
-                continue
+                }
+                return
 
             # Read the local HTML file
             file_path = Path.cwd() / page_info["path"]
             if not file_path.exists():
-                results.append({
+                results[i] = {
                     "page_id": page_id,
                     "error": f"Local file not found: {page_info['path']}",
-                })
-                continue
+                }
+                return
 
             space_key = page_info["space_key"]
             local_version = page_info.get("version")
 
-            # Check version mismatch
-            try:
-                current_page = confluence_fetcher.get_page_content(page_id, convert_to_markdown=False)
-                confluence_version = current_page.version.number if current_page.version else None
-
-                if local_version and confluence_version and local_version != confluence_version:
-                    results.append({
-                        "page_id": page_id,
-                        "error": f"Version mismatch (local={local_version}, confluence={confluence_version})",
-                    })
-                    continue
-            except Exception as e:
-                logger.warning(f"Could not verify version for {page_id}: {e}")
-
             # Read and parse content
             with open(file_path, encoding="utf-8") as f:
                 content = f.read()
@@ -649,7 +754,7 @@ async def push_page_update(
                 end_comment = content.find("-->")
                 if end_comment != -1:
                     header = content[:end_comment]
-                    title_match = re.search(r"^\s*Title:\s*(.+)$", header, re.MULTILINE)
+                    title_match = _TITLE_RE.search(header)
                     if title_match:
                         page_title = title_match.group(1).strip()
                     content = content[end_comment + 3:].lstrip("\n")
@@ -657,16 +762,29 @@ async def push_page_update(
             # Fix spacing around inline tags (agents often write without proper spacing)
             content = fix_html_spacing(content)
 
-            # Update page in Confluence
-            updated_page = confluence_fetcher.update_page(
-                page_id=page_id,
-                title=page_title,
-                body=content,
-                is_minor_edit=False,
-                version_comment=revision_message,
-                is_markdown=False,
-                content_representation="storage",
-            )
+            # Update page in Confluence as the version after the local one;
+            # Confluence itself rejects the update if the page changed since
+            try:
+                updated_page = confluence_fetcher.update_page(
+                    page_id=page_id,
+                    title=page_title,
+                    body=content,
+                    is_minor_edit=False,
+                    version_comment=revision_message,
+                    is_markdown=False,
+                    content_representation="storage",
+                    return_full_content=False,
+                    base_version=local_version,
+                )
+            except ConfluenceVersionConflictError:
+                results[i] = {
+                    "page_id": page_id,
+                    "error": (
+                        f"Version mismatch (local={local_version}): the page "
+                        "was changed in Confluence since it was synced"
+                    ),
+                }
+                return
 
             # Handle move (single page only)
             if move_target_id and move_position:
@@ -690,18 +808,15 @@ async def push_page_update(
                 ancestors=ancestors,
             )
 
-            # Update metadata
-            existing_metadata = load_space_metadata(space_key)
-            if existing_metadata:
-                existing_metadata.page_index[page_id] = {
-                    "title": updated_page.title,
-                    "version": version_num,
-                    "url": updated_page.url,
-                    "path": new_path,
-                    "ancestors": ancestors,
-                    "last_synced": datetime.now(timezone.utc).isoformat(),
-                }
-                save_space_metadata(existing_metadata)
+            # Metadata is updated once per space after all pages are pushed
+            updated_entries[page_id] = (space_key, {
+                "title": updated_page.title,
+                "version": version_num,
+                "url": updated_page.url,
+                "path": new_path,
+                "ancestors": ancestors,
+                "last_synced": synced_at,
+            })
 
             # Build diff URL for comparing versions
             base_url = confluence_fetcher.config.url.rstrip("/")
@@ -714,7 +829,7 @@ async def push_page_update(
                     f"&selectedPageVersions={version_num}"
                 )
 
-            results.append({
+            results[i] = {
                 "success": True,
                 "page_id": page_id,
                 "title": updated_page.title,
@@ -722,24 +837,48 @@ async def push_page_update(
                 "new_version": version_num,
                 "url": updated_page.url,
                 "diff_url": diff_url,
-            })
+            }
 
         except Exception as e:
             logger.error(f"Failed to update page {page_id}: {e}")
-            results.append({
+            results[i] = {
                 "page_id": page_id,
                 "error": str(e),
-            })
+            }
+
+    await _run_in_threads(push_one, id_list)
+
+    # Record the pushed pages, loading and saving each space's metadata once
+    entries_by_space: dict[str, dict[str, dict]] = {}
+    for page_id, (space_key, entry) in updated_entries.items():
+        entries_by_space.setdefault(space_key, {})[page_id] = entry
+    for space_key, entries in entries_by_space.items():
+        try:
+            async with get_space_lock(space_key).write():
+                existing_metadata = load_space_metadata(space_key)
+                if not existing_metadata:
+                    continue
+                for page_id, entry in entries.items():
+                    existing_metadata.page_index[page_id] = entry
+                    existing_metadata.mark_changed(page_id)
+                    # Keep the tree node in step, as merges now update it in place
+                    node = existing_metadata.page_nodes.get(page_id)
+                    if node:
+                        node.title = entry["title"]
+                        node.version = entry["version"]
+                        node.url = entry["url"]
+                        node.last_synced = entry["last_synced"]
+                save_space_metadata(existing_metadata)
+        except Exception as e:
+            logger.error(f"Failed to update metadata for space {space_key}: {e}")
 
-    # Sync spaces that had pages moved
+    # Sync spaces that had pages moved, without holding up the response
     for space_key in spaces_to_sync:
-        space_lock = get_space_lock(space_key)
-        async with space_lock:
-            await sync_space_impl(confluence_fetcher, space_key, full_sync=False)
+        await _start_space_resync(confluence_fetcher, space_key)
 
-    return json.dumps({
+    return fast_json.dumps_text({
         "pages": results,
         "total": len(results),
         "success_count": sum(1 for r in results if r.get("success")),
         "revision_message": revision_message,
-    }, indent=2, ensure_ascii=False)
+    })
@@ -1,6 +1,5 @@
 """Confluence space tools - get_spaces."""
 
-import json
 import logging
 from typing import Annotated
 
@@ -8,6 +7,7 @@ from fastmcp import Context
 from pydantic import Field
 
 from mcp_atlassian.servers.dependencies import get_confluence_fetcher
+from mcp_atlassian.utils import fast_json
 
 from ._server import confluence_mcp
 
@@ -35,24 +35,21 @@ async def get_spaces(
 
     try:
         result = confluence_fetcher.get_spaces(start=0, limit=limit)
-        spaces = []
-        for space in result.get("results", []):
-            spaces.append({
+        spaces = [
+            {
                 "key": space.get("key"),
                 "name": space.get("name"),
                 "type": space.get("type"),
-            })
+            }
+            for space in result.get("results", [])
+        ]
 
-        return json.dumps(
+        return fast_json.dumps_text(
             {"success": True, "total": len(spaces), "spaces": spaces},
-            indent=2,
-            ensure_ascii=False,
         )
 
     except Exception as e:
         logger.error(f"Failed to get spaces: {e}")
-        return json.dumps(
+        return fast_json.dumps_text(
             {"error": f"Failed to get spaces: {str(e)}"},
-            indent=2,
-            ensure_ascii=False,
         )
@@ -1,28 +1,184 @@
 """Confluence sync tools - sync_space."""
 
-import json
+import itertools
 import logging
+from collections.abc import Iterator
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Annotated
 
+import anyio
 from fastmcp import Context
 from pydantic import Field
 
 from mcp_atlassian.local_storage import (
+    SpaceMetadata,
     check_and_cleanup_moved_page,
     cleanup_deleted_pages,
+    get_storage_path,
     load_space_metadata,
     merge_into_metadata,
+    page_content_hash,
+    page_file_state,
     remove_pages_from_metadata,
-    save_page_html,
+    save_page_html_async,
     save_space_metadata,
 )
 from mcp_atlassian.servers.dependencies import get_confluence_fetcher
+from mcp_atlassian.utils import fast_json
+from mcp_atlassian.utils.date import parse_iso_datetime
 
 from ._server import AUTO_FULL_SYNC_DAYS, confluence_mcp, get_space_lock
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of page files written at the same time during a sync
+PAGE_SAVE_CONCURRENCY = 16
+
+# Pages fetched, processed and written per round during a sync
+SYNC_BATCH_SIZE = 200
+
+# Synced pages listed in the sync result
+SYNC_DISPLAY_LIMIT = 50
+
+
+def _saved_page_state(metadata: SpaceMetadata | None, page_id: str) -> dict:
+    """Get the content hash and file state recorded when a page was last saved.
+
+    Returns:
+        prev_hash and prev_file_state keyword arguments for save_page_html
+    """
+    page_info = (metadata.page_index.get(page_id) if metadata else None) or {}
+    return {
+        "prev_hash": page_info.get("content_hash"),
+        "prev_file_state": page_info.get("file_state"),
+    }
+
+
+def _is_unchanged(
+    page_info: dict | None,
+    title: str,
+    version: int | None,
+    ancestor_ids: list[str],
+    storage_root: Path,
+) -> bool:
+    """Check whether a fetched page matches its saved copy, untouched on disk.
+
+    Args:
+        page_info: The page's page_index entry, if it was synced before
+        title: Title of the fetched page
+        version: Version of the fetched page
+        ancestor_ids: Ancestor IDs of the fetched page
+        storage_root: Directory the page_index paths are relative to
+
+    Returns:
+        True if the saved file and metadata are still current
+    """
+    return (
+        page_info is not None
+        and version is not None
+        and page_info.get("version") == version
+        and page_info.get("title") == title
+        and page_info.get("ancestors") == ancestor_ids
+        and page_info.get("file_state") is not None
+        and page_file_state(storage_root / page_info["path"]) == page_info["file_state"]
+    )
+
+
+def build_incremental_cql(space_key: str, last_synced: str | None) -> str:
+    """Build the CQL query for the pages of a space modified since a sync.
+
+    Args:
+        space_key: The space to search
+        last_synced: ISO timestamp of the last sync, if any
+
+    Returns:
+        CQL for the space's pages, limited to those modified since last_synced
+        when it is set and parses
+    """
+    cql_base = f'type=page AND space.key="{space_key}"'
+    if not last_synced:
+        return cql_base
+    try:
+        last_dt = parse_iso_datetime(last_synced)
+    except ValueError:
+        logger.warning(f"Could not parse last sync time: {last_synced}")
+        return cql_base
+    return f'{cql_base} AND lastModified >= "{last_dt.strftime("%Y-%m-%d %H:%M")}"'
+
+
+async def _next_page_batch(pages: Iterator[dict]) -> list[dict]:
+    """Take the next SYNC_BATCH_SIZE pages from a page iterator.
+
+    The iterator makes blocking API requests, so it is advanced in a worker
+    thread.
+
+    Args:
+        pages: Iterator of raw page dicts
+
+    Returns:
+        The next batch of pages, empty once the iterator is exhausted
+    """
+    return await anyio.to_thread.run_sync(
+        list, itertools.islice(pages, SYNC_BATCH_SIZE)
+    )
+
+
+async def _save_pages_concurrently(pages: list[dict]) -> list[str | Exception]:
+    """Save pages as HTML in worker threads, a bounded number at a time.
+
+    Args:
+        pages: Keyword arguments for save_page_html, one dict per page
+
+    Returns:
+        The saved file path, or the raised exception, for each page in order
+    """
+    limiter = anyio.CapacityLimiter(PAGE_SAVE_CONCURRENCY)
+    results: list = [None] * len(pages)
+
+    async def save(i: int, page: dict) -> None:
+        try:
+            results[i] = await save_page_html_async(**page, limiter=limiter)
+        except Exception as e:
+            results[i] = e
+
+    async with anyio.create_task_group() as task_group:
+        for i, page in enumerate(pages):
+            task_group.start_soon(save, i, page)
+    return results
+
+
+async def _save_pages_while_fetching(
+    pages: list[dict], raw_pages: Iterator[dict]
+) -> tuple[list[str | Exception], list[dict] | Exception]:
+    """Save a batch of pages while the next batch is fetched.
+
+    Disk writes and API requests both run in worker threads, so writing one
+    batch overlaps with downloading the next.
+
+    Args:
+        pages: Keyword arguments for save_page_html, one dict per page
+        raw_pages: Iterator of raw page dicts to take the next batch from
+
+    Returns:
+        The save results for pages (as from _save_pages_concurrently), and
+        the next batch, or the exception raised while fetching it
+    """
+    next_batch: list[dict] | Exception = []
+
+    async def fetch() -> None:
+        nonlocal next_batch
+        try:
+            next_batch = await _next_page_batch(raw_pages)
+        except Exception as e:
+            # Returned rather than raised, so this batch's saves still complete
+            next_batch = e
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(fetch)
+        results = await _save_pages_concurrently(pages)
+    return results, next_batch
+
 
 @confluence_mcp.tool(tags={"confluence", "sync"})
 async def sync_space(
@@ -89,7 +245,7 @@ async def sync_space(
 
     # Acquire lock for this space to prevent concurrent syncs
     space_lock = get_space_lock(space_key)
-    async with space_lock:
+    async with space_lock.write():
         return await sync_space_impl(confluence_fetcher, space_key, full_sync)
 
 
@@ -98,7 +254,37 @@ async def sync_space_impl(confluence_fetcher, space_key: str, full_sync: bool) -
 
     This is the unified sync function used by both sync_space and read_page.
     """
+    result, _ = await sync_space_with_metadata(confluence_fetcher, space_key, full_sync)
+    return result
+
+
+async def sync_space_with_metadata(
+    confluence_fetcher, space_key: str, full_sync: bool
+) -> tuple[str, SpaceMetadata | None]:
+    """Sync a space and also return its metadata (called while holding lock).
+
+    Callers that go on to read the space use the returned metadata instead of
+    loading it from disk again. A successful sync is recorded on the space
+    lock, so reads waiting for the lock can skip their own sync.
+
+    Returns:
+        (JSON result, the space metadata after the sync, or None if it failed)
+    """
+    result, metadata = await _sync_space(confluence_fetcher, space_key, full_sync)
+    if metadata is not None:
+        get_space_lock(space_key).mark_synced()
+    return result, metadata
+
+
+async def _sync_space(
+    confluence_fetcher, space_key: str, full_sync: bool
+) -> tuple[str, SpaceMetadata | None]:
+    """Sync a space; see sync_space_with_metadata."""
     try:
+        # One timestamp for the whole sync, stamped on every page it saves
+        sync_started = datetime.now(timezone.utc)
+        sync_started_iso = sync_started.isoformat()
+
         # Load existing metadata to get last sync time
         existing_metadata = load_space_metadata(space_key)
         last_sync_time = None
@@ -107,10 +293,8 @@ async def sync_space_impl(confluence_fetcher, space_key: str, full_sync: bool) -
         if not full_sync and existing_metadata:
             # Check if last sync was more than AUTO_FULL_SYNC_DAYS ago
             try:
-                last_dt = datetime.fromisoformat(
-                    existing_metadata.last_synced.replace("Z", "+00:00")
-                )
-                days_since_sync = (datetime.now(timezone.utc) - last_dt).days
+                last_dt = parse_iso_datetime(existing_metadata.last_synced)
+                days_since_sync = (sync_started - last_dt).days
                 if days_since_sync >= AUTO_FULL_SYNC_DAYS:
                     logger.info(
                         f"Last sync was {days_since_sync} days ago, triggering auto full sync"
@@ -124,168 +308,199 @@ async def sync_space_impl(confluence_fetcher, space_key: str, full_sync: bool) -
             last_sync_time = existing_metadata.last_synced
             logger.info(f"Incremental sync from: {last_sync_time}")
 
-        saved_pages: list[dict] = []
+        # Saved pages are merged into the metadata batch by batch; only the
+        # first SYNC_DISPLAY_LIMIT are kept for the response
+        metadata = existing_metadata
+        previous_sync = existing_metadata.last_synced if existing_metadata else None
+        saved_count = 0
+        unchanged_count = 0
+        display_pages: list[dict] = []
         moved_pages: list[str] = []
         errors: list[str] = []
         space_name = space_key
-        all_page_ids: set[str] = set()
+        pages_seen = 0
+        # Only a full sync of a known space removes pages, using every page ID
+        # Confluence returned; other syncs don't collect them
+        track_page_ids = bool(full_sync and existing_metadata)
+        fetched_page_ids: list[str] = []
 
         # Use optimized bulk fetch for full sync (much faster!)
         if not last_sync_time:
             logger.info(f"Full sync: using optimized bulk fetch for space {space_key}")
-            raw_pages = confluence_fetcher.get_all_space_pages_with_content(space_key)
+            raw_pages = confluence_fetcher.iter_all_space_pages_with_content(space_key)
 
-            if not raw_pages and not existing_metadata:
-                return json.dumps(
-                    {"error": f"No pages found in space '{space_key}' or space does not exist."},
-                    indent=2,
-                    ensure_ascii=False,
+        else:
+            # Incremental sync: use CQL to find modified pages, fetching their
+            # content, ancestors and version in the same paginated search
+            cql_query = build_incremental_cql(space_key, last_sync_time)
+            logger.info(f"Incremental sync using CQL: {cql_query}")
+            raw_pages = confluence_fetcher.iter_search_all_with_content(cql_query)
+
+        # Pages are fetched and written a batch at a time, so at most two
+        # batches of page bodies (one being written, the next being fetched)
+        # are held in memory however large the space is
+        base_url = confluence_fetcher.config.url.rstrip("/")
+        storage_root = get_storage_path().parent
+        try:
+            next_batch = await _next_page_batch(raw_pages)
+            while next_batch:
+                batch = next_batch
+                # Process results; page files are written afterwards, in parallel
+                pages_to_save: list[dict] = []
+                pages_seen += len(batch)
+                if track_page_ids:
+                    fetched_page_ids.extend(page.get("id") for page in batch)
+                for page in batch:
+                    page_id = page.get("id")
+                    try:
+                        title = page.get("title", "")
+                        body = page.get("body", {}).get("storage", {}).get("value", "")
+                        version = page.get("version", {}).get("number")
+                        ancestors = page.get("ancestors", [])
+                        ancestor_ids = [a.get("id") for a in ancestors]
+
+                        # Build URL
+                        page_links = page.get("_links", {})
+                        web_ui = page_links.get("webui", "")
+                        url = f"{base_url}{web_ui}" if web_ui else ""
+
+                        # Get space name from first page
+                        if space_name == space_key:
+                            page_space = page.get("space", {})
+                            space_name = page_space.get("name", space_key)
+
+                        # Pages whose version, title and place are unchanged, with
+                        # their file intact, need neither writing nor re-indexing
+                        page_info = (
+                            existing_metadata.page_index.get(page_id)
+                            if existing_metadata
+                            else None
+                        )
+                        if _is_unchanged(
+                            page_info, title, version, ancestor_ids, storage_root
+                        ):
+                            unchanged_count += 1
+                            if len(display_pages) < SYNC_DISPLAY_LIMIT:
+                                display_pages.append({
+                                    "page_id": page_id,
+                                    "title": title,
+                                    "path": page_info["path"],
+                                })
+                            continue
+
+                        # Check if page has moved (kept sequential: it removes folders
+                        # that other moved pages may be nested in)
+                        if check_and_cleanup_moved_page(
+                            space_key, page_id, ancestor_ids, existing_metadata
+                        ):
+                            moved_pages.append(page_id)
+
+                        pages_to_save.append({
+                            "space_key": space_key,
+                            "page_id": page_id,
+                            "title": title,
+                            "html_content": body,
+                            "version": version,
+                            "url": url,
+                            "ancestors": ancestor_ids,
+                            **_saved_page_state(existing_metadata, page_id),
+                        })
+
+                    except Exception as e:
+                        error_msg = f"Failed to sync page {page_id}: {e}"
+                        logger.error(error_msg)
+                        errors.append(error_msg)
+
+                # Save the pages, fetching the next batch meanwhile
+                results, next_batch = await _save_pages_while_fetching(
+                    pages_to_save, raw_pages
                 )
-
-            # Process bulk results
-            for page in raw_pages:
-                page_id = page.get("id")
-                all_page_ids.add(page_id)
-                try:
-                    title = page.get("title", "")
-                    body = page.get("body", {}).get("storage", {}).get("value", "")
-                    version = page.get("version", {}).get("number")
-                    ancestors = page.get("ancestors", [])
-                    ancestor_ids = [a.get("id") for a in ancestors]
-
-                    # Build URL
-                    page_links = page.get("_links", {})
-                    web_ui = page_links.get("webui", "")
-                    base_url = confluence_fetcher.config.url.rstrip("/")
-                    url = f"{base_url}{web_ui}" if web_ui else ""
-
-                    # Get space name from first page
-                    if space_name == space_key:
-                        page_space = page.get("space", {})
-                        space_name = page_space.get("name", space_key)
-
-                    # Check if page has moved
-                    if check_and_cleanup_moved_page(
-                        space_key, page_id, ancestor_ids, existing_metadata
-                    ):
-                        moved_pages.append(page_id)
-
-                    # Save the page
-                    file_path = save_page_html(
-                        space_key=space_key,
-                        page_id=page_id,
-                        title=title,
-                        html_content=body,
-                        version=version,
-                        url=url,
-                        ancestors=ancestor_ids,
-                    )
+                saved_pages: list[dict] = []
+                for page_to_save, result in zip(pages_to_save, results, strict=True):
+                    page_id = page_to_save["page_id"]
+                    title = page_to_save["title"]
+                    if isinstance(result, Exception):
+                        error_msg = f"Failed to sync page {page_id}: {result}"
+                        logger.error(error_msg)
+                        errors.append(error_msg)
+                        continue
 
                     saved_pages.append({
                         "page_id": page_id,
                         "title": title,
-                        "version": version,
-                        "url": url,
-                        "path": file_path,
-                        "ancestors": ancestor_ids,
-                        "last_synced": datetime.now(timezone.utc).isoformat(),
+                        "version": page_to_save["version"],
+                        "url": page_to_save["url"],
+                        "path": result,
+                        "ancestors": page_to_save["ancestors"],
+                        "last_synced": sync_started_iso,
+                        "content_hash": page_content_hash(
+                            title,
+                            page_to_save["version"],
+                            page_to_save["url"],
+                            page_to_save["html_content"],
+                        ),
+                        "file_state": page_file_state(storage_root / result),
                     })
 
+                    if len(display_pages) < SYNC_DISPLAY_LIMIT:
+                        display_pages.append(
+                            {"page_id": page_id, "title": title, "path": result}
+                        )
                     logger.debug(f"Saved page: {title} ({page_id})")
 
-                except Exception as e:
-                    error_msg = f"Failed to sync page {page_id}: {e}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
-
-        else:
-            # Incremental sync: use CQL to find modified pages, then fetch individually
-            cql_base = f'type=page AND space.key="{space_key}"'
-            try:
-                last_dt = datetime.fromisoformat(last_sync_time.replace("Z", "+00:00"))
-                last_sync_date_str = last_dt.strftime("%Y-%m-%d %H:%M")
-                cql_query = f'{cql_base} AND lastModified >= "{last_sync_date_str}"'
-            except ValueError:
-                logger.warning(f"Could not parse last sync time: {last_sync_time}")
-                cql_query = cql_base
+                if saved_pages:
+                    saved_count += len(saved_pages)
+                    metadata = merge_into_metadata(
+                        existing=metadata,
+                        new_pages=saved_pages,
+                        space_key=space_key,
+                        space_name=space_name,
+                    )
 
-            logger.info(f"Incremental sync using CQL: {cql_query}")
-            search_results = confluence_fetcher.search_all(cql_query)
+                # Release this batch's page bodies before processing the next one
+                del batch, pages_to_save, saved_pages
+                if isinstance(next_batch, Exception):
+                    raise next_batch
+        except Exception:
+            # Pages written so far, and the old folders of moved pages already
+            # removed, must be recorded before the error is reported. The
+            # previous sync time is kept, so the next sync fetches them again.
+            if saved_count:
+                # With no earlier sync, an old timestamp forces a full sync next
+                metadata.last_synced = (
+                    previous_sync
+                    or datetime.fromtimestamp(0, timezone.utc).isoformat()
+                )
+                save_space_metadata(metadata)
+            raise
 
-            if not search_results:
-                return json.dumps(
+        if not pages_seen:
+            if last_sync_time:
+                return fast_json.dumps_text(
                     {
                         "success": True,
                         "space_key": space_key,
                         "message": "No pages modified since last sync.",
                         "total_pages_in_cache": existing_metadata.total_pages if existing_metadata else 0,
                         "last_synced": existing_metadata.last_synced if existing_metadata else None,
-                    },
-                    indent=2,
-                    ensure_ascii=False,
-                )
-
-            # Get space name
-            if search_results and search_results[0].space:
-                space_name = search_results[0].space.name or space_key
-
-            # Process modified pages (need individual fetch for content)
-            for search_page in search_results:
-                page_id = search_page.id
-                all_page_ids.add(page_id)
-                try:
-                    # Get full page content with expand (single API call per page)
-                    full_page = confluence_fetcher.get_page_content(
-                        page_id, convert_to_markdown=False
-                    )
-                    ancestors = confluence_fetcher.get_page_ancestors(page_id)
-                    ancestor_ids = [a.id for a in ancestors]
-
-                    if check_and_cleanup_moved_page(
-                        space_key, page_id, ancestor_ids, existing_metadata
-                    ):
-                        moved_pages.append(page_id)
-
-                    html_content = full_page.content or ""
-                    version_num = full_page.version.number if full_page.version else None
-                    file_path = save_page_html(
-                        space_key=space_key,
-                        page_id=page_id,
-                        title=full_page.title,
-                        html_content=html_content,
-                        version=version_num,
-                        url=full_page.url,
-                        ancestors=ancestor_ids,
-                    )
-
-                    saved_pages.append({
-                        "page_id": page_id,
-                        "title": full_page.title,
-                        "version": version_num,
-                        "url": full_page.url,
-                        "path": file_path,
-                        "ancestors": ancestor_ids,
-                        "last_synced": datetime.now(timezone.utc).isoformat(),
-                    })
-
-                    logger.debug(f"Saved page: {full_page.title} ({page_id})")
-
-                except Exception as e:
-                    error_msg = f"Failed to sync page {page_id}: {e}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
+                    }
+                ), existing_metadata
+            if not existing_metadata:
+                return fast_json.dumps_text(
+                    {"error": f"No pages found in space '{space_key}' or space does not exist."}
+                ), None
 
         # For full sync, cleanup pages that were deleted from Confluence
         deleted_pages: list[str] = []
-        if full_sync and existing_metadata and all_page_ids:
+        if track_page_ids and fetched_page_ids:
             deleted_pages = cleanup_deleted_pages(
-                space_key, all_page_ids, existing_metadata
+                space_key, fetched_page_ids, existing_metadata
             )
 
-        # Merge into metadata
+        # Stamp the sync on the metadata (creating it if no page was saved)
         new_metadata = merge_into_metadata(
-            existing=existing_metadata,
-            new_pages=saved_pages,
+            existing=metadata,
+            new_pages=[],
             space_key=space_key,
             space_name=space_name,
         )
@@ -296,13 +511,6 @@ async def sync_space_impl(confluence_fetcher, space_key: str, full_sync: bool) -
 
         save_space_metadata(new_metadata)
 
-        # Limit displayed pages to 50
-        max_display = 50
-        display_pages = [
-            {"page_id": p["page_id"], "title": p["title"], "path": p["path"]}
-            for p in saved_pages[:max_display]
-        ]
-
         # Determine sync type for response
         if auto_full_sync_triggered:
             sync_type = "auto_full"
@@ -316,7 +524,7 @@ async def sync_space_impl(confluence_fetcher, space_key: str, full_sync: bool) -
             "space_key": space_key,
             "space_name": space_name,
             "sync_type": sync_type,
-            "pages_synced": len(saved_pages),
+            "pages_synced": saved_count + unchanged_count,
             "total_pages_in_cache": new_metadata.total_pages,
             "last_synced": new_metadata.last_synced,
             "storage_path": f".better-confluence-mcp/{space_key}/",
@@ -328,9 +536,15 @@ async def sync_space_impl(confluence_fetcher, space_key: str, full_sync: bool) -
                 f"Last sync was more than {AUTO_FULL_SYNC_DAYS} days ago"
             )
 
-        if len(saved_pages) > max_display:
+        if unchanged_count:
+            result["pages_unchanged"] = unchanged_count
+
+        if saved_count + unchanged_count > SYNC_DISPLAY_LIMIT:
             result["synced_pages_truncated"] = True
-            result["synced_pages_message"] = f"Showing first {max_display} of {len(saved_pages)} synced pages"
+            result["synced_pages_message"] = (
+                f"Showing first {SYNC_DISPLAY_LIMIT} of "
+                f"{saved_count + unchanged_count} synced pages"
+            )
 
         if moved_pages:
             result["pages_moved"] = len(moved_pages)
@@ -345,14 +559,13 @@ async def sync_space_impl(confluence_fetcher, space_key: str, full_sync: bool) -
 
         logger.info(
             f"Sync complete for space {space_key}: "
-            f"{len(saved_pages)} synced, {len(moved_pages)} moved, {len(deleted_pages)} deleted"
+            f"{saved_count} saved, {unchanged_count} unchanged, "
+            f"{len(moved_pages)} moved, {len(deleted_pages)} deleted"
         )
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return fast_json.dumps_text(result), new_metadata
 
     except Exception as e:
         logger.error(f"Sync failed for space {space_key}: {e}")
-        return json.dumps(
-            {"error": f"Failed to sync space '{space_key}': {str(e)}"},
-            indent=2,
-            ensure_ascii=False,
-        )
+        return fast_json.dumps_text(
+            {"error": f"Failed to sync space '{space_key}': {str(e)}"}
+        ), None
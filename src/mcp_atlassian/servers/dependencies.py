@@ -9,14 +9,21 @@ import logging
 
 from fastmcp import Context
 
-from mcp_atlassian.confluence import ConfluenceFetcher
+from mcp_atlassian.confluence import ConfluenceConfig, ConfluenceFetcher
 from mcp_atlassian.servers.context import MainAppContext
 
 logger = logging.getLogger("mcp-atlassian.servers.dependencies")
 
+# One fetcher per configuration, keyed by id() and holding the config so the id
+# stays unique. Tool calls share its HTTP session and keep-alive connections.
+_fetchers: dict[int, tuple[ConfluenceConfig, ConfluenceFetcher]] = {}
+
 
 async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
-    """Returns a ConfluenceFetcher instance from the global configuration.
+    """Returns the ConfluenceFetcher for the global configuration.
+
+    The fetcher is created on first use and reused by later calls, so its
+    pooled connections stay open between tool calls.
 
     Args:
         ctx: The FastMCP context.
@@ -41,7 +48,12 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
             "get_confluence_fetcher: Using global ConfluenceFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx.full_confluence_config.auth_type}"
         )
-        return ConfluenceFetcher(config=app_lifespan_ctx.full_confluence_config)
+        config = app_lifespan_ctx.full_confluence_config
+        cached = _fetchers.get(id(config))
+        if cached is None or cached[0] is not config:
+            cached = (config, ConfluenceFetcher(config=config))
+            _fetchers[id(config)] = cached
+        return cached[1]
 
     logger.error("Confluence configuration could not be resolved.")
     raise ValueError(
@@ -19,11 +19,13 @@ from mcp_atlassian.local_storage import (
     cleanup_deleted_pages,
     check_and_cleanup_moved_page,
 )
+from mcp_atlassian.utils.date import parse_iso_datetime
 from mcp_atlassian.utils.environment import get_available_services
 from mcp_atlassian.utils.io import is_read_only_mode
 from mcp_atlassian.utils.tools import get_enabled_tools, should_include_tool
 
 from .confluence import confluence_mcp, AUTO_FULL_SYNC_DAYS
+from .confluence.sync import build_incremental_cql
 from .context import MainAppContext
 
 logger = logging.getLogger("mcp-atlassian.server.main")
@@ -61,9 +63,7 @@ def _sync_spaces_blocking(confluence_config: ConfluenceConfig, synced_spaces: li
             # Check if we need full sync
             full_sync = False
             try:
-                last_dt = datetime.fromisoformat(
-                    existing_metadata.last_synced.replace("Z", "+00:00")
-                )
+                last_dt = parse_iso_datetime(existing_metadata.last_synced)
                 days_since_sync = (datetime.now(timezone.utc) - last_dt).days
                 if days_since_sync >= AUTO_FULL_SYNC_DAYS:
                     full_sync = True
@@ -72,90 +72,63 @@ def _sync_spaces_blocking(confluence_config: ConfluenceConfig, synced_spaces: li
                 pass
 
             saved_count = 0
-            all_page_ids: set[str] = set()
+            pages_seen = 0
+            # Only a full sync needs every page ID, to find deleted pages
+            fetched_page_ids: list[str] = []
 
             if full_sync:
                 # Use optimized bulk fetch for full sync
-                raw_pages = fetcher.get_all_space_pages_with_content(space_key)
-                if not raw_pages:
-                    logger.debug(f"Space {space_key}: no pages found")
-                    continue
-
-                for page in raw_pages:
-                    page_id = page.get("id")
-                    all_page_ids.add(page_id)
-                    try:
-                        title = page.get("title", "")
-                        body = page.get("body", {}).get("storage", {}).get("value", "")
-                        version = page.get("version", {}).get("number")
-                        ancestors = page.get("ancestors", [])
-                        ancestor_ids = [a.get("id") for a in ancestors]
-                        page_links = page.get("_links", {})
-                        web_ui = page_links.get("webui", "")
-                        base_url = fetcher.config.url.rstrip("/")
-                        url = f"{base_url}{web_ui}" if web_ui else ""
-
-                        check_and_cleanup_moved_page(
-                            space_key, page_id, ancestor_ids, existing_metadata
-                        )
-
-                        save_page_html(
-                            space_key=space_key,
-                            page_id=page_id,
-                            title=title,
-                            html_content=body,
-                            version=version,
-                            url=url,
-                            ancestors=ancestor_ids,
-                        )
-                        saved_count += 1
-                    except Exception as e:
-                        logger.debug(f"Failed to sync page {page_id}: {e}")
-
-                # Cleanup deleted pages
-                deleted = cleanup_deleted_pages(space_key, all_page_ids, existing_metadata)
-                if deleted:
-                    logger.debug(f"Space {space_key}: cleaned up {len(deleted)} deleted pages")
+                raw_pages = fetcher.iter_all_space_pages_with_content(space_key)
             else:
-                # Incremental sync using CQL
-                cql_base = f'type=page AND space.key="{space_key}"'
-                last_dt = datetime.fromisoformat(
-                    existing_metadata.last_synced.replace("Z", "+00:00")
+                # Incremental sync using CQL, with content and ancestors expanded
+                cql_query = build_incremental_cql(
+                    space_key, existing_metadata.last_synced
                 )
-                last_sync_date_str = last_dt.strftime("%Y-%m-%d %H:%M")
-                cql_query = f'{cql_base} AND lastModified >= "{last_sync_date_str}"'
-
-                search_results = fetcher.search_all(cql_query)
-                if not search_results:
-                    logger.debug(f"Space {space_key}: no changes since last sync")
-                    continue
-
-                for search_page in search_results:
-                    try:
-                        full_page = fetcher.get_page_content(
-                            search_page.id, convert_to_markdown=False
-                        )
-                        ancestors = fetcher.get_page_ancestors(search_page.id)
-                        ancestor_ids = [a.id for a in ancestors]
-
-                        check_and_cleanup_moved_page(
-                            space_key, search_page.id, ancestor_ids, existing_metadata
-                        )
-
-                        html_content = full_page.content or ""
-                        version_num = full_page.version.number if full_page.version else None
-                        save_page_html(
-                            space_key=space_key,
-                            page_id=search_page.id,
-                            title=full_page.title,
-                            html_content=html_content,
-                            version=version_num,
-                            url=full_page.url,
-                            ancestors=ancestor_ids,
-                        )
-                        saved_count += 1
-                    except Exception as e:
-                        logger.debug(f"Failed to sync page {search_page.id}: {e}")
+
+                raw_pages = fetcher.iter_search_all_with_content(cql_query)
+
+            for page in raw_pages:
+                page_id = page.get("id")
+                pages_seen += 1
+                if full_sync:
+                    fetched_page_ids.append(page_id)
+                try:
+                    title = page.get("title", "")
+                    body = page.get("body", {}).get("storage", {}).get("value", "")
+                    version = page.get("version", {}).get("number")
+                    ancestors = page.get("ancestors", [])
+                    ancestor_ids = [a.get("id") for a in ancestors]
+                    page_links = page.get("_links", {})
+                    web_ui = page_links.get("webui", "")
+                    base_url = fetcher.config.url.rstrip("/")
+                    url = f"{base_url}{web_ui}" if web_ui else ""
+
+                    check_and_cleanup_moved_page(
+                        space_key, page_id, ancestor_ids, existing_metadata
+                    )
+
+                    save_page_html(
+                        space_key=space_key,
+                        page_id=page_id,
+                        title=title,
+                        html_content=body,
+                        version=version,
+                        url=url,
+                        ancestors=ancestor_ids,
+                    )
+                    saved_count += 1
+                except Exception as e:
+                    logger.debug(f"Failed to sync page {page_id}: {e}")
+
+            if not pages_seen:
+                logger.debug(f"Space {space_key}: no pages found or changed")
+                continue
+
+            # Cleanup deleted pages (only a full sync sees every page)
+            if full_sync:
+                deleted = cleanup_deleted_pages(space_key, fetched_page_ids, existing_metadata)
+                if deleted:
+                    logger.debug(f"Space {space_key}: cleaned up {len(deleted)} deleted pages")
 
             logger.info(f"Auto-sync complete for {space_key}: {saved_count} pages updated")
 
@@ -3,8 +3,8 @@ Utility functions for the MCP Atlassian integration.
 This package provides various utility functions used throughout the codebase.
 """
 
-from .date import parse_date
-from .io import is_read_only_mode
+from .date import parse_date, parse_iso_datetime
+from .io import file_signature, is_read_only_mode
 
 # Export lifecycle utilities
 from .lifecycle import (
@@ -19,10 +19,12 @@ from .urls import is_atlassian_cloud_url
 __all__ = [
     "SSLIgnoreAdapter",
     "configure_ssl_verification",
+    "file_signature",
     "is_atlassian_cloud_url",
     "is_read_only_mode",
     "setup_logging",
     "parse_date",
+    "parse_iso_datetime",
     "setup_signal_handlers",
     "ensure_clean_exit",
 ]
@@ -1,6 +1,7 @@
 """Utility functions for date operations."""
 
 import logging
+import sys
 from datetime import datetime, timezone
 
 import dateutil.parser
@@ -29,3 +30,23 @@ def parse_date(date_str: str | int | None) -> datetime | None:
     if isinstance(date_str, int) or date_str.isdigit():
         return datetime.fromtimestamp(int(date_str) / 1000, tz=timezone.utc)
     return dateutil.parser.parse(date_str)
+
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing "Z" itself from Python 3.11 on
+    parse_iso_datetime = datetime.fromisoformat
+else:
+
+    def parse_iso_datetime(date_str: str) -> datetime:
+        """Parse an ISO 8601 timestamp, accepting "Z" for UTC.
+
+        Args:
+            date_str: ISO 8601 timestamp, e.g. a stored last_synced value
+
+        Returns:
+            The parsed datetime
+
+        Raises:
+            ValueError: If date_str is not a valid ISO 8601 timestamp
+        """
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
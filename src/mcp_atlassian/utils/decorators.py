@@ -58,13 +58,12 @@ def handle_atlassian_api_errors(service_name: str = "Atlassian API") -> Callable
             try:
                 return func(self, *args, **kwargs)
             except HTTPError as http_err:
-                if http_err.response is not None and http_err.response.status_code in [
-                    401,
-                    403,
-                ]:
+                response = http_err.response
+                status = response.status_code if response is not None else None
+                if status == 401 or status == 403:
                     error_msg = (
                         f"Authentication failed for {service_name} "
-                        f"({http_err.response.status_code}). "
+                        f"({status}). "
                         "Token may be expired or invalid. Please verify credentials."
                     )
                     logger.error(error_msg)
@@ -0,0 +1,137 @@
+"""Optional orjson-backed JSON handling for API responses and local metadata."""
+
+import json
+import logging
+from typing import Any
+
+from requests import Response
+
+from mcp_atlassian.utils.env import is_env_truthy
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def is_orjson_available() -> bool:
+    """Check whether the optional orjson package is installed."""
+    return orjson is not None
+
+
+def dumps_indented(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes indented by two spaces.
+
+    Uses orjson when installed, otherwise the stdlib encoder. Non-ASCII
+    characters are written as-is in both cases.
+
+    Args:
+        data: The JSON-serializable object
+
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_compact(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes without whitespace.
+
+    Uses orjson when installed, otherwise the stdlib encoder with the same
+    separators. Non-ASCII characters are written as-is in both cases.
+
+    Args:
+        data: The JSON-serializable object
+
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps_text(data: Any) -> str:
+    """Serialize data to a JSON string for a tool result.
+
+    Results are compact, since MCP clients parse them. Setting
+    CONFLUENCE_PRETTY_JSON indents them by two spaces for debugging.
+
+    Args:
+        data: The JSON-serializable object
+
+    Returns:
+        The JSON document as a string
+    """
+    if is_env_truthy("CONFLUENCE_PRETTY_JSON"):
+        return dumps_indented(data).decode("utf-8")
+    return dumps_compact(data).decode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """Deserialize a UTF-8 JSON document, using orjson when installed.
+
+    Args:
+        data: The raw JSON bytes
+
+    Returns:
+        The decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _use_orjson_decoder(response: Response, *args, **kwargs) -> Response:
+    """Replace response.json with an orjson-backed decoder.
+
+    This is a requests response hook. The stdlib decoder is kept as a
+    fallback for keyword arguments orjson does not support and for bodies
+    orjson rejects (e.g. non-UTF-8 payloads), so callers see the same
+    results and exceptions as before.
+
+    Args:
+        response: The response object from requests
+        *args: Additional positional arguments (ignored)
+        **kwargs: Additional keyword arguments (ignored)
+
+    Returns:
+        The same response object
+    """
+    stdlib_json = response.json
+
+    def _json(**json_kwargs: Any) -> Any:
+        if json_kwargs:
+            return stdlib_json(**json_kwargs)
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            return stdlib_json()
+
+    response.json = _json  # type: ignore[method-assign]
+    return response
+
+
+def install_fast_json_decoding(session) -> None:
+    """Install the orjson response hook on a requests session.
+
+    Does nothing when orjson is not installed.
+
+    Args:
+        session: A requests.Session object to decode responses for
+    """
+    if orjson is None:
+        logger.debug("orjson not installed, using stdlib JSON decoding")
+        return
+
+    if "response" not in session.hooks:
+        session.hooks["response"] = []
+
+    # Avoid duplicate hooks
+    if _use_orjson_decoder not in session.hooks["response"]:
+        session.hooks["response"].append(_use_orjson_decoder)
+        logger.debug("orjson response decoding installed on session")
@@ -1,5 +1,8 @@
 """I/O utility functions for MCP Atlassian."""
 
+import os
+from pathlib import Path
+
 from mcp_atlassian.utils.env import is_env_extended_truthy
 
 
@@ -15,3 +18,26 @@ def is_read_only_mode() -> bool:
         True if read-only mode is enabled, False otherwise
     """
     return is_env_extended_truthy("READ_ONLY_MODE", "false")
+
+
+def file_signature(*paths: Path) -> tuple:
+    """Identify the current contents of files by their inode, mtime and size.
+
+    The signature changes when any of the files is written, replaced, created
+    or removed, so it can tell whether data parsed from them is still current.
+
+    Args:
+        paths: The files to describe
+
+    Returns:
+        One (inode, mtime_ns, size) tuple per file, or None for a missing file
+    """
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            signature.append(None)
+        else:
+            signature.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
@@ -6,6 +6,8 @@ across all test modules. It integrates with the new test utilities framework
 to provide efficient, reusable test fixtures.
 """
 
+import sys
+
 import pytest
 
 from tests.utils.factories import (
@@ -97,6 +99,22 @@ def basic_auth_environment():
         yield env
 
 
+@pytest.fixture(autouse=True)
+def reset_local_storage_paths():
+    """
+    Fixture that forgets cached local storage paths after each test.
+
+    Storage paths are resolved once per process, but many tests chdir
+    into a temporary directory.
+    """
+    yield
+    # Server tests import the package both as mcp_atlassian and src.mcp_atlassian
+    for name in ("mcp_atlassian.local_storage", "src.mcp_atlassian.local_storage"):
+        local_storage = sys.modules.get(name)
+        if local_storage is not None:
+            local_storage.reset_path_caches()
+
+
 # ============================================================================
 # Factory-Based Fixtures
 # ============================================================================
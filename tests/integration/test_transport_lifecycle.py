@@ -257,7 +257,7 @@ class TestRegressionPrevention:
 
     def test_signal_handlers_are_setup(self):
         """Verify signal handlers are properly configured."""
-        with patch("mcp_atlassian.setup_signal_handlers") as mock_setup:
+        with patch("mcp_atlassian.utils.lifecycle.setup_signal_handlers") as mock_setup:
             with patch("asyncio.run"):
                 with patch("mcp_atlassian.servers.main.AtlassianMCP"):
                     with patch("sys.argv", ["mcp-atlassian"]):
@@ -373,6 +373,12 @@ def mock_preprocessor():
         "Processed Markdown",
     )
 
+    preprocessor_instance.process_html_content_single.side_effect = (
+        lambda *args, to_markdown=True, **kwargs: (
+            "Processed Markdown" if to_markdown else "<p>Processed HTML</p>"
+        )
+    )
+
     # Additional processing methods
     preprocessor_instance.clean_html.return_value = "<p>Clean HTML</p>"
     preprocessor_instance.html_to_markdown.return_value = "# Markdown Content"
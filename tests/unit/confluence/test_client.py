@@ -4,7 +4,7 @@ import os
 from unittest.mock import MagicMock, patch
 
 from mcp_atlassian.confluence import ConfluenceFetcher
-from mcp_atlassian.confluence.client import ConfluenceClient
+from mcp_atlassian.confluence.client import SPACE_KEY_CACHE_MAXSIZE, ConfluenceClient
 from mcp_atlassian.confluence.config import ConfluenceConfig
 
 
@@ -260,3 +260,53 @@ def test_init_no_proxies(monkeypatch):
     )
     client = ConfluenceClient(config=config)
     assert mock_session.proxies == {}
+
+
+def test_search_cache_is_shared_per_site_and_user():
+    """Test clients share cached searches only with the same site and user."""
+
+    def make_client(username):
+        config = ConfluenceConfig(
+            url="https://test.atlassian.net/wiki",
+            auth_type="basic",
+            username=username,
+            api_token="token",
+        )
+        with (
+            patch("mcp_atlassian.confluence.client.Confluence"),
+            patch("mcp_atlassian.preprocessing.confluence.ConfluencePreprocessor"),
+            patch("mcp_atlassian.confluence.client.configure_ssl_verification"),
+        ):
+            return ConfluenceFetcher(config=config)
+
+    first, second, other = make_client("a"), make_client("a"), make_client("b")
+    key = ("search", "type=page AND title ~ shared-cache-test", 10)
+    first._store_cached_search(key, [])
+
+    assert second._get_cached_search(key) == []
+    assert other._get_cached_search(key) is None
+
+    second._clear_search_cache()
+    assert first._get_cached_search(key) is None
+
+
+def test_space_key_cache_is_bounded():
+    """Test the per-client space key cache evicts its oldest entries."""
+    config = ConfluenceConfig(
+        url="https://test.atlassian.net/wiki",
+        auth_type="basic",
+        username="user",
+        api_token="token",
+    )
+    with (
+        patch("mcp_atlassian.confluence.client.Confluence"),
+        patch("mcp_atlassian.preprocessing.confluence.ConfluencePreprocessor"),
+        patch("mcp_atlassian.confluence.client.configure_ssl_verification"),
+    ):
+        client = ConfluenceClient(config=config)
+
+    for page_id in range(SPACE_KEY_CACHE_MAXSIZE + 1):
+        client._space_key_cache[str(page_id)] = "PROJ"
+
+    assert len(client._space_key_cache) == SPACE_KEY_CACHE_MAXSIZE
+    assert "0" not in client._space_key_cache
@@ -3,8 +3,14 @@
 from unittest.mock import patch
 
 import pytest
-
-from mcp_atlassian.confluence.pages import PagesMixin
+import requests
+from cachetools import LRUCache
+from requests.exceptions import HTTPError
+
+from mcp_atlassian.confluence.client import SPACE_KEY_CACHE_MAXSIZE
+from mcp_atlassian.confluence.pages import PagesMixin, _extract_storage_value
+from mcp_atlassian.confluence.utils import MAX_CONCURRENT_WORKERS
+from mcp_atlassian.exceptions import ConfluenceVersionConflictError
 from mcp_atlassian.models.confluence import ConfluencePage
 
 
@@ -142,17 +148,13 @@ class TestPagesMixin:
         """Test getting page content in HTML format."""
         pages_mixin.config.url = "https://example.atlassian.net/wiki"
 
-        # Mock the preprocessor to return HTML
-        pages_mixin.preprocessor.process_html_content.return_value = (
-            "<p>Processed HTML</p>",
-            "Processed Markdown",
-        )
-
         # Act
         result = pages_mixin.get_page_content("987654321", convert_to_markdown=False)
 
         # Assert HTML processing was used
         assert result.content == "<p>Processed HTML</p>"
+        _, kwargs = pages_mixin.preprocessor.process_html_content_single.call_args
+        assert kwargs["to_markdown"] is False
 
     def test_get_page_by_title_success(self, pages_mixin):
         """Test getting a page by title when it exists."""
@@ -169,12 +171,6 @@ class TestPagesMixin:
             "version": {"number": 1},
         }
 
-        # Mock the HTML processing
-        pages_mixin.preprocessor.process_html_content.return_value = (
-            "<p>Processed HTML</p>",
-            "Processed Markdown",
-        )
-
         # Call the method
         result = pages_mixin.get_page_by_title(space_key, title)
 
@@ -309,6 +305,30 @@ class TestPagesMixin:
         with pytest.raises(Exception, match="API Error"):
             pages_mixin.create_page("PROJ", "Test Page", "<p>Content</p>")
 
+    def test_create_page_without_full_content(self, pages_mixin):
+        """Test create_page builds the model from the create response."""
+        pages_mixin.config.url = "https://example.atlassian.net/wiki"
+        pages_mixin.confluence.create_page.return_value = {
+            "id": "123456789",
+            "title": "New Page",
+            "space": {"key": "PROJ", "name": "Project"},
+            "version": {"number": 1},
+        }
+
+        with patch.object(pages_mixin, "get_page_content") as mock_get_content:
+            result = pages_mixin.create_page(
+                "PROJ",
+                "New Page",
+                "",
+                is_markdown=False,
+                return_full_content=False,
+            )
+
+        mock_get_content.assert_not_called()
+        assert result.id == "123456789"
+        assert result.title == "New Page"
+        assert result.version.number == 1
+
     def test_create_page_with_wiki_format(self, pages_mixin):
         """Test creating a new page with wiki markup format."""
         # Arrange
@@ -403,6 +423,47 @@ class TestPagesMixin:
         with pytest.raises(Exception, match="Failed to update page"):
             pages_mixin.update_page("987654321", "Test Page", "<p>Content</p>")
 
+    def test_update_page_from_base_version(self, pages_mixin):
+        """Test an update based on a known version is sent as the next one."""
+        # Arrange
+        pages_mixin.confluence.put.return_value = {
+            "id": "987654321",
+            "title": "Updated Page",
+            "version": {"number": 4},
+        }
+
+        # Act
+        result = pages_mixin.update_page(
+            "987654321",
+            "Updated Page",
+            "<p>Updated</p>",
+            version_comment="Edit",
+            is_markdown=False,
+            return_full_content=False,
+            base_version=3,
+        )
+
+        # Assert
+        pages_mixin.confluence.update_page.assert_not_called()
+        pages_mixin.confluence.history.assert_not_called()
+        data = pages_mixin.confluence.put.call_args.kwargs["data"]
+        assert data["version"] == {"number": 4, "minorEdit": False, "message": "Edit"}
+        assert data["body"]["storage"]["value"] == "<p>Updated</p>"
+        assert result.version.number == 4
+
+    def test_update_page_from_outdated_version(self, pages_mixin):
+        """Test a 409 for an outdated base version raises a conflict error."""
+        # Arrange
+        response = requests.Response()
+        response.status_code = 409
+        pages_mixin.confluence.put.side_effect = HTTPError(response=response)
+
+        # Act/Assert
+        with pytest.raises(ConfluenceVersionConflictError):
+            pages_mixin.update_page(
+                "987654321", "Page", "<p>x</p>", is_markdown=False, base_version=3
+            )
+
     def test_update_page_with_wiki_format(self, pages_mixin):
         """Test updating a page with wiki markup format."""
         # Arrange
@@ -535,12 +596,6 @@ class TestPagesMixin:
         }
         pages_mixin.confluence.get_page_child_by_type.return_value = child_pages_data
 
-        # Mock the preprocessor
-        pages_mixin.preprocessor.process_html_content.return_value = (
-            "<p>Processed HTML</p>",
-            "Processed Markdown",
-        )
-
         # Act
         results = pages_mixin.get_page_children(
             page_id=parent_id, expand="body.storage", convert_to_markdown=True
@@ -549,12 +604,28 @@ class TestPagesMixin:
         # Assert
         assert len(results) == 1
         assert results[0].content == "Processed Markdown"
-        pages_mixin.preprocessor.process_html_content.assert_called_once_with(
+        pages_mixin.preprocessor.process_html_content_single.assert_called_once_with(
             "<p>This is some content</p>",
             space_key="DEMO",
             confluence_client=pages_mixin.confluence,
+            to_markdown=True,
         )
 
+    def test_get_page_children_without_body_skips_processing(self, pages_mixin):
+        """Test the default listing does not touch the preprocessor."""
+        pages_mixin.config.url = "https://example.atlassian.net/wiki"
+        pages_mixin.confluence.get_page_child_by_type.return_value = {
+            "results": [
+                {"id": "1", "title": "A", "version": {"number": 1}},
+                {"id": "2", "title": "B", "version": {"number": 3}},
+            ]
+        }
+
+        results = pages_mixin.get_page_children(page_id="123456")
+
+        assert [r.id for r in results] == ["1", "2"]
+        pages_mixin.preprocessor.process_html_content_single.assert_not_called()
+
     def test_get_page_children_empty(self, pages_mixin):
         """Test getting child pages when there are none."""
         # Arrange
@@ -599,9 +670,9 @@ class TestPagesMixin:
         pages_mixin.confluence.get_page_by_id.return_value = page_data
 
         # Mock the preprocessor
-        pages_mixin.preprocessor.process_html_content.return_value = (
-            "<p>Processed HTML</p>",
-            "Processed content",
+        pages_mixin.preprocessor.process_html_content_single.side_effect = None
+        pages_mixin.preprocessor.process_html_content_single.return_value = (
+            "Processed content"
         )
 
         # Call the method
@@ -877,6 +948,36 @@ class TestPagesMixin:
         result = pages_mixin.get_page_by_title("TEST", "Test")
         assert isinstance(result, ConfluencePage)
 
+    def test_iter_space_pages_is_lazy(self, pages_mixin):
+        """Test iter_space_pages defers the API call until iterated."""
+        pages_mixin.config.url = "https://example.atlassian.net/wiki"
+
+        iterator = pages_mixin.iter_space_pages("PROJ", limit=10)
+        pages_mixin.confluence.get_all_pages_from_space.assert_not_called()
+
+        first = next(iterator)
+        assert isinstance(first, ConfluencePage)
+        assert first.id == "123456789"
+        assert len(list(iterator)) == 1
+
+    def test_iter_space_pages_processes_one_window_at_a_time(self, pages_mixin):
+        """Test page bodies are processed only as their window is reached."""
+        pages_mixin.config.url = "https://example.atlassian.net/wiki"
+        pages_mixin.confluence.get_all_pages_from_space.return_value = [
+            {"id": str(i), "title": f"Page {i}", "body": {"storage": {"value": "x"}}}
+            for i in range(MAX_CONCURRENT_WORKERS + 1)
+        ]
+        process = pages_mixin.preprocessor.process_html_content_single
+        process.side_effect = None
+        process.return_value = "processed"
+
+        iterator = pages_mixin.iter_space_pages("PROJ", limit=50)
+        next(iterator)
+        assert process.call_count == MAX_CONCURRENT_WORKERS
+
+        assert len(list(iterator)) == MAX_CONCURRENT_WORKERS
+        assert process.call_count == MAX_CONCURRENT_WORKERS + 1
+
     def test_get_space_pages_missing_body_regression(self, pages_mixin):
         """Regression test for #760: get_space_pages handles None body."""
         pages_mixin.confluence.get_all_pages_from_space.return_value = [
@@ -898,3 +999,63 @@ class TestPagesMixin:
         pages_mixin.config.url = "https://example.atlassian.net/wiki"
         results = pages_mixin.get_space_pages("T")
         assert len(results) == 2
+
+    @pytest.mark.parametrize(
+        ("page", "expected"),
+        [
+            ({}, ""),
+            ({"body": None}, ""),
+            ({"body": {"storage": None}}, ""),
+            ({"body": {"storage": {"value": None}}}, ""),
+            ({"body": {"storage": {"value": "<p>x</p>"}}}, "<p>x</p>"),
+        ],
+    )
+    def test_extract_storage_value(self, page, expected):
+        """Storage value lookup tolerates missing levels without raising."""
+        assert _extract_storage_value(page) == expected
+
+    def test_move_page_caches_target_space_key(self, pages_mixin):
+        """Test repeated moves to the same target only look up its space once."""
+        pages_mixin._space_key_cache = LRUCache(maxsize=SPACE_KEY_CACHE_MAXSIZE)
+        pages_mixin.confluence.get_page_by_id.return_value = {
+            "id": "999",
+            "space": {"key": "PROJ"},
+        }
+
+        assert pages_mixin.move_page("1", "999") is True
+        assert pages_mixin.move_page("2", "999") is True
+
+        pages_mixin.confluence.get_page_by_id.assert_called_once_with(
+            "999", expand="space"
+        )
+        pages_mixin.confluence.move_page.assert_called_with(
+            space_key="PROJ", page_id="2", target_id="999", position="append"
+        )
+
+    def test_move_page_forgets_space_key_of_moved_page(self, pages_mixin):
+        """Test a moved page's cached space key is dropped, as it may have changed."""
+        pages_mixin._space_key_cache = LRUCache(maxsize=SPACE_KEY_CACHE_MAXSIZE)
+        pages_mixin.confluence.get_page_by_id.side_effect = lambda page_id, **_: {
+            "id": page_id,
+            "space": {"key": "NEW" if page_id == "999" else "OLD"},
+        }
+
+        assert pages_mixin.move_page("1", "2") is True
+        assert "2" in pages_mixin._space_key_cache
+        assert pages_mixin.move_page("2", "999") is True
+        assert "2" not in pages_mixin._space_key_cache
+
+        pages_mixin.move_page("3", "2")
+        pages_mixin.confluence.move_page.assert_called_with(
+            space_key="OLD", page_id="3", target_id="2", position="append"
+        )
+        assert pages_mixin.confluence.get_page_by_id.call_count == 3
+
+    def test_delete_page_forgets_space_key(self, pages_mixin):
+        """Test a deleted page's cached space key is dropped."""
+        pages_mixin._space_key_cache = LRUCache(maxsize=SPACE_KEY_CACHE_MAXSIZE)
+        pages_mixin._space_key_cache["1"] = "PROJ"
+
+        pages_mixin.delete_page("1")
+
+        assert "1" not in pages_mixin._space_key_cache
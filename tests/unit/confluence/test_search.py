@@ -564,3 +564,250 @@ class TestSearchMixin:
         assert results[0].user.display_name == "Test User"
         assert results[0].title == "Test User"
         assert results[0].entity_type == "user"
+
+    def test_search_all_fetches_remaining_batches(self, search_mixin):
+        """Test search_all probes once, then fetches every remaining offset."""
+
+        def cql(cql, start, limit):
+            ids = range(start, min(start + 2, 5))
+            return {
+                "totalSize": 5,
+                "results": [
+                    {"content": {"id": str(i), "title": f"Page {i}", "type": "page"}}
+                    for i in ids
+                ],
+            }
+
+        search_mixin.confluence.cql.side_effect = cql
+        search_mixin.config.spaces_filter = None
+
+        results = search_mixin.search_all("type=page")
+
+        assert [page.id for page in results] == ["0", "1", "2", "3", "4"]
+        starts = sorted(
+            call.kwargs["start"] for call in search_mixin.confluence.cql.call_args_list
+        )
+        assert starts == [0, 2, 4]
+
+    def test_get_all_space_pages_with_content_stops_on_short_batch(self, search_mixin):
+        """Test bulk fetch keeps offset order and stops at the first short batch."""
+        search_mixin.BULK_CONTENT_LIMIT = 2
+        search_mixin.BULK_CONTENT_CONCURRENCY = 2
+
+        def get(path, params):
+            start = params["start"]
+            ids = range(start, min(start + params["limit"], 5))
+            return {"results": [{"id": str(i)} for i in ids]}
+
+        search_mixin.confluence.get.side_effect = get
+
+        pages = search_mixin.get_all_space_pages_with_content("SPACE")
+
+        assert [page["id"] for page in pages] == ["0", "1", "2", "3", "4"]
+
+    def test_get_all_space_pages_with_content_follows_server_page_size(
+        self, search_mixin
+    ):
+        """Test bulk fetch pages by the limit the server applied, not requested."""
+        search_mixin.BULK_CONTENT_CONCURRENCY = 2
+
+        def get(path, params):
+            start = params["start"]
+            ids = range(start, min(start + 2, 5))
+            return {"results": [{"id": str(i)} for i in ids], "limit": 2}
+
+        search_mixin.confluence.get.side_effect = get
+
+        pages = search_mixin.get_all_space_pages_with_content("SPACE")
+
+        assert [page["id"] for page in pages] == ["0", "1", "2", "3", "4"]
+        requested = search_mixin.confluence.get.call_args_list[0].kwargs["params"]
+        assert requested["limit"] == search_mixin.BULK_CONTENT_LIMIT
+
+    def test_search_results_are_cached_until_cleared(self, search_mixin):
+        """Test repeated searches hit the cache and writes invalidate it."""
+        from cachetools import TTLCache
+
+        search_mixin._search_cache = TTLCache(maxsize=8, ttl=60)
+        search_mixin.config.spaces_filter = None
+        search_mixin.confluence.cql.return_value = {
+            "results": [{"content": {"id": "1", "title": "Page", "type": "page"}}]
+        }
+
+        first = search_mixin.search("type=page")
+        second = search_mixin.search("type=page ")
+
+        assert search_mixin.confluence.cql.call_count == 1
+        assert [p.id for p in second] == [p.id for p in first]
+        assert second[0] is not first[0]
+
+        search_mixin._clear_search_cache()
+        search_mixin.search("type=page")
+        assert search_mixin.confluence.cql.call_count == 2
+
+    @pytest.mark.parametrize(
+        "cql,expected",
+        [
+            ('space = "DEV"', 'space = "DEV"'),
+            ('SPACE="DEV"', 'SPACE="DEV"'),
+            ('title ~ "space = foo"', '(title ~ "space = foo") AND (space = TEAM)'),
+        ],
+    )
+    def test_apply_spaces_filter_detects_space_clause(
+        self, search_mixin, cql, expected
+    ):
+        """Test the space guard ignores quoted text and handles case/spacing."""
+        assert search_mixin._apply_spaces_filter(cql, "TEAM") == expected
+
+    def test_get_all_space_pages_with_content_projects_fields(self, search_mixin):
+        """Test bulk results keep only the fields sync consumers read."""
+        search_mixin.confluence.get.return_value = {
+            "results": [
+                {
+                    "id": "1",
+                    "title": "Page",
+                    "body": {"storage": {"value": "<p>x</p>"}},
+                    "version": {"number": 3},
+                    "ancestors": [{"id": "0", "title": "Root", "_links": {}}],
+                    "_links": {"webui": "/spaces/S/pages/1", "self": "https://x"},
+                    "_expandable": {"children": ""},
+                    "extensions": {"position": 1},
+                }
+            ]
+        }
+
+        pages = search_mixin.get_all_space_pages_with_content("S")
+
+        assert pages == [
+            {
+                "id": "1",
+                "title": "Page",
+                "body": {"storage": {"value": "<p>x</p>"}},
+                "version": {"number": 3},
+                "ancestors": [{"id": "0", "title": "Root"}],
+                "_links": {"webui": "/spaces/S/pages/1"},
+            }
+        ]
+
+    def test_search_all_with_content_follows_next_links(self, search_mixin):
+        """Test expanded search pages with the next link's query parameters."""
+        search_mixin.config.spaces_filter = None
+        responses = {
+            None: {
+                "results": [{"id": "1", "title": "One", "_expandable": {}}],
+                "_links": {"next": "/rest/api/content/search?cql=x&cursor=abc"},
+            },
+            "abc": {"results": [{"id": "2", "title": "Two"}], "_links": {}},
+        }
+
+        def get(path, params):
+            assert path == "rest/api/content/search"
+            assert "ancestors" in params["expand"]
+            return responses[params.get("cursor")]
+
+        search_mixin.confluence.get.side_effect = get
+
+        pages = search_mixin.search_all_with_content("type=page")
+
+        assert pages == [{"id": "1", "title": "One"}, {"id": "2", "title": "Two"}]
+        assert search_mixin.confluence.get.call_count == 2
+
+    def test_search_by_ids_batches_queries(self, search_mixin):
+        """Test ids are deduplicated and fetched with one CQL query per batch."""
+        search_mixin.ID_BATCH_SIZE = 2
+        search_mixin.config.spaces_filter = None
+
+        def cql(cql, start, limit):
+            ids = cql[len("id in (") : -1].split(",")
+            return {
+                "totalSize": len(ids),
+                "results": [
+                    {"content": {"id": i, "title": f"Page {i}", "type": "page"}}
+                    for i in ids
+                ],
+            }
+
+        search_mixin.confluence.cql.side_effect = cql
+
+        results = search_mixin.search_by_ids(["1", "2", "2", "3"])
+
+        assert sorted(page.id for page in results) == ["1", "2", "3"]
+        queries = sorted(
+            call.kwargs["cql"] for call in search_mixin.confluence.cql.call_args_list
+        )
+        assert queries == ["id in (1,2)", "id in (3)"]
+
+    def test_search_by_ids_rejects_non_numeric(self, search_mixin):
+        """Test non-numeric ids are rejected instead of being put into CQL."""
+        assert search_mixin.search_by_ids(["1", "2) OR (type=page"]) == []
+        search_mixin.confluence.cql.assert_not_called()
+
+    def test_search_all_follows_next_link_when_total_size_is_wrong(self, search_mixin):
+        """Test search_all keeps paging while _links.next is present."""
+
+        def cql(cql, start, limit):
+            ids = range(start, min(start + 2, 5))
+            results = {
+                "totalSize": 0,
+                "results": [
+                    {"content": {"id": str(i), "title": f"Page {i}", "type": "page"}}
+                    for i in ids
+                ],
+                "_links": {},
+            }
+            if start + 2 < 5:
+                results["_links"]["next"] = f"/rest/api/search?start={start + 2}"
+            return results
+
+        search_mixin.confluence.cql.side_effect = cql
+        search_mixin.config.spaces_filter = None
+
+        results = search_mixin.search_all("type=page")
+
+        assert [page.id for page in results] == ["0", "1", "2", "3", "4"]
+
+    def test_search_processes_duplicate_excerpts_once(self, search_mixin):
+        """Test identical excerpts in one response are converted once."""
+        search_mixin.config.spaces_filter = None
+        search_mixin.confluence.cql.return_value = {
+            "results": [
+                {
+                    "content": {"id": str(i), "title": f"Page {i}", "type": "page"},
+                    "excerpt": "No description available",
+                }
+                for i in range(3)
+            ]
+        }
+        search_mixin.preprocessor.process_html_content.return_value = (
+            "<p>Processed HTML</p>",
+            "Processed content",
+        )
+
+        results = search_mixin.search("type=page")
+
+        assert [page.content for page in results] == ["Processed content"] * 3
+        search_mixin.preprocessor.process_html_content.assert_called_once()
+
+    def test_search_user_batches_large_limits(self, search_mixin):
+        """Test limits above one page are split into offset requests."""
+        search_mixin.MAX_USER_SEARCH_LIMIT = 2
+
+        def get(path, params):
+            start = params["start"]
+            return {
+                "results": [
+                    {"user": {"accountId": f"id-{i}", "displayName": f"User {i}"}}
+                    for i in range(start, start + params["limit"])
+                ]
+            }
+
+        search_mixin.confluence.get.side_effect = get
+
+        results = search_mixin.search_user("user.fullname ~ 'a'", limit=5)
+
+        assert [r.user.account_id for r in results] == [f"id-{i}" for i in range(5)]
+        limits = sorted(
+            (call.kwargs["params"]["start"], call.kwargs["params"]["limit"])
+            for call in search_mixin.confluence.get.call_args_list
+        )
+        assert limits == [(0, 2), (2, 2), (4, 1)]
@@ -1,7 +1,10 @@
 """Tests for the Confluence utility functions."""
 
 from mcp_atlassian.confluence.constants import RESERVED_CQL_WORDS
-from mcp_atlassian.confluence.utils import quote_cql_identifier_if_needed
+from mcp_atlassian.confluence.utils import (
+    map_concurrently,
+    quote_cql_identifier_if_needed,
+)
 
 
 class TestCQLQuoting:
@@ -55,3 +58,16 @@ class TestCQLQuoting:
         assert quote_cql_identifier_if_needed("DEV") == "DEV"
         assert quote_cql_identifier_if_needed("MYSPACE") == "MYSPACE"
         assert quote_cql_identifier_if_needed("documentation") == "documentation"
+
+
+class TestMapConcurrently:
+    """Tests for the map_concurrently helper."""
+
+    def test_preserves_order(self):
+        """Test that results come back in input order."""
+        assert map_concurrently(lambda x: x * 2, [3, 1, 2]) == [6, 2, 4]
+
+    def test_empty_and_single(self):
+        """Test the inline paths for trivial inputs."""
+        assert map_concurrently(str, []) == []
+        assert map_concurrently(str, [1]) == ["1"]
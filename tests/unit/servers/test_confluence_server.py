@@ -9,6 +9,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import anyio
 import pytest
 from fastmcp import Client, FastMCP
 from fastmcp.client import FastMCPTransport
@@ -66,8 +67,8 @@ def mock_confluence_fetcher():
     mock_fetcher.get_page_ancestors.return_value = [mock_ancestor]
     mock_fetcher.update_page.return_value = mock_page
 
-    # Mock for full sync - returns raw page dicts
-    mock_fetcher.get_all_space_pages_with_content.return_value = [{
+    # Mock for full and incremental sync - returns raw page dicts
+    raw_page = {
         "id": "123456",
         "title": "Test Page Mock Title",
         "body": {"storage": {"value": "<p>This is test page content</p>"}},
@@ -75,7 +76,11 @@ def mock_confluence_fetcher():
         "ancestors": [{"id": "111111"}],
         "_links": {"webui": "/spaces/TEST/pages/123456/Test+Page"},
         "space": {"key": "TEST", "name": "Test Space"},
-    }]
+    }
+    mock_fetcher.iter_all_space_pages_with_content.side_effect = (
+        lambda space_key: iter([raw_page])
+    )
+    mock_fetcher.iter_search_all_with_content.side_effect = lambda cql: iter([raw_page])
 
     # Mock config for URL building
     mock_config = MagicMock()
@@ -102,6 +107,7 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
 
     # Import and register tool functions (as they are in confluence.py)
     from src.mcp_atlassian.servers.confluence import (
+        create_page,
         push_page_update,
         read_page,
         sync_space,
@@ -127,6 +133,7 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
     confluence_sub_mcp.tool()(sync_space)
     confluence_sub_mcp.tool()(read_page)
     confluence_sub_mcp.tool()(push_page_update)
+    confluence_sub_mcp.tool()(create_page)
 
     test_mcp.mount("confluence", confluence_sub_mcp)
 
@@ -167,13 +174,28 @@ async def client(test_confluence_mcp, mock_confluence_fetcher, tmp_path, monkeyp
             yield connected_client
 
 
+def test_build_incremental_cql():
+    """Test the incremental CQL is limited to pages modified since the sync."""
+    from src.mcp_atlassian.servers.confluence.sync import build_incremental_cql
+
+    assert build_incremental_cql("TEST", "2024-01-02T03:04:05+00:00") == (
+        'type=page AND space.key="TEST" AND lastModified >= "2024-01-02 03:04"'
+    )
+    assert build_incremental_cql("TEST", None) == 'type=page AND space.key="TEST"'
+    assert build_incremental_cql("TEST", "not a date") == (
+        'type=page AND space.key="TEST"'
+    )
+
+
 @pytest.mark.anyio
 async def test_sync_space(client, mock_confluence_fetcher, tmp_path):
     """Test the sync_space tool with basic space key."""
     response = await client.call_tool("confluence_sync_space", {"space_key": "TEST"})
 
     # Full sync (first sync) uses bulk fetch, not search
-    mock_confluence_fetcher.get_all_space_pages_with_content.assert_called_once_with("TEST")
+    mock_confluence_fetcher.iter_all_space_pages_with_content.assert_called_once_with(
+        "TEST"
+    )
 
     result_data = json.loads(response[0].text)
     assert result_data["success"] is True
@@ -186,10 +208,184 @@ async def test_sync_space(client, mock_confluence_fetcher, tmp_path):
     assert storage_path.exists()
 
 
+@pytest.mark.anyio
+async def test_sync_space_in_batches(
+    client, mock_confluence_fetcher, tmp_path, monkeypatch
+):
+    """Test a full sync processes pages across several fetch batches."""
+    monkeypatch.setattr(
+        "src.mcp_atlassian.servers.confluence.sync.SYNC_BATCH_SIZE", 2
+    )
+    monkeypatch.setattr(
+        "src.mcp_atlassian.servers.confluence.sync.SYNC_DISPLAY_LIMIT", 3
+    )
+    fetched = []
+
+    def iter_pages(space_key):
+        for i in range(5):
+            fetched.append(i)
+            yield {
+                "id": str(i),
+                "title": f"Page {i}",
+                "body": {"storage": {"value": f"<p>{i}</p>"}},
+                "version": {"number": 1},
+                "ancestors": [{"id": "0"}] if i else [],
+            }
+
+    mock_confluence_fetcher.iter_all_space_pages_with_content.side_effect = iter_pages
+
+    response = await client.call_tool("confluence_sync_space", {"space_key": "TEST"})
+
+    result_data = json.loads(response[0].text)
+    assert result_data["pages_synced"] == 5
+    assert result_data["total_pages_in_cache"] == 5
+    assert fetched == [0, 1, 2, 3, 4]
+    assert [p["page_id"] for p in result_data["synced_pages"]] == ["0", "1", "2"]
+    assert result_data["synced_pages_truncated"] is True
+
+
+@pytest.mark.anyio
+async def test_sync_space_fetches_next_batch_while_saving(
+    client, mock_confluence_fetcher, tmp_path, monkeypatch
+):
+    """Test the next batch is fetched while the current one is written."""
+    import threading
+
+    from src.mcp_atlassian.servers.confluence import sync
+
+    monkeypatch.setattr(sync, "SYNC_BATCH_SIZE", 1)
+    second_fetched = threading.Event()
+
+    def iter_pages(space_key):
+        for i in range(2):
+            if i:
+                second_fetched.set()
+            yield {
+                "id": str(i),
+                "title": f"Page {i}",
+                "body": {"storage": {"value": f"<p>{i}</p>"}},
+                "version": {"number": 1},
+                "ancestors": [],
+            }
+
+    mock_confluence_fetcher.iter_all_space_pages_with_content.side_effect = iter_pages
+    overlapped = []
+    save_page_html_async = sync.save_page_html_async
+
+    async def save_after_next_fetch(**kwargs):
+        if kwargs["page_id"] == "0":
+            overlapped.append(await anyio.to_thread.run_sync(second_fetched.wait, 5))
+        return await save_page_html_async(**kwargs)
+
+    monkeypatch.setattr(sync, "save_page_html_async", save_after_next_fetch)
+
+    response = await client.call_tool("confluence_sync_space", {"space_key": "TEST"})
+
+    assert json.loads(response[0].text)["pages_synced"] == 2
+    assert overlapped == [True]
+
+
+@pytest.mark.anyio
+async def test_sync_space_records_pages_saved_before_fetch_error(
+    client, mock_confluence_fetcher, tmp_path, monkeypatch
+):
+    """Test pages written before a failed batch fetch are kept in the metadata."""
+    from src.mcp_atlassian import local_storage
+
+    monkeypatch.setattr(
+        "src.mcp_atlassian.servers.confluence.sync.SYNC_BATCH_SIZE", 1
+    )
+
+    def iter_pages(space_key):
+        yield {
+            "id": "1",
+            "title": "Page 1",
+            "body": {"storage": {"value": "<p>1</p>"}},
+            "version": {"number": 1},
+            "ancestors": [],
+        }
+        raise ConnectionError("connection reset")
+
+    mock_confluence_fetcher.iter_all_space_pages_with_content.side_effect = iter_pages
+
+    response = await client.call_tool("confluence_sync_space", {"space_key": "TEST"})
+
+    assert "connection reset" in json.loads(response[0].text)["error"]
+    metadata = local_storage.load_space_metadata("TEST")
+    assert list(metadata.page_index) == ["1"]
+    # The next sync must be a full one, as most of the space was never fetched
+    assert metadata.last_synced.startswith("1970-01-01")
+
+
+@pytest.mark.anyio
+async def test_failed_resync_keeps_previous_sync_time(
+    client, mock_confluence_fetcher, tmp_path, monkeypatch
+):
+    """Test a failed sync of a synced space records pages but not the sync."""
+    from src.mcp_atlassian import local_storage
+
+    monkeypatch.setattr(
+        "src.mcp_atlassian.servers.confluence.sync.SYNC_BATCH_SIZE", 1
+    )
+    await client.call_tool("confluence_sync_space", {"space_key": "TEST"})
+    first_sync = local_storage.load_space_metadata("TEST").last_synced
+
+    def iter_pages(space_key):
+        yield {
+            "id": "2",
+            "title": "Page 2",
+            "body": {"storage": {"value": "<p>2</p>"}},
+            "version": {"number": 1},
+            "ancestors": [],
+        }
+        raise ConnectionError("connection reset")
+
+    mock_confluence_fetcher.iter_all_space_pages_with_content.side_effect = iter_pages
+
+    await client.call_tool(
+        "confluence_sync_space", {"space_key": "TEST", "full_sync": True}
+    )
+
+    metadata = local_storage.load_space_metadata("TEST")
+    assert set(metadata.page_index) == {"123456", "2"}
+    assert metadata.last_synced == first_sync
+
+
+@pytest.mark.anyio
+async def test_full_sync_removes_deleted_pages(
+    client, mock_confluence_fetcher, tmp_path
+):
+    """Test a full sync drops local pages Confluence no longer returns."""
+    from src.mcp_atlassian import local_storage
+
+    def page(page_id):
+        return {
+            "id": page_id,
+            "title": f"Page {page_id}",
+            "body": {"storage": {"value": "<p>x</p>"}},
+            "version": {"number": 1},
+            "ancestors": [],
+        }
+
+    fetch = mock_confluence_fetcher.iter_all_space_pages_with_content
+    fetch.side_effect = lambda space_key: iter([page("1"), page("2")])
+    await client.call_tool("confluence_sync_space", {"space_key": "TEST"})
+
+    fetch.side_effect = lambda space_key: iter([page("1")])
+    response = await client.call_tool(
+        "confluence_sync_space", {"space_key": "TEST", "full_sync": True}
+    )
+
+    assert json.loads(response[0].text)["total_pages_in_cache"] == 1
+    assert list(local_storage.load_space_metadata("TEST").page_index) == ["1"]
+    assert not (tmp_path / ".better-confluence-mcp" / "TEST" / "2").exists()
+
+
 @pytest.mark.anyio
 async def test_sync_space_empty(client, mock_confluence_fetcher):
     """Test sync_space with no pages found."""
-    mock_confluence_fetcher.get_all_space_pages_with_content.return_value = []
+    mock_confluence_fetcher.iter_all_space_pages_with_content.side_effect = None
+    mock_confluence_fetcher.iter_all_space_pages_with_content.return_value = iter([])
 
     response = await client.call_tool(
         "confluence_sync_space", {"space_key": "EMPTY"}
@@ -220,6 +416,165 @@ async def test_read_page(client, mock_confluence_fetcher, tmp_path):
     assert local_path.exists()
 
 
+@pytest.mark.anyio
+async def test_read_page_reuses_metadata_from_its_sync(
+    client, mock_confluence_fetcher, monkeypatch
+):
+    """Test read_page builds its result from the metadata its sync returned."""
+    from src.mcp_atlassian.servers.confluence import pages
+
+    loads = []
+    load_space_metadata = pages.load_space_metadata
+
+    def counting_load(space_key):
+        loads.append(space_key)
+        return load_space_metadata(space_key)
+
+    monkeypatch.setattr(
+        "src.mcp_atlassian.servers.confluence.pages.load_space_metadata",
+        counting_load,
+    )
+
+    response = await client.call_tool("confluence_read_page", {"page_ids": "123456"})
+
+    result_data = json.loads(response[0].text)
+    assert result_data["success"] is True
+    assert result_data["total_pages_in_space"] == 1
+    assert result_data["siblings"] == [
+        {
+            "page_id": "123456",
+            "title": "Test Page Mock Title",
+            "local_path": result_data["local_path"],
+            "requested": True,
+        }
+    ]
+    assert loads == []
+
+
+@pytest.mark.anyio
+async def test_read_page_syncs_after_plain_write(client, monkeypatch):
+    """Test a write that doesn't sync, like a metadata save, keeps a read's sync."""
+    from src.mcp_atlassian.servers.confluence import pages
+    from src.mcp_atlassian.servers.confluence._server import get_space_lock
+
+    await client.call_tool("confluence_read_page", {"page_ids": "123456"})
+
+    syncs = []
+    sync_space_with_metadata = pages.sync_space_with_metadata
+
+    async def counting_sync(confluence_fetcher, space_key, full_sync):
+        syncs.append(space_key)
+        return await sync_space_with_metadata(confluence_fetcher, space_key, full_sync)
+
+    monkeypatch.setattr(
+        "src.mcp_atlassian.servers.confluence.pages.sync_space_with_metadata",
+        counting_sync,
+    )
+
+    lock = get_space_lock("TEST")
+    responses = []
+
+    async def save_metadata():
+        async with lock.write():
+            pages.save_space_metadata(pages.load_space_metadata("TEST"))
+
+    async def read():
+        responses.append(
+            await client.call_tool("confluence_read_page", {"page_ids": "123456"})
+        )
+
+    # The metadata save queues first, so it takes the lock between the read
+    # starting to wait and the read getting the lock
+    async with anyio.create_task_group() as task_group:
+        async with lock.write():
+            task_group.start_soon(save_metadata)
+            await anyio.wait_all_tasks_blocked()
+            task_group.start_soon(read)
+            await anyio.wait_all_tasks_blocked()
+
+    assert syncs == ["TEST"]
+    assert json.loads(responses[0][0].text)["success"] is True
+
+
+@pytest.mark.anyio
+async def test_read_page_syncs_spaces_concurrently(client, mock_confluence_fetcher):
+    """Test pages from different spaces are synced at the same time."""
+    import threading
+
+    def search_result(page_id, space_key):
+        page = MagicMock(spec=ConfluencePage)
+        page.id = page_id
+        page.space = MagicMock(spec=ConfluenceSpace)
+        page.space.key = space_key
+        page.space.name = f"{space_key} Space"
+        return page
+
+    mock_confluence_fetcher.search_all.return_value = [
+        search_result("1", "ONE"),
+        search_result("2", "TWO"),
+    ]
+    # Each space's fetch waits for the other one to start
+    both_fetching = threading.Barrier(2, timeout=5)
+
+    def iter_pages(space_key):
+        both_fetching.wait()
+        page_id = "1" if space_key == "ONE" else "2"
+        yield {
+            "id": page_id,
+            "title": f"Page {page_id}",
+            "body": {"storage": {"value": "<p>Body</p>"}},
+            "version": {"number": 1},
+            "ancestors": [],
+        }
+
+    mock_confluence_fetcher.iter_all_space_pages_with_content.side_effect = iter_pages
+    mock_confluence_fetcher.iter_search_all_with_content.side_effect = (
+        lambda cql: iter([])
+    )
+
+    response = await client.call_tool("confluence_read_page", {"page_ids": "1,2"})
+
+    result_data = json.loads(response[0].text)
+    assert [page["space_key"] for page in result_data["pages"]] == ["ONE", "TWO"]
+    assert all(page["success"] for page in result_data["pages"])
+
+
+@pytest.mark.anyio
+async def test_read_page_moves_page_from_one_search(
+    client, mock_confluence_fetcher, tmp_path
+):
+    """Test moved pages are detected and saved from one expanded search."""
+    await client.call_tool("confluence_sync_space", {"space_key": "TEST"})
+
+    moved_page = {
+        "id": "123456",
+        "title": "Test Page Mock Title",
+        "body": {"storage": {"value": "<p>Moved</p>"}},
+        "version": {"number": 2},
+        "ancestors": [{"id": "222222"}],
+        "_links": {"webui": "/spaces/TEST/pages/123456/Test+Page"},
+    }
+    searches = []
+
+    def search(cql):
+        searches.append(cql)
+        return iter([moved_page] if "id in" in cql else [])
+
+    mock_confluence_fetcher.iter_search_all_with_content.side_effect = search
+
+    response = await client.call_tool("confluence_read_page", {"page_ids": "123456"})
+
+    result_data = json.loads(response[0].text)
+    assert result_data["breadcrumb"] == []
+    assert result_data["version"] == 2
+    assert "222222" in result_data["local_path"]
+    old_folder = tmp_path / ".better-confluence-mcp" / "TEST" / "111111" / "123456"
+    assert not old_folder.exists()
+    assert searches[-1] == "type=page AND id in (123456)"
+    mock_confluence_fetcher.get_page_content.assert_not_called()
+    mock_confluence_fetcher.get_page_ancestors.assert_not_called()
+
+
 @pytest.mark.anyio
 async def test_read_page_not_found(client, mock_confluence_fetcher):
     """Test read_page when page doesn't exist."""
@@ -232,6 +587,74 @@ async def test_read_page_not_found(client, mock_confluence_fetcher):
     assert "not found" in result_data["error"].lower()
 
 
+@pytest.mark.anyio
+async def test_create_page_creates_titles_concurrently(
+    client, mock_confluence_fetcher, tmp_path
+):
+    """Test bulk creation sends the pages at once and keeps the title order."""
+    import threading
+
+    from src.mcp_atlassian.local_storage import load_space_metadata
+
+    mock_confluence_fetcher.get_page_ancestors.return_value = []
+    # Each creation waits until all three are in flight
+    all_creating = threading.Barrier(3, timeout=5)
+
+    def create(**kwargs):
+        all_creating.wait()
+        page = MagicMock(spec=ConfluencePage)
+        page.id = f"id-{kwargs['title']}"
+        page.title = kwargs["title"]
+        page.url = f"https://example.atlassian.net/wiki/{kwargs['title']}"
+        page.version = None
+        return page
+
+    mock_confluence_fetcher.create_page.side_effect = create
+
+    response = await client.call_tool(
+        "confluence_create_page", {"titles": "A,B,C", "parent_id": "123456"}
+    )
+
+    result_data = json.loads(response[0].text)
+    assert [page["title"] for page in result_data["pages"]] == ["A", "B", "C"]
+    assert all(page["success"] for page in result_data["pages"])
+    metadata = load_space_metadata("TEST")
+    assert list(metadata.page_index) == ["id-A", "id-B", "id-C"]
+    assert metadata.page_index["id-A"]["ancestors"] == ["123456"]
+    assert len({info["last_synced"] for info in metadata.page_index.values()}) == 1
+
+
+@pytest.mark.anyio
+async def test_create_page_next_to_sibling_fetches_ancestors_once(
+    client, mock_confluence_fetcher, tmp_path
+):
+    """Test the sibling's ancestors are reused as the new page's ancestors."""
+    from src.mcp_atlassian.local_storage import load_space_metadata
+
+    root, parent = MagicMock(), MagicMock()
+    root.id, parent.id = "100", "111111"
+    mock_confluence_fetcher.get_page_ancestors.return_value = [root, parent]
+    new_page = MagicMock(spec=ConfluencePage)
+    new_page.id = "777"
+    new_page.title = "New Page"
+    new_page.url = "https://example.atlassian.net/wiki/777"
+    new_page.version = None
+    mock_confluence_fetcher.create_page.return_value = new_page
+
+    response = await client.call_tool(
+        "confluence_create_page", {"titles": "New Page", "sibling_id": "123456"}
+    )
+
+    result_data = json.loads(response[0].text)
+    assert result_data["success"] is True
+    assert result_data["parent_id"] == "111111"
+    mock_confluence_fetcher.get_page_ancestors.assert_called_once_with("123456")
+    assert load_space_metadata("TEST").page_index["777"]["ancestors"] == [
+        "100",
+        "111111",
+    ]
+
+
 @pytest.mark.anyio
 async def test_push_page_update(client, mock_confluence_fetcher, tmp_path):
     """Test push_page_update after syncing a page."""
@@ -252,6 +675,116 @@ async def test_push_page_update(client, mock_confluence_fetcher, tmp_path):
     assert result_data["revision_message"] == "Test update"
 
 
+@pytest.mark.anyio
+async def test_push_page_update_saves_space_metadata_once(
+    client, mock_confluence_fetcher, tmp_path, monkeypatch
+):
+    """Test a bulk push saves each space's metadata once, not once per page."""
+    from src.mcp_atlassian.servers.confluence import pages
+
+    mock_confluence_fetcher.iter_all_space_pages_with_content.side_effect = (
+        lambda space_key: iter(
+            {
+                "id": page_id,
+                "title": f"Page {page_id}",
+                "body": {"storage": {"value": "<p>Body</p>"}},
+                "version": {"number": 1},
+                "ancestors": [],
+            }
+            for page_id in ("1", "2")
+        )
+    )
+    await client.call_tool("confluence_sync_space", {"space_key": "TEST"})
+
+    saves = []
+    save_space_metadata = pages.save_space_metadata
+
+    def counting_save(metadata):
+        saves.append(sorted(metadata.changed_pages))
+        save_space_metadata(metadata)
+
+    monkeypatch.setattr(
+        "src.mcp_atlassian.servers.confluence.pages.save_space_metadata",
+        counting_save,
+    )
+
+    response = await client.call_tool(
+        "confluence_push_page_update",
+        {"page_ids": "1,2", "revision_message": "Bulk update"},
+    )
+
+    result_data = json.loads(response[0].text)
+    assert result_data["success_count"] == 2
+    assert saves == [["1", "2"]]
+
+
+@pytest.mark.anyio
+async def test_push_page_update_renames_from_title_header(
+    client, mock_confluence_fetcher, tmp_path
+):
+    """Test the Title line of the local file header renames the page."""
+    response = await client.call_tool("confluence_read_page", {"page_ids": "123456"})
+    local_path = tmp_path / json.loads(response[0].text)["local_path"]
+    local_path.write_text(
+        local_path.read_text(encoding="utf-8").replace(
+            "Title: Test Page Mock Title", "Title: Renamed Page"
+        ),
+        encoding="utf-8",
+    )
+
+    await client.call_tool(
+        "confluence_push_page_update",
+        {"page_ids": "123456", "revision_message": "Rename"},
+    )
+
+    update_kwargs = mock_confluence_fetcher.update_page.call_args.kwargs
+    assert update_kwargs["title"] == "Renamed Page"
+    assert not update_kwargs["body"].startswith("<!--")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_push_page_update_resyncs_moved_page_in_background(
+    client, mock_confluence_fetcher, tmp_path, monkeypatch
+):
+    """Test the space re-sync after a move doesn't hold up the response."""
+    from src.mcp_atlassian.servers.confluence import pages
+
+    await client.call_tool("confluence_read_page", {"page_ids": "123456"})
+
+    release = anyio.Event()
+    synced = []
+
+    async def slow_sync(confluence_fetcher, space_key, full_sync):
+        await release.wait()
+        synced.append((space_key, full_sync))
+        return ""
+
+    monkeypatch.setattr(
+        "src.mcp_atlassian.servers.confluence.pages.sync_space_impl", slow_sync
+    )
+
+    response = await client.call_tool(
+        "confluence_push_page_update",
+        {
+            "page_ids": "123456",
+            "revision_message": "Move",
+            "move_to_parent_id": "222222",
+        },
+    )
+
+    assert json.loads(response[0].text)["success_count"] == 1
+    mock_confluence_fetcher.move_page.assert_called_once()
+    assert synced == []
+    background = list(pages._background_syncs)
+    assert len(background) == 1
+
+    release.set()
+    await background[0]
+    assert synced == [("TEST", False)]
+    assert not pages._background_syncs
+
+
 @pytest.mark.anyio
 async def test_push_page_update_not_synced(client):
     """Test push_page_update when page is not in local storage."""
@@ -265,27 +798,39 @@ async def test_push_page_update_not_synced(client):
     assert "not found in local storage" in result_data["pages"][0]["error"]
 
 
+@pytest.mark.anyio
+async def test_push_page_update_sends_local_version_without_lookups(
+    client, mock_confluence_fetcher, tmp_path
+):
+    """Test pushes leave the version check to Confluence, with no extra requests."""
+    await client.call_tool("confluence_read_page", {"page_ids": "123456"})
+    mock_confluence_fetcher.iter_search_all_with_content.reset_mock()
+
+    response = await client.call_tool(
+        "confluence_push_page_update",
+        {"page_ids": "123456", "revision_message": "My update"},
+    )
+
+    result_data = json.loads(response[0].text)
+    assert result_data["pages"][0]["success"] is True
+    assert mock_confluence_fetcher.update_page.call_args.kwargs["base_version"] == 1
+    mock_confluence_fetcher.iter_search_all_with_content.assert_not_called()
+    mock_confluence_fetcher.get_page_content.assert_not_called()
+
+
 @pytest.mark.anyio
 async def test_push_page_update_version_mismatch(client, mock_confluence_fetcher, tmp_path):
     """Test push_page_update when version has changed in Confluence."""
+    from mcp_atlassian.exceptions import ConfluenceVersionConflictError
+
     # First sync the page (version 1)
     await client.call_tool("confluence_read_page", {"page_ids": "123456"})
 
-    # Simulate Confluence having a newer version (version 2)
-    mock_version_v2 = MagicMock(spec=ConfluenceVersion)
-    mock_version_v2.number = 2
-
-    mock_page_v2 = MagicMock(spec=ConfluencePage)
-    mock_page_v2.id = "123456"
-    mock_page_v2.title = "Test Page Mock Title - Updated"
-    mock_page_v2.url = "https://example.atlassian.net/wiki/spaces/TEST/pages/123456/Test+Page"
-    mock_page_v2.content = "<p>Updated content by someone else</p>"
-    mock_page_v2.space = mock_confluence_fetcher.get_page_content.return_value.space
-    mock_page_v2.version = mock_version_v2
-
-    mock_confluence_fetcher.get_page_content.return_value = mock_page_v2
+    # Confluence has a newer version and rejects the update
+    mock_confluence_fetcher.update_page.side_effect = ConfluenceVersionConflictError(
+        "Page 123456 has changed since version 1"
+    )
 
-    # Try to update - should fail due to version mismatch
     response = await client.call_tool(
         "confluence_push_page_update",
         {"page_ids": "123456", "revision_message": "My update"},
@@ -315,6 +860,66 @@ async def test_sync_space_incremental(client, mock_confluence_fetcher, tmp_path)
     # Should use incremental CQL query (contains lastModified)
 
 
+@pytest.mark.anyio
+async def test_sync_space_incremental_uses_expanded_search(
+    client, mock_confluence_fetcher, tmp_path
+):
+    """Test incremental sync reads content and ancestors from one search."""
+    from src.mcp_atlassian import local_storage
+
+    await client.call_tool("confluence_sync_space", {"space_key": "TEST"})
+
+    response = await client.call_tool(
+        "confluence_sync_space", {"space_key": "TEST", "full_sync": False}
+    )
+
+    result_data = json.loads(response[0].text)
+    assert result_data["sync_type"] == "incremental"
+    assert result_data["pages_synced"] == 1
+    cql = mock_confluence_fetcher.iter_search_all_with_content.call_args.args[0]
+    assert "lastModified" in cql
+    mock_confluence_fetcher.get_page_content.assert_not_called()
+    mock_confluence_fetcher.get_page_ancestors.assert_not_called()
+    page_info = local_storage.load_space_metadata("TEST").page_index["123456"]
+    assert page_info["ancestors"] == ["111111"]
+
+
+@pytest.mark.anyio
+async def test_sync_space_skips_unchanged_pages(
+    client, mock_confluence_fetcher, tmp_path, monkeypatch
+):
+    """Test pages with the saved version and an untouched file are not rewritten."""
+    from src.mcp_atlassian.servers.confluence import sync
+
+    first = json.loads(
+        (await client.call_tool("confluence_sync_space", {"space_key": "TEST"}))[0].text
+    )
+    saved = []
+    save_page_html_async = sync.save_page_html_async
+
+    async def record_save(**kwargs):
+        saved.append(kwargs["page_id"])
+        return await save_page_html_async(**kwargs)
+
+    monkeypatch.setattr(sync, "save_page_html_async", record_save)
+
+    response = await client.call_tool(
+        "confluence_sync_space", {"space_key": "TEST", "full_sync": True}
+    )
+    result_data = json.loads(response[0].text)
+    assert result_data["pages_synced"] == 1
+    assert result_data["pages_unchanged"] == 1
+    assert result_data["synced_pages"] == first["synced_pages"]
+    assert saved == []
+
+    # A locally edited file is restored even though the version is the same
+    (tmp_path / first["synced_pages"][0]["path"]).write_text("edited")
+    await client.call_tool(
+        "confluence_sync_space", {"space_key": "TEST", "full_sync": True}
+    )
+    assert saved == ["123456"]
+
+
 @pytest.mark.anyio
 async def test_sync_space_auto_full_sync(client, mock_confluence_fetcher, tmp_path):
     """Test that auto full sync triggers after 3 days."""
@@ -341,3 +946,45 @@ async def test_sync_space_auto_full_sync(client, mock_confluence_fetcher, tmp_pa
     assert result_data["success"] is True
     assert result_data["sync_type"] == "auto_full"
     assert "auto_full_sync_reason" in result_data
+
+
+def test_get_space_lock_is_shared_and_released():
+    """Test callers share a space lock and idle locks are dropped."""
+    from src.mcp_atlassian.servers.confluence import _server
+
+    lock = _server.get_space_lock("LOCKTEST")
+    assert _server.get_space_lock("LOCKTEST") is lock
+    assert _server.get_space_lock("OTHER") is not lock
+
+    del lock
+    assert "LOCKTEST" not in _server._space_locks
+
+
+@pytest.mark.anyio
+async def test_space_lock_readers_share_and_writers_go_first():
+    """Test readers share a space lock and a queued writer runs before new readers."""
+    import anyio
+
+    from src.mcp_atlassian.servers.confluence._server import SpaceLock
+
+    lock = SpaceLock()
+    events = []
+
+    async def writer():
+        async with lock.write():
+            events.append("write")
+
+    async def reader():
+        async with lock.read():
+            events.append("second read")
+
+    async with anyio.create_task_group() as task_group:
+        async with lock.read():
+            task_group.start_soon(writer)
+            await anyio.wait_all_tasks_blocked()
+            task_group.start_soon(reader)
+            await anyio.wait_all_tasks_blocked()
+            events.append("first read")
+
+    assert events == ["first read", "write", "second read"]
+    assert lock.writes_started == 1
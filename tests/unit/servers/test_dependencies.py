@@ -122,6 +122,26 @@ class TestGetConfluenceFetcher:
         called_config = mock_confluence_fetcher_class.call_args[1]["config"]
         assert called_config.auth_type == auth_type
 
+    @patch("mcp_atlassian.servers.dependencies.ConfluenceFetcher")
+    async def test_fetcher_reused_across_calls(
+        self,
+        mock_confluence_fetcher_class,
+        mock_context,
+        config_factory,
+    ):
+        """Test that calls with the same config share one fetcher."""
+        app_context = config_factory.create_app_context()
+        _setup_mock_context(mock_context, app_context)
+        mock_confluence_fetcher_class.side_effect = lambda config: MagicMock(
+            spec=ConfluenceFetcher
+        )
+
+        first = await get_confluence_fetcher(mock_context)
+        second = await get_confluence_fetcher(mock_context)
+
+        assert first is second
+        mock_confluence_fetcher_class.assert_called_once()
+
     async def test_missing_global_config_raises_error(
         self,
         mock_context,
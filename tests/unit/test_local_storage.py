@@ -0,0 +1,449 @@
+"""Tests for the local storage module."""
+
+import sys
+from contextlib import closing
+
+import pytest
+
+from mcp_atlassian import local_storage, metadata_cache
+from mcp_atlassian.local_storage import (
+    PageNode,
+    SpaceMetadata,
+    check_and_cleanup_moved_page,
+    fix_html_spacing,
+    get_all_synced_spaces,
+    get_legacy_metadata_path,
+    get_page_index_path,
+    get_page_info,
+    get_pages_info,
+    load_space_metadata,
+    merge_into_metadata,
+    page_content_hash,
+    page_file_state,
+    remove_pages_from_metadata,
+    sanitize_filename,
+    save_page_html,
+    save_space_metadata,
+)
+from mcp_atlassian.utils import fast_json
+
+
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        (
+            "Click on<strong>Button</strong>now",
+            "Click on <strong>Button</strong> now",
+        ),
+        ("<a href='x'>link</a>- text", "<a href='x'>link</a> - text"),
+        ("item -<em>note</em>", "item - <em>note</em>"),
+        ("Already <b>spaced</b> text", "Already <b>spaced</b> text"),
+        ("x<blockquote>y</blockquote>", "x<blockquote>y</blockquote>"),
+    ],
+)
+def test_fix_html_spacing(html, expected):
+    """Test spaces are added around inline tags only where missing."""
+    assert fix_html_spacing(html) == expected
+
+
+def test_fix_html_spacing_adjacent_fixes():
+    """Test fixes that share a character are all applied in one pass."""
+    assert fix_html_spacing("<b>x</b>-<i>y</i>z") == "<b>x</b> - <i>y</i> z"
+
+
+@pytest.mark.parametrize(
+    "title,expected",
+    [
+        ("Design: Q1/Q2 plan", "Design- Q1-Q2 plan"),
+        ('What "is" <this>?', "What is this"),
+        ("Tabs\tand\nnewlines", "Tabs and newlines"),
+        ("Café résumé", "Cafe resume"),
+        ("***", "untitled"),
+    ],
+)
+def test_sanitize_filename(title, expected):
+    """Test unsafe filename characters are replaced or removed."""
+    assert sanitize_filename(title) == expected
+
+
+def _page(page_id, ancestors=(), title=None):
+    return {
+        "page_id": page_id,
+        "title": title or f"Page {page_id}",
+        "version": 1,
+        "url": f"https://example.com/{page_id}",
+        "path": f"{page_id}.html",
+        "ancestors": list(ancestors),
+        "last_synced": "2024-01-01T00:00:00+00:00",
+    }
+
+
+def _parents(metadata: SpaceMetadata) -> dict:
+    """Map every page in the tree to its parent ID (None for roots)."""
+    parents = {}
+    stack = [(None, node) for node in metadata.page_tree.values()]
+    while stack:
+        parent_id, node = stack.pop()
+        parents[node.page_id] = parent_id
+        stack.extend((node.page_id, child) for child in node.children.values())
+    return parents
+
+
+def test_merge_into_metadata_updates_tree_in_place():
+    """Test moved, renamed and new pages are placed as a full rebuild would."""
+    metadata = merge_into_metadata(
+        None,
+        [_page("1"), _page("2", ["1"]), _page("3", ["1", "2"]), _page("4", ["9"])],
+        "TEST",
+        "Test",
+    )
+    assert _parents(metadata) == {"1": None, "2": "1", "3": "2", "4": None}
+
+    merged = merge_into_metadata(
+        metadata,
+        [
+            _page("3", ["1"], title="Renamed"),  # moved up a level
+            _page("9", ["1"]),  # missing parent of page 4 arrives
+        ],
+        "TEST",
+        "Test",
+    )
+
+    assert merged is metadata
+    assert _parents(merged) == {"1": None, "2": "1", "3": "1", "9": "1", "4": "9"}
+    assert merged.page_nodes["3"].title == "Renamed"
+    assert merged.page_index["3"]["ancestors"] == ["1"]
+    assert merged.total_pages == 5
+
+
+def test_merge_into_metadata_rebuilds_when_tree_is_stale():
+    """Test index entries without a tree node are picked up on the next merge."""
+    metadata = merge_into_metadata(None, [_page("1")], "TEST", "Test")
+    page = _page("2", ["1"])
+    metadata.page_index["2"] = {k: v for k, v in page.items() if k != "page_id"}
+
+    merged = merge_into_metadata(metadata, [_page("3", ["1"])], "TEST", "Test")
+
+    assert _parents(merged) == {"1": None, "2": "1", "3": "1"}
+    assert set(merged.page_nodes) == {"1", "2", "3"}
+
+
+def test_remove_pages_from_metadata_promotes_children():
+    """Test children of a removed page move to the root level."""
+    metadata = merge_into_metadata(
+        None,
+        [_page("1"), _page("2", ["1"]), _page("3", ["1", "2"]), _page("4", ["1"])],
+        "TEST",
+        "Test",
+    )
+
+    updated = remove_pages_from_metadata(metadata, ["2", "4", "missing"])
+
+    assert _parents(updated) == {"1": None, "3": None}
+    assert set(updated.page_index) == {"1", "3"}
+    assert updated.total_pages == 2
+
+
+def test_space_metadata_round_trip_indexes_nodes():
+    """Test loaded metadata indexes every tree node by page ID."""
+    metadata = merge_into_metadata(
+        None, [_page("1"), _page("2", ["1"]), _page("3", ["1", "2"])], "TEST", "Test"
+    )
+
+    loaded = SpaceMetadata.from_dict(metadata.to_dict())
+
+    assert set(loaded.page_nodes) == {"1", "2", "3"}
+    assert loaded.page_nodes["3"] is loaded.page_tree["1"].children["2"].children["3"]
+
+
+def test_space_metadata_page_index_rows():
+    """Test page_index is stored as rows and still loads the old dict format."""
+    metadata = merge_into_metadata(
+        None, [_page("1"), _page("2", ["1"])], "TEST", "Test"
+    )
+
+    data = metadata.to_dict()
+    loaded = SpaceMetadata.from_dict(data)
+    legacy = {k: v for k, v in data.items() if not k.startswith("page_index_")}
+    legacy["page_index"] = metadata.page_index
+
+    assert "page_index" not in data
+    ancestors_column = data["page_index_schema"].index("ancestors")
+    assert data["page_index_rows"]["2"][ancestors_column] == ["1"]
+    assert loaded.page_index == metadata.page_index
+    assert SpaceMetadata.from_dict(legacy).page_index == metadata.page_index
+
+
+def test_get_page_info_uses_page_index(tmp_path, monkeypatch):
+    """Test pages are found through the cross-space index after saves."""
+    monkeypatch.chdir(tmp_path)
+    save_space_metadata(merge_into_metadata(None, [_page("1")], "AAA", "A"))
+    save_space_metadata(merge_into_metadata(None, [_page("2")], "BBB", "B"))
+
+    assert get_page_info("2")["space_key"] == "BBB"
+    assert get_page_info("1")["title"] == "Page 1"
+    assert get_page_info("3") is None
+
+    # Page 1 moves to space BBB; the old space is saved without it
+    save_space_metadata(merge_into_metadata(None, [_page("2"), _page("1")], "BBB", "B"))
+    save_space_metadata(merge_into_metadata(None, [_page("5")], "AAA", "A"))
+
+    assert get_page_info("1")["space_key"] == "BBB"
+
+
+def test_get_page_info_scans_spaces_missing_from_index(tmp_path, monkeypatch):
+    """Test spaces saved before the index existed are still searched."""
+    monkeypatch.chdir(tmp_path)
+    save_space_metadata(merge_into_metadata(None, [_page("1")], "OLD", "Old"))
+    get_page_index_path().unlink()
+    save_space_metadata(merge_into_metadata(None, [_page("2")], "NEW", "New"))
+
+    assert get_page_info("1")["space_key"] == "OLD"
+
+
+def test_get_pages_info_loads_each_space_once(tmp_path, monkeypatch):
+    """Test a bulk lookup loads the metadata of each space a single time."""
+    monkeypatch.chdir(tmp_path)
+    save_space_metadata(merge_into_metadata(None, [_page("1"), _page("2")], "AAA", "A"))
+    save_space_metadata(merge_into_metadata(None, [_page("3")], "BBB", "B"))
+    loads = []
+    load = local_storage.load_space_metadata
+
+    def counting_load(space_key):
+        loads.append(space_key)
+        return load(space_key)
+
+    monkeypatch.setattr(local_storage, "load_space_metadata", counting_load)
+
+    found = get_pages_info(["1", "2", "3", "4"])
+
+    assert {page_id: info["space_key"] for page_id, info in found.items()} == {
+        "1": "AAA",
+        "2": "AAA",
+        "3": "BBB",
+    }
+    assert sorted(loads) == ["AAA", "BBB"]
+
+
+def test_save_space_metadata_keeps_old_data_on_failed_write(tmp_path, monkeypatch):
+    """Test a failed save leaves the previous metadata intact."""
+    monkeypatch.chdir(tmp_path)
+    save_space_metadata(merge_into_metadata(None, [_page("1")], "AAA", "A"))
+
+    def failing_row(page_id, info):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(metadata_cache, "_page_row", failing_row)
+    with pytest.raises(OSError):
+        save_space_metadata(merge_into_metadata(None, [_page("2")], "AAA", "A"))
+
+    assert set(load_space_metadata("AAA").page_index) == {"1"}
+
+
+def test_save_space_metadata_writes_only_changed_pages(tmp_path, monkeypatch):
+    """Test saving loaded metadata upserts and deletes just the changed rows."""
+    monkeypatch.chdir(tmp_path)
+    pages = [_page("1"), _page("2", ["1"]), _page("3")]
+    save_space_metadata(merge_into_metadata(None, pages, "AAA", "A"))
+
+    metadata = load_space_metadata("AAA")
+    assert metadata.changed_pages == set()
+    metadata = merge_into_metadata(metadata, [_page("4", ["1"])], "AAA", "A")
+    metadata = remove_pages_from_metadata(metadata, ["3"])
+    assert metadata.changed_pages == {"3", "4"}
+
+    written = []
+    page_row = metadata_cache._page_row
+    monkeypatch.setattr(
+        metadata_cache,
+        "_page_row",
+        lambda page_id, info: written.append(page_id) or page_row(page_id, info),
+    )
+    save_space_metadata(metadata)
+
+    assert written == ["4"]
+    loaded = load_space_metadata("AAA")
+    assert set(loaded.page_index) == {"1", "2", "4"}
+    assert set(loaded.page_tree["1"].children) == {"2", "4"}
+    assert loaded.page_index["4"]["ancestors"] == ["1"]
+
+
+def test_load_space_metadata_migrates_legacy_json(tmp_path, monkeypatch):
+    """Test metadata from _metadata.json is read and moved into the database."""
+    monkeypatch.chdir(tmp_path)
+    metadata = merge_into_metadata(None, [_page("1")], "OLD", "Old")
+    legacy_path = get_legacy_metadata_path("OLD")
+    legacy_path.parent.mkdir(parents=True)
+    legacy_path.write_bytes(fast_json.dumps_indented(metadata.to_dict()))
+
+    loaded = load_space_metadata("OLD")
+    assert set(loaded.page_index) == {"1"}
+    assert get_all_synced_spaces() == ["OLD"]
+
+    save_space_metadata(loaded)
+    assert not legacy_path.exists()
+    assert set(load_space_metadata("OLD").page_index) == {"1"}
+
+
+def test_metadata_cache_dropped_on_version_mismatch(tmp_path, monkeypatch):
+    """Test a database written with another cache version is discarded."""
+    monkeypatch.chdir(tmp_path)
+    save_space_metadata(merge_into_metadata(None, [_page("1")], "AAA", "A"))
+    monkeypatch.setattr(metadata_cache, "CACHE_VERSION", 2)
+
+    assert load_space_metadata("AAA") is None
+
+
+def test_load_space_metadata_reuses_unchanged_database(tmp_path, monkeypatch):
+    """Test an unchanged database is read once, and each load is a copy."""
+    monkeypatch.chdir(tmp_path)
+    save_space_metadata(merge_into_metadata(None, [_page("1")], "AAA", "A"))
+    first = load_space_metadata("AAA")
+    first.page_index["1"]["ancestors"].append("changed")
+
+    connects = []
+    connect = metadata_cache._connect
+    monkeypatch.setattr(
+        metadata_cache, "_connect", lambda path: connects.append(path) or connect(path)
+    )
+
+    assert load_space_metadata("AAA").page_index["1"]["ancestors"] == []
+    assert connects == []
+
+    # Saving invalidates the cached copy
+    save_space_metadata(merge_into_metadata(first, [_page("2")], "AAA", "A"))
+    assert set(load_space_metadata("AAA").page_index) == {"1", "2"}
+    assert len(connects) == 2
+
+
+def test_metadata_cache_syncs_at_checkpoints_only(tmp_path):
+    """Test space databases don't fsync on every commit."""
+    with closing(metadata_cache._connect(tmp_path / "_metadata.db")) as conn:
+        # 1 is NORMAL; the default, FULL, syncs the WAL on every commit
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+def test_space_metadata_round_trip_deep_tree():
+    """Test trees deeper than the recursion limit serialize and load."""
+    depth = sys.getrecursionlimit() + 100
+    pages = [_page(str(i), [str(j) for j in range(i)]) for i in range(depth)]
+    metadata = merge_into_metadata(None, pages, "TEST", "Test")
+
+    loaded = SpaceMetadata.from_dict(metadata.to_dict())
+    root = PageNode.from_dict(metadata.page_tree["0"].to_dict())
+
+    assert len(loaded.page_nodes) == depth
+    assert _parents(loaded) == _parents(metadata)
+    node = root
+    while node.children:
+        (node,) = node.children.values()
+    assert node.page_id == str(depth - 1)
+
+
+def test_check_and_cleanup_moved_page_unchanged_skips_filesystem(monkeypatch):
+    """Test pages with unchanged ancestors are not looked up on disk."""
+    metadata = merge_into_metadata(None, [_page("1"), _page("2", ["1"])], "S", "S")
+
+    def no_disk(*args):
+        raise AssertionError("filesystem accessed")
+
+    monkeypatch.setattr(local_storage, "delete_page_folder", no_disk)
+
+    assert not check_and_cleanup_moved_page("S", "2", ["1"], metadata)
+    assert not check_and_cleanup_moved_page("S", "3", [], metadata)
+    assert not check_and_cleanup_moved_page("S", "2", ["1"], None)
+
+
+def test_check_and_cleanup_moved_page_removes_old_folder(tmp_path, monkeypatch):
+    """Test a moved page's folder under its old parent is deleted."""
+    monkeypatch.chdir(tmp_path)
+    save_page_html("S", "2", "Child", "<p>x</p>", 1, "u", ["1"])
+    metadata = merge_into_metadata(None, [_page("1"), _page("2", ["1"])], "S", "S")
+
+    assert check_and_cleanup_moved_page("S", "2", [], metadata)
+    assert not (tmp_path / ".better-confluence-mcp" / "S" / "1" / "2").exists()
+
+
+def test_save_page_html_skips_unchanged_page(tmp_path, monkeypatch):
+    """Test a page whose content hash is unchanged is not rewritten."""
+    monkeypatch.chdir(tmp_path)
+    page = {
+        "space_key": "TEST",
+        "page_id": "1",
+        "title": "Page",
+        "html_content": "<p>Hello</p>",
+        "version": 1,
+        "url": "https://example.com/1",
+        "ancestors": [],
+    }
+    page_hash = page_content_hash("Page", 1, "https://example.com/1", "<p>Hello</p>")
+    path = save_page_html(**page)
+    local_file = tmp_path / path
+    saved = local_file.read_text(encoding="utf-8")
+    file_state = page_file_state(local_file)
+
+    assert (
+        save_page_html(**page, prev_hash=page_hash, prev_file_state=file_state) == path
+    )
+    assert local_file.read_text(encoding="utf-8") == saved
+    assert page_file_state(local_file) == file_state
+
+    save_page_html(
+        **{**page, "version": 2}, prev_hash=page_hash, prev_file_state=file_state
+    )
+    assert "Version: 2" in local_file.read_text(encoding="utf-8")
+
+
+def test_save_page_html_restores_locally_edited_page(tmp_path, monkeypatch):
+    """Test an unchanged page is rewritten if its file was edited since the save."""
+    monkeypatch.chdir(tmp_path)
+    page = {
+        "space_key": "TEST",
+        "page_id": "1",
+        "title": "Page",
+        "html_content": "<p>Hello</p>",
+        "version": 1,
+        "url": "https://example.com/1",
+        "ancestors": [],
+    }
+    page_hash = page_content_hash("Page", 1, "https://example.com/1", "<p>Hello</p>")
+    local_file = tmp_path / save_page_html(**page)
+    file_state = page_file_state(local_file)
+    local_file.write_text("LOCAL EDIT", encoding="utf-8")
+
+    save_page_html(**page, prev_hash=page_hash, prev_file_state=file_state)
+
+    assert "<p>Hello</p>" in local_file.read_text(encoding="utf-8")
+
+
+def test_get_all_synced_spaces(tmp_path, monkeypatch):
+    """Test only directories with space metadata are reported, sorted."""
+    monkeypatch.chdir(tmp_path)
+    assert get_all_synced_spaces() == []
+
+    save_space_metadata(merge_into_metadata(None, [_page("2")], "BBB", "B"))
+    save_space_metadata(merge_into_metadata(None, [_page("1")], "AAA", "A"))
+    (get_page_index_path().parent / "EMPTY").mkdir()
+
+    assert get_all_synced_spaces() == ["AAA", "BBB"]
+
+
+def test_save_page_html_replaces_file_after_rename(tmp_path, monkeypatch):
+    """Test the old HTML file is removed when a page's title changes."""
+    monkeypatch.chdir(tmp_path)
+    page = {
+        "space_key": "TEST",
+        "page_id": "1",
+        "title": "Old title",
+        "html_content": "<p>Hello</p>",
+        "version": 1,
+        "url": "https://example.com/1",
+        "ancestors": [],
+    }
+    old_path = save_page_html(**page)
+    new_path = save_page_html(**{**page, "title": "New title"})
+
+    assert not (tmp_path / old_path).exists()
+    assert (tmp_path / new_path).exists()
+    page_folder = (tmp_path / new_path).parent
+    assert [p.name for p in page_folder.iterdir()] == ["New title.html"]
@@ -78,8 +78,10 @@ class TestMainTransportSelection:
         """Test that signal handlers are set up regardless of transport."""
         with patch("mcp_atlassian.servers.main.AtlassianMCP", return_value=mock_server):
             with patch("asyncio.run"):
-                # Patch where it's imported in the main module
-                with patch("mcp_atlassian.setup_signal_handlers") as mock_setup:
+                # main() imports lifecycle lazily, so patch the source module
+                with patch(
+                    "mcp_atlassian.utils.lifecycle.setup_signal_handlers"
+                ) as mock_setup:
                     with patch.dict("os.environ", {"TRANSPORT": "stdio"}):
                         with patch("sys.argv", ["mcp-atlassian"]):
                             try:
@@ -1,8 +1,10 @@
 "Tests for the date utility functions."
 
+from datetime import datetime, timezone
+
 import pytest
 
-from mcp_atlassian.utils import parse_date
+from mcp_atlassian.utils import parse_date, parse_iso_datetime
 
 
 def test_parse_date_invalid_input():
@@ -37,3 +39,20 @@ def test_parse_date_rfc3339():
         str(parse_date("1937-01-01T12:00:27.87+00:20"))
         == "1937-01-01 12:00:27.870000+00:20"
     )
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    ["2024-01-01T10:00:00Z", "2024-01-01T10:00:00+00:00"],
+)
+def test_parse_iso_datetime_accepts_z_and_offset(timestamp):
+    """Test that parse_iso_datetime reads "Z" and "+00:00" as UTC."""
+    assert parse_iso_datetime(timestamp) == datetime(
+        2024, 1, 1, 10, tzinfo=timezone.utc
+    )
+
+
+def test_parse_iso_datetime_invalid_input():
+    """Test that parse_iso_datetime raises ValueError for invalid timestamps."""
+    with pytest.raises(ValueError):
+        parse_iso_datetime("invalid")
@@ -0,0 +1,74 @@
+"""Tests for the optional orjson response decoding."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_atlassian.utils import fast_json
+from mcp_atlassian.utils.fast_json import install_fast_json_decoding
+
+pytestmark = pytest.mark.skipif(
+    not fast_json.is_orjson_available(), reason="orjson not installed"
+)
+
+
+def _make_response(content: bytes) -> MagicMock:
+    response = MagicMock()
+    response.content = content
+    response.json.return_value = "stdlib"
+    return response
+
+
+def test_orjson_decoder_parses_content():
+    """Test that the hook decodes the body with orjson."""
+    response = fast_json._use_orjson_decoder(_make_response(b'{"id": "1"}'))
+
+    assert response.json() == {"id": "1"}
+
+
+def test_orjson_decoder_falls_back_on_kwargs_and_invalid_body():
+    """Test that the stdlib decoder is used when orjson cannot help."""
+    response = fast_json._use_orjson_decoder(_make_response(b'{"id": "1"}'))
+    assert response.json(parse_float=str) == "stdlib"
+
+    response = fast_json._use_orjson_decoder(_make_response(b"\xff not json"))
+    assert response.json() == "stdlib"
+
+
+def test_install_fast_json_decoding_no_duplicates():
+    """Test that installing twice registers the hook once."""
+    session = MagicMock()
+    session.hooks = {}
+
+    install_fast_json_decoding(session)
+    install_fast_json_decoding(session)
+
+    assert session.hooks["response"].count(fast_json._use_orjson_decoder) == 1
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_indented_round_trip(monkeypatch, use_orjson):
+    """Test indented output matches the stdlib layout with either backend."""
+    if not use_orjson:
+        monkeypatch.setattr(fast_json, "orjson", None)
+    data = {"title": "Café", "pages": [{"id": "1"}]}
+
+    encoded = fast_json.dumps_indented(data)
+
+    assert encoded == json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    assert fast_json.loads(encoded) == data
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_text_is_compact_unless_pretty(monkeypatch, use_orjson):
+    """Test tool result text is compact, or indented with CONFLUENCE_PRETTY_JSON."""
+    if not use_orjson:
+        monkeypatch.setattr(fast_json, "orjson", None)
+    data = {"success": True, "errors": ["Página 1 failed"], "total": 1}
+
+    assert fast_json.dumps_text(data) == json.dumps(
+        data, separators=(",", ":"), ensure_ascii=False
+    )
+    monkeypatch.setenv("CONFLUENCE_PRETTY_JSON", "true")
+    assert fast_json.dumps_text(data) == json.dumps(data, indent=2, ensure_ascii=False)
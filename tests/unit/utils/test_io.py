@@ -3,7 +3,7 @@
 import os
 from unittest.mock import patch
 
-from mcp_atlassian.utils.io import is_read_only_mode
+from mcp_atlassian.utils.io import file_signature, is_read_only_mode
 
 
 def test_is_read_only_mode_default():
@@ -81,3 +81,19 @@ def test_is_read_only_mode_false():
 
         # Assert
         assert result is False
+
+
+def test_file_signature_changes_when_file_is_written(tmp_path):
+    """Test that file_signature tracks writes and missing files."""
+    # Arrange
+    path = tmp_path / "data.json"
+    missing = tmp_path / "missing.json"
+    path.write_text("{}")
+    before = file_signature(path, missing)
+
+    # Act
+    path.write_text('{"a": 1}')
+
+    # Assert
+    assert before[1] is None
+    assert file_signature(path, missing) != before